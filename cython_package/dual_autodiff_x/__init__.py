@@ -1,2 +1,9 @@
 from .dual import Dual
+from .dualn import DualN
+from .dual_array import DualArray
+from .kernels import set_num_threads, get_num_threads
+from .variables import VariableSpace, DenseDual
+from .sparse import SparseDual
+from .hyperdual import HyperDual, hessian
+from .taylor import Taylor, taylor_derivatives
 from .tools import *
\ No newline at end of file
@@ -1,16 +1,51 @@
 # cython: language_level=3
 # distutils: language=c++
 
+cimport cython
 import numpy as np
 cimport numpy as np
 from libc.math cimport log, exp, sqrt
 from cpython.dict cimport PyDict_GetItem, PyDict_SetItem, PyDict_Keys
 from cpython.set cimport PySet_Add, PySet_New
-from .tools import get_functions, remove_function
+from .tools cimport Rule, get_implementation
+from .tools import remove_function
 
+cdef inline Dual _new_dual(double real, dict dual):
+    """
+    Creates a Dual from values computed by the library, skipping the validation and the copy
+    of the dual component done by Dual.__init__. `dual` must be a new dict owned by the result.
+    """
+    cdef Dual result = Dual.__new__(Dual)
+    result.real = real
+    result.dual = dual
+    return result
+
+# Shared tuples of variable names used when pickling, one per distinct set of variables, so pickle
+# writes the names once per call however many Dual numbers share them
+cdef dict _key_tuples = {}
+cdef Py_ssize_t _max_key_tuples = 4096
+
+cdef tuple _shared_keys(tuple keys):
+    shared = _key_tuples.get(keys)
+    if shared is None:
+        if len(_key_tuples) >= _max_key_tuples:
+            return keys
+        shared = _key_tuples[keys] = keys
+    return <tuple>shared
+
+def _rebuild_dual(double real, tuple variables, values):
+    return _new_dual(real, dict(zip(variables, values)))
+
+# Keep recently freed Dual objects for reuse, as most of them are short-lived intermediates
+@cython.freelist(256)
 cdef class Dual:
     """
     Dual numbers class to compute derivatives or partial derivatives of functions.
+
+    The in-place operators (+=, -=, *=, /=) update the real part and the dual dict of the left
+    operand itself. Every Dual owns its dual dict (Dual.__init__ copies it), so this never affects
+    other Dual numbers, but other names bound to the same Dual, and references to its `dual` dict,
+    see the update.
     """
     cdef public double real
     cdef public dict dual
@@ -30,6 +65,12 @@ cdef class Dual:
     def __repr__(self):
         return f"Dual(real={self.real}, dual={self.dual})"
 
+    def __reduce__(self):
+        # Variable names as a shared tuple, which pickle memoizes across Dual numbers over the same
+        # variables, and the values as a tuple of floats. Everything is pickled in-band; for bulk
+        # transfer use a DualArray, whose buffers go out-of-band with pickle protocol 5
+        return _rebuild_dual, (self.real, _shared_keys(tuple(self.dual)), tuple(self.dual.values()))
+
     def __add__(self, other):
         cdef dict new_dual
         cdef str var
@@ -39,13 +80,26 @@ cdef class Dual:
             new_dual = self.dual.copy()
             for var, val in other.dual.items():
                 new_dual[var] = new_dual.get(var, 0.0) + val
-            return Dual(self.real + other.real, new_dual)
+            return _new_dual(self.real + other.real, new_dual)
         else:
-            return Dual(self.real + float(other), self.dual.copy())
+            return _new_dual(self.real + float(other), self.dual.copy())
     
     def __radd__(self, other):
         cdef double other_float = float(other)
-        return Dual(other_float + self.real, self.dual.copy())
+        return _new_dual(other_float + self.real, self.dual.copy())
+
+    def __iadd__(self, other):
+        cdef dict own = self.dual
+        cdef str var
+        cdef double val
+
+        if isinstance(other, Dual):
+            for var, val in (<Dual>other).dual.items():
+                own[var] = own.get(var, 0.0) + val
+            self.real += (<Dual>other).real
+        else:
+            self.real += float(other)
+        return self
 
     def __mul__(self, other):
         cdef dict new_dual
@@ -59,16 +113,35 @@ cdef class Dual:
             for var in all_vars:
                 new_dual[var] = (self.real * other.dual.get(var, 0.0) + 
                                 self.dual.get(var, 0.0) * other.real)
-            return Dual(self.real * other.real, new_dual)
+            return _new_dual(self.real * other.real, new_dual)
         else:
             other_float = float(other)
-            return Dual(self.real * other_float, 
-                       {k: v * other_float for k, v in self.dual.items()})
+            return _new_dual(self.real * other_float, 
+                            {k: v * other_float for k, v in self.dual.items()})
     
     def __rmul__(self, other):
         cdef double other_float = float(other)
-        return Dual(other_float * self.real, 
-                   {k: v * other_float for k, v in self.dual.items()})
+        return _new_dual(other_float * self.real, 
+                        {k: v * other_float for k, v in self.dual.items()})
+
+    def __imul__(self, other):
+        cdef dict own = self.dual, other_dual
+        cdef str var
+        cdef double val, a = self.real, b
+
+        if isinstance(other, Dual):
+            b = (<Dual>other).real
+            other_dual = own.copy() if other is self else (<Dual>other).dual
+            for var in own:
+                own[var] = <double>own[var] * b
+            for var, val in other_dual.items():
+                own[var] = own.get(var, 0.0) + a * val
+        else:
+            b = float(other)
+            for var in own:
+                own[var] = <double>own[var] * b
+        self.real = a * b
+        return self
 
     def __sub__(self, other):
         cdef dict new_dual
@@ -79,14 +152,27 @@ cdef class Dual:
             new_dual = self.dual.copy()
             for var, val in other.dual.items():
                 new_dual[var] = new_dual.get(var, 0.0) - val
-            return Dual(self.real - other.real, new_dual)
+            return _new_dual(self.real - other.real, new_dual)
         else:
-            return Dual(self.real - float(other), self.dual.copy())
+            return _new_dual(self.real - float(other), self.dual.copy())
     
+    def __isub__(self, other):
+        cdef dict own = self.dual
+        cdef str var
+        cdef double val
+
+        if isinstance(other, Dual):
+            for var, val in (<Dual>other).dual.items():
+                own[var] = own.get(var, 0.0) - val
+            self.real -= (<Dual>other).real
+        else:
+            self.real -= float(other)
+        return self
+
     def __rsub__(self, other):
         cdef double other_float = float(other)
-        return Dual(other_float - self.real, 
-                   {k: -v for k, v in self.dual.items()})
+        return _new_dual(other_float - self.real, 
+                        {k: -v for k, v in self.dual.items()})
 
     def __truediv__(self, other):
         cdef dict new_dual
@@ -106,48 +192,72 @@ cdef class Dual:
                      self.real * other.dual.get(var, 0.0)) / 
                     (other_real * other_real)
                 )
-            return Dual(self.real / other_real, new_dual)
+            return _new_dual(self.real / other_real, new_dual)
         else:
             other_float = float(other)
             if other_float == 0:
                 raise ZeroDivisionError("Division by zero is not allowed.")
-            return Dual(self.real / other_float, 
-                       {k: v / other_float for k, v in self.dual.items()})
+            return _new_dual(self.real / other_float, 
+                            {k: v / other_float for k, v in self.dual.items()})
         
+    def __itruediv__(self, other):
+        cdef dict own = self.dual, other_dual
+        cdef str var
+        cdef double val, a = self.real, b
+
+        if isinstance(other, Dual):
+            b = (<Dual>other).real
+            if b == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            other_dual = own.copy() if other is self else (<Dual>other).dual
+            for var in own:
+                own[var] = <double>own[var] / b
+            for var, val in other_dual.items():
+                own[var] = own.get(var, 0.0) - a * val / (b * b)
+        else:
+            b = float(other)
+            if b == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            for var in own:
+                own[var] = <double>own[var] / b
+        self.real = a / b
+        return self
+
     def __rtruediv__(self, other):
         cdef double other_float = float(other)
         if self.real == 0:
             raise ZeroDivisionError("Division by zero is not allowed.")
-        return Dual(other_float / self.real,
-                   {k: -other_float * v / (self.real * self.real) 
-                    for k, v in self.dual.items()})
+        return _new_dual(other_float / self.real,
+                        {k: -other_float * v / (self.real * self.real) 
+                         for k, v in self.dual.items()})
 
     def __pow__(self, other):
         cdef dict new_dual
         cdef str var
-        cdef double val, base_term, exp_term, real_part
+        cdef double val, base_scale, exp_scale, real_part, scale
         cdef set all_vars
         
         if isinstance(other, Dual):
             if self.real <= 0:
                 raise ValueError("For Dual number exponents, base must be positive")
             real_part = self.real ** other.real
+            base_scale = other.real * (self.real ** (other.real - 1))
+            exp_scale = real_part * log(self.real)
             new_dual = {}
             all_vars = set(self.dual.keys()) | set(other.dual.keys())
             for var in all_vars:
-                base_term = other.real * (self.real ** (other.real - 1)) * self.dual.get(var, 0.0)
-                exp_term = real_part * log(self.real) * other.dual.get(var, 0.0)
-                new_dual[var] = base_term + exp_term
-            return Dual(real_part, new_dual)
+                new_dual[var] = base_scale * self.dual.get(var, 0.0) + exp_scale * other.dual.get(var, 0.0)
+            return _new_dual(real_part, new_dual)
         else:
             other_float = float(other)
             real_part = self.real ** other_float
-            return Dual(real_part,
-                       {k: other_float * (self.real ** (other_float - 1)) * v 
-                        for k, v in self.dual.items()})
+            if not self.dual: #the scale below is undefined at 0 for other < 1
+                return _new_dual(real_part, {})
+            scale = other_float * (self.real ** (other_float - 1)) #same for every variable
+            return _new_dual(real_part, {k: scale * v for k, v in self.dual.items()})
 
     def __rpow__(self, other):
-        cdef double other_float, real_part
+        cdef double other_float, real_part, scale
         
         if not isinstance(other, (int, float)):
             return NotImplemented
@@ -157,24 +267,39 @@ cdef class Dual:
             
         other_float = float(other)
         real_part = other_float ** self.real
-        return Dual(real_part,
-                   {k: real_part * log(other_float) * v 
-                    for k, v in self.dual.items()})
+        scale = real_part * log(other_float)
+        return _new_dual(real_part, {k: scale * v for k, v in self.dual.items()})
     
     def __neg__(self):
-        return Dual(-self.real, {k: -v for k, v in self.dual.items()})
+        return _new_dual(-self.real, {k: -v for k, v in self.dual.items()})
+
+    def __array_function__(self, func, types, args, kwargs):
+        from .dual_array import DualArray, _array_functions
+        if func not in _array_functions:
+            return NotImplemented
+        packed = [DualArray.from_duals(arg) if isinstance(arg, Dual)
+                  or (isinstance(arg, np.ndarray) and arg.dtype == object) else arg for arg in args]
+        result = func(*packed, **kwargs)
+        if isinstance(result, DualArray) and result.real.ndim == 0:
+            return result[()] #scalar results stay Dual numbers
+        return result
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
-        cdef dict implementations
+        cdef Rule rule
         cdef list args, dual_args
         cdef dict dual_part
         cdef object f, fprime
-        cdef double real_part
+        cdef double real_part, x, derivative
         
+        if method in ("reduce", "accumulate", "outer"):
+            from .dual_array import DualArray
+            packed = [DualArray.from_duals(arg) if isinstance(arg, Dual)
+                      or (isinstance(arg, np.ndarray) and arg.dtype == object) else arg for arg in inputs]
+            return getattr(ufunc, method)(*packed, **kwargs)
         if method != "__call__":
             return NotImplemented
 
-        implementations = get_functions()
+        rule = get_implementation(ufunc)
         args = []
         dual_args = []
         for arg in inputs:
@@ -194,12 +319,17 @@ cdef class Dual:
                 return self._handle_divide(args, dual_args)
             elif ufunc is np.power:
                 return self._handle_power(args, dual_args)
-            elif ufunc.__name__ in implementations:
-                f, fprime = implementations[ufunc.__name__]
+            elif rule is not None and rule.func_kernel != NULL:
+                x = args[0]
+                real_part = rule.func_kernel(x)
+                derivative = rule.derivative_kernel(x)
+                return _new_dual(real_part, {k: v * derivative for k, v in dual_args[0].items()})
+            elif rule is not None:
+                f, fprime = rule.func, rule.derivative
                 real_part = f(args[0])
                 dual_part = {k: v * fprime(args[0]) 
                            for k, v in dual_args[0].items()}
-                return Dual(real_part, dual_part)
+                return _new_dual(real_part, dual_part)
         except Exception as e:
             print(f"Error in {ufunc.__name__}: {str(e)}")
             return NotImplemented
@@ -216,7 +346,7 @@ cdef class Dual:
         for d in dual_args:
             for k, v in d.items():
                 dual_part[k] = dual_part.get(k, 0.0) + v
-        return Dual(real_part, dual_part)
+        return _new_dual(real_part, dual_part)
 
     cdef _handle_multiply(self, list args, list dual_args):
         cdef dict dual_part
@@ -234,7 +364,7 @@ cdef class Dual:
             for k, v in dual_args[1].items():
                 dual_part[k] = dual_part.get(k, 0.0) + v * args[0]
                 
-        return Dual(real_part, dual_part)
+        return _new_dual(real_part, dual_part)
 
     cdef _handle_divide(self, list args, list dual_args):
         cdef dict dual_part
@@ -255,7 +385,7 @@ cdef class Dual:
             for k, v in dual_args[1].items():
                 dual_part[k] = dual_part.get(k, 0.0) - (args[0] * v) / (args[1] * args[1])
                 
-        return Dual(real_part, dual_part)
+        return _new_dual(real_part, dual_part)
 
     cdef _handle_power(self, list args, list dual_args):
         cdef dict dual_part
@@ -273,4 +403,4 @@ cdef class Dual:
             for k, v in dual_args[1].items():
                 dual_part[k] = dual_part.get(k, 0.0) + real_part * log(args[0]) * v
                 
-        return Dual(real_part, dual_part)
\ No newline at end of file
+        return _new_dual(real_part, dual_part)
\ No newline at end of file
@@ -0,0 +1,504 @@
+# cython: language_level=3
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+from string import ascii_letters
+from .dual import Dual
+from .tools cimport Rule, get_implementation
+from .kernels cimport scale, combine, apply_rule
+
+cdef void _product_weights(const double[:, ::1] x, double[:, ::1] out):
+    """
+    Product of all the other entries of each row, from exclusive prefix and suffix products.
+    """
+    cdef Py_ssize_t r, i, n = x.shape[1]
+    cdef double running
+    for r in range(x.shape[0]):
+        running = 1.0
+        for i in range(n):
+            out[r, i] = running
+            running *= x[r, i]
+        running = 1.0
+        for i in range(n - 1, -1, -1):
+            out[r, i] *= running
+            running *= x[r, i]
+
+cdef void _weighted_sum(const double[:, ::1] weights, const double[:, :, ::1] dual, double[:, ::1] out):
+    cdef Py_ssize_t r, i, j
+    for r in range(dual.shape[0]):
+        for j in range(dual.shape[2]):
+            out[r, j] = 0.0
+        for i in range(dual.shape[1]):
+            for j in range(dual.shape[2]):
+                out[r, j] += weights[r, i] * dual[r, i, j]
+
+cdef void _running_product(const double[:, ::1] x, const double[:, :, ::1] dual,
+                           double[:, ::1] real_out, double[:, :, ::1] dual_out):
+    """
+    Cumulative product along each row with the product rule applied step by step.
+    """
+    cdef Py_ssize_t r, i, j
+    cdef double previous
+    for r in range(x.shape[0]):
+        previous = 1.0
+        for i in range(x.shape[1]):
+            real_out[r, i] = previous * x[r, i]
+            for j in range(dual.shape[2]):
+                if i == 0:
+                    dual_out[r, i, j] = dual[r, i, j]
+                else:
+                    dual_out[r, i, j] = dual_out[r, i - 1, j] * x[r, i] + previous * dual[r, i, j]
+            previous = real_out[r, i]
+
+cdef tuple _axes(axis, Py_ssize_t ndim):
+    if axis is None:
+        return tuple(range(ndim))
+    axes = axis if isinstance(axis, tuple) else (axis,)
+    for a in axes:
+        if not -ndim <= a < ndim:
+            raise ValueError(f"Axis {a} is out of bounds for a DualArray with {ndim} dimensions.")
+    return tuple(a % ndim for a in axes)
+
+cdef inline object _flat(object values):
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+cdef inline object _rows(object dual):
+    return np.ascontiguousarray(dual, dtype=np.float64).reshape(-1, dual.shape[dual.ndim - 1])
+
+cdef class DualArray:
+    """
+    Vectorised dual numbers class to compute derivatives at many points in one call.
+    The dual component has one extra trailing axis, one slot per variable in `variables`.
+    """
+    cdef public object real
+    cdef public object dual
+    cdef public tuple variables
+
+    def __init__(self, real_component, dual_component, variables):
+        real = np.asarray(real_component, dtype=np.float64)
+        dual = np.asarray(dual_component, dtype=np.float64)
+        variables = tuple(variables)
+        if dual.shape != real.shape + (len(variables),):
+            raise ValueError(
+                f"Expected 'dual_component' to have shape {real.shape + (len(variables),)}, but got {dual.shape}."
+            )
+        self.real = real
+        self.dual = dual
+        self.variables = variables
+
+    @classmethod
+    def from_inputs(cls, **inputs):
+        cdef Py_ssize_t i
+        variables = tuple(inputs)
+        reals = np.broadcast_arrays(*[np.asarray(v, dtype=np.float64) for v in inputs.values()])
+        seeded = []
+        for i, real in enumerate(reals):
+            dual = np.zeros(real.shape + (len(variables),))
+            dual[..., i] = 1.0
+            seeded.append(cls(real, dual, variables))
+        return tuple(seeded)
+
+    @classmethod
+    def from_duals(cls, duals):
+        cdef Py_ssize_t i
+        items = np.asarray(duals, dtype=object)
+        flat = items.ravel()
+        variables = tuple(dict.fromkeys(var for d in flat for var in d.dual))
+        slots = {var: i for i, var in enumerate(variables)}
+        real = np.array([d.real for d in flat], dtype=np.float64)
+        dual = np.zeros((len(flat), len(variables)))
+        for i, d in enumerate(flat):
+            for var, val in d.dual.items():
+                dual[i, slots[var]] = val
+        return cls(real.reshape(items.shape), dual.reshape(items.shape + (len(variables),)), variables)
+
+    @property
+    def shape(self):
+        return self.real.shape
+
+    def __len__(self):
+        return len(self.real)
+
+    def __getitem__(self, index):
+        real = self.real[index]
+        dual = self.dual[index]
+        if real.ndim == 0:
+            return Dual(float(real), dict(zip(self.variables, dual.tolist())))
+        return DualArray(real, dual, self.variables)
+
+    def __repr__(self):
+        return f"DualArray(real={self.real}, dual={self.dual}, variables={self.variables})"
+
+    def __reduce__(self):
+        # Contiguous components, which pickle protocol 5 can pass out-of-band without copying
+        return DualArray, (np.ascontiguousarray(self.real), np.ascontiguousarray(self.dual), self.variables)
+
+    def reshape(self, *shape):
+        real = self.real.reshape(*shape)
+        return DualArray(real, self.dual.reshape(real.shape + (len(self.variables),)), self.variables)
+
+    def partial(self, str variable):
+        if variable not in self.variables:
+            return np.zeros_like(self.real)
+        return self.dual[..., self.variables.index(variable)]
+
+    cdef object _with_variables(self, tuple variables):
+        if variables == self.variables:
+            return self.dual
+        dual = np.zeros(self.real.shape + (len(variables),))
+        dual[..., [variables.index(var) for var in self.variables]] = self.dual
+        return dual
+
+    cdef tuple _operands(self, other):
+        """
+        Broadcasts both operands to a common shape and aligns their dual components.
+        Returns (variables, shape, self real, self dual, other real, other dual) with the
+        reals flattened and the duals laid out as (points, variables) rows.
+        """
+        cdef tuple variables
+        if isinstance(other, DualArray):
+            variables = self.variables + tuple(v for v in other.variables if v not in self.variables)
+            other_real = other.real
+            other_dual = (<DualArray>other)._with_variables(variables)
+        elif isinstance(other, Dual):
+            variables = self.variables + tuple(v for v in other.dual if v not in self.variables)
+            other_real = np.asarray(other.real, dtype=np.float64)
+            other_dual = np.array([other.dual.get(var, 0.0) for var in variables])
+        else:
+            variables = self.variables
+            other_real = np.asarray(other, dtype=np.float64)
+            other_dual = None
+        shape = np.broadcast_shapes(self.real.shape, other_real.shape)
+        width = (len(variables),)
+        a_real = _flat(np.broadcast_to(self.real, shape))
+        a_dual = _rows(np.broadcast_to(self._with_variables(variables), shape + width))
+        b_real = _flat(np.broadcast_to(other_real, shape))
+        if other_dual is not None:
+            other_dual = _rows(np.broadcast_to(other_dual, shape + width))
+        return variables, shape, a_real, a_dual, b_real, other_dual
+
+    def __add__(self, other):
+        variables, shape, a_real, a_dual, b_real, b_dual = self._operands(other)
+        dual = a_dual if b_dual is None else a_dual + b_dual
+        return DualArray((a_real + b_real).reshape(shape), dual.reshape(shape + (len(variables),)), variables)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        variables, shape, a_real, a_dual, b_real, b_dual = self._operands(other)
+        dual = a_dual if b_dual is None else a_dual - b_dual
+        return DualArray((a_real - b_real).reshape(shape), dual.reshape(shape + (len(variables),)), variables)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        variables, shape, a_real, a_dual, b_real, b_dual = self._operands(other)
+        dual = np.empty_like(a_dual)
+        if b_dual is None:
+            scale(b_real, a_dual, dual)
+        else:
+            combine(b_real, a_dual, a_real, b_dual, dual)
+        return DualArray((a_real * b_real).reshape(shape), dual.reshape(shape + (len(variables),)), variables)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        variables, shape, a_real, a_dual, b_real, b_dual = self._operands(other)
+        if np.any(b_real == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        real = a_real / b_real
+        dual = np.empty_like(a_dual)
+        if b_dual is None:
+            scale(1.0 / b_real, a_dual, dual)
+        else:
+            combine(1.0 / b_real, a_dual, -real / b_real, b_dual, dual)
+        return DualArray(real.reshape(shape), dual.reshape(shape + (len(variables),)), variables)
+
+    def __rtruediv__(self, other):
+        if np.any(self.real == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        real = _flat(self.real)
+        dual = np.empty((real.shape[0], len(self.variables)))
+        scale(-1.0 / (real * real), _rows(self.dual), dual)
+        reciprocal = DualArray((1.0 / real).reshape(self.real.shape), dual.reshape(self.dual.shape),
+                               self.variables)
+        return reciprocal * other
+
+    def __pow__(self, other, modulo=None):
+        variables, shape, a_real, a_dual, b_real, b_dual = self._operands(other)
+        if b_dual is not None and np.any(a_real <= 0):
+            raise ValueError("For Dual number exponents, base must be positive")
+        real = a_real ** b_real
+        dual = np.empty_like(a_dual)
+        if b_dual is None:
+            scale(b_real * a_real ** (b_real - 1), a_dual, dual)
+        else:
+            combine(b_real * a_real ** (b_real - 1), a_dual, real * np.log(a_real), b_dual, dual)
+        return DualArray(real.reshape(shape), dual.reshape(shape + (len(variables),)), variables)
+
+    def __rpow__(self, other, modulo=None):
+        if isinstance(other, Dual):
+            return DualArray(np.asarray(other.real, dtype=np.float64), np.array(list(other.dual.values())),
+                             tuple(other.dual)) ** self
+        other = np.asarray(other, dtype=np.float64)
+        if np.any(other <= 0):
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        shape = np.broadcast_shapes(other.shape, self.real.shape)
+        width = (len(self.variables),)
+        real = _flat(np.broadcast_to(other, shape)) ** _flat(np.broadcast_to(self.real, shape))
+        a_dual = _rows(np.broadcast_to(self.dual, shape + width))
+        dual = np.empty_like(a_dual)
+        scale(real * np.log(_flat(np.broadcast_to(other, shape))), a_dual, dual)
+        return DualArray(real.reshape(shape), dual.reshape(shape + width), self.variables)
+
+    def __neg__(self):
+        return DualArray(-self.real, -self.dual, self.variables)
+
+    cdef DualArray _apply(self, Rule rule):
+        """
+        Applies a tools function and its derivative to every point, in one threaded pass over C
+        kernels when the rule is a built-in one.
+        """
+        real = _flat(self.real)
+        derivative = np.empty_like(real)
+        if rule.native:
+            values = np.empty_like(real)
+            apply_rule(rule, real, values, derivative)
+            values = values.reshape(self.real.shape)
+        else:
+            try:
+                derivative[:] = np.asarray(rule.derivative(real), dtype=np.float64)
+            except TypeError:
+                derivative[:] = np.vectorize(rule.derivative, otypes=[np.float64])(real)
+            values = np.asarray(rule.func(self.real), dtype=np.float64)
+        dual = np.empty((real.shape[0], len(self.variables)))
+        scale(derivative, _rows(self.dual), dual)
+        return DualArray(values, dual.reshape(self.dual.shape), self.variables)
+
+    cdef tuple _along(self, tuple axes):
+        """
+        Moves `axes` to the end and merges them, giving (rows, n) reals and (rows, n, variables) duals.
+        """
+        cdef Py_ssize_t ndim = self.real.ndim
+        kept = tuple(a for a in range(ndim) if a not in axes)
+        shape = tuple(self.real.shape[a] for a in kept)
+        n = int(np.prod([self.real.shape[a] for a in axes]))
+        real = np.ascontiguousarray(np.transpose(self.real, kept + axes)).reshape(-1, n)
+        dual = np.ascontiguousarray(np.transpose(self.dual, kept + axes + (ndim,))).reshape(-1, n, len(self.variables))
+        return shape, real, dual
+
+    cdef DualArray _reduce(self, ufunc, axis=0, keepdims=False):
+        """
+        Implements `ufunc.reduce` for np.add, np.subtract and np.multiply with one pass over the
+        dual component.
+        """
+        cdef tuple axes = _axes(axis, self.real.ndim)
+        if ufunc is np.subtract:
+            if len(axes) != 1:
+                raise ValueError("np.subtract.reduce is only defined along a single axis.")
+            first = np.take(self.real, [0], axis=axes[0]), np.take(self.dual, [0], axis=axes[0])
+            rest = np.delete(self.real, 0, axis=axes[0]), np.delete(self.dual, 0, axis=axes[0])
+            real = first[0].sum(axis=axes, keepdims=keepdims) - rest[0].sum(axis=axes, keepdims=keepdims)
+            dual = first[1].sum(axis=axes, keepdims=keepdims) - rest[1].sum(axis=axes, keepdims=keepdims)
+            return DualArray(real, dual, self.variables)
+        if ufunc is np.add:
+            return DualArray(self.real.sum(axis=axes, keepdims=keepdims),
+                             self.dual.sum(axis=axes, keepdims=keepdims), self.variables)
+
+        shape, real, dual = self._along(axes)
+        weights = np.empty_like(real)
+        _product_weights(real, weights)
+        out = np.empty((real.shape[0], len(self.variables)))
+        _weighted_sum(weights, dual, out)
+        product = np.prod(real, axis=1).reshape(shape)
+        out = out.reshape(shape + (len(self.variables),))
+        if keepdims:
+            product = np.expand_dims(product, axes)
+            out = np.expand_dims(out, axes)
+        return DualArray(product, out, self.variables)
+
+    cdef DualArray _accumulate(self, ufunc, axis=0):
+        """
+        Implements `ufunc.accumulate` for np.add, np.subtract and np.multiply.
+        """
+        (axis,) = _axes(axis, self.real.ndim)
+        if ufunc is np.add:
+            return DualArray(np.cumsum(self.real, axis=axis), np.cumsum(self.dual, axis=axis), self.variables)
+        if ufunc is np.subtract:
+            first = np.take(self.real, [0], axis=axis), np.take(self.dual, [0], axis=axis)
+            return DualArray(2 * first[0] - np.cumsum(self.real, axis=axis),
+                             2 * first[1] - np.cumsum(self.dual, axis=axis), self.variables)
+
+        shape, real, dual = self._along((axis,))
+        real_out = np.empty_like(real)
+        dual_out = np.empty_like(dual)
+        _running_product(real, dual, real_out, dual_out)
+        moved = shape + (real.shape[1],)
+        return DualArray(np.moveaxis(real_out.reshape(moved), -1, axis),
+                         np.moveaxis(dual_out.reshape(moved + (len(self.variables),)), -2, axis), self.variables)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _array_functions:
+            return NotImplemented
+        return _array_functions[func](*args, **kwargs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        reducible = (np.add, np.subtract, np.multiply)
+        if method == "reduce" and ufunc in reducible and set(kwargs) <= {'axis', 'keepdims'}:
+            return self._reduce(ufunc, kwargs.get('axis', 0), kwargs.get('keepdims', False))
+        if method == "accumulate" and ufunc in reducible and set(kwargs) <= {'axis'}:
+            return self._accumulate(ufunc, kwargs.get('axis', 0))
+        if method == "outer" and ufunc in operators and not kwargs:
+            left, right = inputs
+            ndim = np.ndim(right.real if isinstance(right, (Dual, DualArray)) else right)
+            shape = np.shape(left.real if isinstance(left, (Dual, DualArray)) else left) + (1,) * ndim
+            if isinstance(left, DualArray):
+                left = left.reshape(shape)
+            elif not isinstance(left, Dual):
+                left = np.reshape(left, shape)
+            return ufunc(left, right)
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        rule = get_implementation(ufunc)
+        if rule is not None and len(inputs) == 1:
+            return self._apply(rule)
+
+        return NotImplemented
+
+# NumPy functions implemented on whole DualArrays, looked up by __array_function__
+_array_functions = {}
+
+def _implements(func):
+    """
+    Registers the decorated function as the DualArray implementation of `func`.
+    """
+    def register(implementation):
+        _array_functions[func] = implementation
+        return implementation
+    return register
+
+def _as_dual_array(value):
+    """
+    Converts Dual numbers to 0-d DualArrays and leaves other values unchanged.
+    """
+    if isinstance(value, Dual):
+        return DualArray.from_duals(value)
+    return value
+
+def _align(operands):
+    """
+    Returns the union of the variables of the DualArray operands, in order of appearance.
+    """
+    variables = ()
+    for operand in operands:
+        if isinstance(operand, DualArray):
+            variables += tuple(v for v in operand.variables if v not in variables)
+    return variables
+
+@_implements(np.sum)
+def _sum(a, axis=None, keepdims=False):
+    return np.add.reduce(a, axis=axis, keepdims=keepdims)
+
+@_implements(np.prod)
+def _prod(a, axis=None, keepdims=False):
+    return np.multiply.reduce(a, axis=axis, keepdims=keepdims)
+
+@_implements(np.mean)
+def _mean(a, axis=None, keepdims=False):
+    total = np.add.reduce(a, axis=axis, keepdims=keepdims)
+    return total / (a.real.size / max(total.real.size, 1))
+
+@_implements(np.shape)
+def _shape(a):
+    return a.shape
+
+@_implements(np.ndim)
+def _ndim(a):
+    return a.real.ndim
+
+@_implements(np.size)
+def _size(a, axis=None):
+    return np.size(a.real, axis)
+
+@_implements(np.dot)
+def _dot(a, b):
+    """
+    np.dot with the product rule d(a.b) = da.b + a.db, as one tensordot on the real components
+    and one per dual operand on the dual components.
+    """
+    a, b = _as_dual_array(a), _as_dual_array(b)
+    a_real = a.real if isinstance(a, DualArray) else np.asarray(a, dtype=np.float64)
+    b_real = b.real if isinstance(b, DualArray) else np.asarray(b, dtype=np.float64)
+    if a_real.ndim == 0 or b_real.ndim == 0:
+        return a * b
+    axes = ([a_real.ndim - 1], [0 if b_real.ndim == 1 else b_real.ndim - 2])
+    variables = _align((a, b))
+    real = np.dot(a_real, b_real)
+    dual = np.zeros(np.shape(real) + (len(variables),))
+    if isinstance(a, DualArray):
+        #contracting the dual of a leaves its variables axis before the remaining axes of b
+        dual += np.moveaxis(np.tensordot((<DualArray>a)._with_variables(variables), b_real, axes), a_real.ndim - 1, -1)
+    if isinstance(b, DualArray):
+        dual += np.tensordot(a_real, (<DualArray>b)._with_variables(variables), axes)
+    return DualArray(real, dual, variables)
+
+@_implements(np.einsum)
+def _einsum(subscripts, *operands, optimize=False):
+    """
+    np.einsum on multilinear operands: the dual component is the sum, over the DualArray
+    operands, of the same contraction with that operand replaced by its dual component and an
+    extra index for the variables axis.
+    """
+    if not isinstance(subscripts, str):
+        return NotImplemented
+    operands = [_as_dual_array(operand) for operand in operands]
+    subscripts = subscripts.replace(' ', '')
+    inputs, _, output = subscripts.partition('->')
+    inputs = inputs.split(',')
+    if '->' not in subscripts:
+        #implicit output: ellipsis first, then the indices that appear exactly once, sorted
+        letters = ''.join(inputs).replace('.', '')
+        output = ('...' if '...' in subscripts else '') + ''.join(
+            sorted(c for c in set(letters) if letters.count(c) == 1))
+    index = next(c for c in ascii_letters if c not in subscripts)
+
+    variables = _align(operands)
+    reals = [op.real if isinstance(op, DualArray) else op for op in operands]
+    real = np.einsum(f"{','.join(inputs)}->{output}", *reals, optimize=optimize)
+    dual = np.zeros(np.shape(real) + (len(variables),))
+    for i, operand in enumerate(operands):
+        if isinstance(operand, DualArray):
+            terms = inputs[:i] + [inputs[i] + index] + inputs[i + 1:]
+            args = reals[:i] + [(<DualArray>operand)._with_variables(variables)] + reals[i + 1:]
+            dual += np.einsum(f"{','.join(terms)}->{output}{index}", *args, optimize=optimize)
+    return DualArray(real, dual, variables)
+
+@_implements(np.linalg.norm)
+def _norm(x, ord=None, axis=None, keepdims=False):
+    """
+    The 2-norm (Frobenius norm for matrices), with derivative sum(x * dx) / norm.
+    """
+    matrix = isinstance(axis, tuple) or (axis is None and x.real.ndim != 1)
+    if ord not in (None, 2, 'fro') or (ord == 2 and matrix) or (ord == 'fro' and not matrix):
+        return NotImplemented
+    return np.sqrt(np.add.reduce(x * x, axis=axis, keepdims=keepdims))
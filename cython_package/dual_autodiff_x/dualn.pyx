@@ -0,0 +1,222 @@
+# cython: language_level=3
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+from libc.stdlib cimport malloc, free
+from libc.math cimport log, pow
+from .tools cimport Rule, get_implementation
+
+_operators = {
+    np.add: ('__add__', '__radd__'),
+    np.subtract: ('__sub__', '__rsub__'),
+    np.multiply: ('__mul__', '__rmul__'),
+    np.divide: ('__truediv__', '__rtruediv__'),
+    np.power: ('__pow__', '__rpow__'),
+}
+
+# Operand types combined with a DualN as constants; other operands are left to their own operators
+_scalars = (int, float, np.integer, np.floating)
+
+cdef DualN _new(double real, Py_ssize_t n):
+    """
+    Creates a DualN with an uninitialised tangent of width n, for results computed by the library.
+    """
+    cdef DualN result = DualN.__new__(DualN)
+    result.tangent = <double*>malloc((n if n > 0 else 1) * sizeof(double))
+    if result.tangent == NULL:
+        raise MemoryError()
+    result.real = real
+    result.n = n
+    return result
+
+cdef DualN _scaled(DualN x, double real, double scale):
+    """
+    Returns a DualN with the given real part and tangent scale * x.tangent.
+    """
+    cdef Py_ssize_t i
+    cdef DualN result = _new(real, x.n)
+    for i in range(x.n):
+        result.tangent[i] = scale * x.tangent[i]
+    return result
+
+cdef DualN _combined(double real, double alpha, DualN a, double beta, DualN b):
+    """
+    Returns a DualN with the given real part and tangent alpha * a.tangent + beta * b.tangent.
+    """
+    cdef Py_ssize_t i
+    cdef DualN result
+    if a.n != b.n:
+        raise ValueError(f"Cannot combine DualN numbers of widths {a.n} and {b.n}.")
+    result = _new(real, a.n)
+    for i in range(a.n):
+        result.tangent[i] = alpha * a.tangent[i] + beta * b.tangent[i]
+    return result
+
+cdef class DualN:
+    """
+    Dual numbers class with a fixed number of tangent directions stored in a C array, so every
+    operation runs as a typed loop without Python dictionaries or arrays.
+    """
+    cdef public double real
+    cdef double* tangent
+    cdef readonly Py_ssize_t n
+
+    def __cinit__(self):
+        self.tangent = NULL
+        self.n = 0
+
+    def __dealloc__(self):
+        free(self.tangent)
+
+    def __init__(self, real_component, tangent):
+        cdef Py_ssize_t i
+        cdef const double[::1] values
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        values = np.ascontiguousarray(tangent, dtype=np.float64).reshape(-1)
+        free(self.tangent)
+        self.tangent = <double*>malloc((values.shape[0] if values.shape[0] > 0 else 1) * sizeof(double))
+        if self.tangent == NULL:
+            raise MemoryError()
+        self.n = values.shape[0]
+        for i in range(self.n):
+            self.tangent[i] = values[i]
+        self.real = float(real_component)
+
+    @classmethod
+    def inputs(cls, values):
+        """Seeds one DualN per value, each with a unit tangent in its own direction."""
+        cdef Py_ssize_t i, j, n
+        cdef DualN x
+        reals = [float(v) for v in values]
+        n = len(reals)
+        seeded = []
+        for i in range(n):
+            x = _new(reals[i], n)
+            for j in range(n):
+                x.tangent[j] = 1.0 if i == j else 0.0
+            seeded.append(x)
+        return tuple(seeded)
+
+    @property
+    def dual(self):
+        cdef Py_ssize_t i
+        cdef np.ndarray out = np.empty(self.n)
+        cdef double[::1] view = out
+        for i in range(self.n):
+            view[i] = self.tangent[i]
+        return out
+
+    def partial(self, Py_ssize_t index):
+        if not 0 <= index < self.n:
+            raise IndexError(f"Direction {index} is out of range for a DualN of width {self.n}.")
+        return self.tangent[index]
+
+    def __repr__(self):
+        return f"DualN(real={self.real}, dual={self.dual})"
+
+    def __add__(self, other):
+        if isinstance(other, DualN):
+            return _combined(self.real + (<DualN>other).real, 1.0, self, 1.0, other)
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        return _scaled(self, self.real + float(other), 1.0)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, DualN):
+            return _combined(self.real - (<DualN>other).real, 1.0, self, -1.0, other)
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        return _scaled(self, self.real - float(other), 1.0)
+
+    def __rsub__(self, other):
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        return _scaled(self, float(other) - self.real, -1.0)
+
+    def __mul__(self, other):
+        cdef double other_float
+        if isinstance(other, DualN):
+            return _combined(self.real * (<DualN>other).real, (<DualN>other).real, self, self.real, other)
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        other_float = float(other)
+        return _scaled(self, self.real * other_float, other_float)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        cdef double c, other_float
+        if isinstance(other, DualN):
+            c = (<DualN>other).real
+            if c == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            return _combined(self.real / c, 1.0 / c, self, -self.real / (c * c), other)
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        other_float = float(other)
+        if other_float == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _scaled(self, self.real / other_float, 1.0 / other_float)
+
+    def __rtruediv__(self, other):
+        cdef double other_float
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        other_float = float(other)
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _scaled(self, other_float / self.real, -other_float / (self.real * self.real))
+
+    def __pow__(self, other, modulo=None):
+        cdef double a = self.real, c, n, real_part
+        if isinstance(other, DualN):
+            if a <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            c = (<DualN>other).real
+            real_part = pow(a, c)
+            return _combined(real_part, c * pow(a, c - 1), self, real_part * log(a), other)
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        n = float(other)
+        return _scaled(self, pow(a, n), n * pow(a, n - 1) if n != 0 else 0.0)
+
+    def __rpow__(self, other, modulo=None):
+        cdef double other_float, real_part
+        if not isinstance(other, _scalars):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        other_float = float(other)
+        real_part = pow(other_float, self.real)
+        return _scaled(self, real_part, real_part * log(other_float))
+
+    def __neg__(self):
+        return _scaled(self, -self.real, -1.0)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        cdef Rule rule
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in _operators:
+            forward, reflected = _operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        rule = get_implementation(ufunc)
+        if rule is None or len(inputs) != 1:
+            return NotImplemented
+        if rule.func_kernel != NULL:
+            return _scaled(self, rule.func_kernel(self.real), rule.derivative_kernel(self.real))
+        return _scaled(self, float(rule.func(self.real)), float(rule.derivative(self.real)))
@@ -0,0 +1,242 @@
+# cython: language_level=3
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport log
+from .tools import get_implementation, get_second_derivative
+from .variables import VariableSpace
+
+cdef inline HyperDual _make(double real, np.ndarray gradient, np.ndarray hessian, object space):
+    """
+    Creates a HyperDual from values computed by the library, skipping validation.
+    """
+    cdef HyperDual result = HyperDual.__new__(HyperDual)
+    result.real = real
+    result.gradient = gradient
+    result.hessian = hessian
+    result.space = space
+    return result
+
+cdef tuple _widen(np.ndarray gradient, np.ndarray hessian, Py_ssize_t width):
+    """
+    Zero-pads a gradient and Hessian created before new variables were registered.
+    """
+    cdef Py_ssize_t n = gradient.shape[0]
+    if n == width:
+        return gradient, hessian
+    wide_gradient = np.zeros(width)
+    wide_hessian = np.zeros((width, width))
+    wide_gradient[:n] = gradient
+    wide_hessian[:n, :n] = hessian
+    return wide_gradient, wide_hessian
+
+cdef HyperDual _chain(HyperDual x, double value, double first, double second):
+    """
+    Applies a function with the given value, first and second derivative at x.real.
+    """
+    cdef Py_ssize_t i, j, n = x.gradient.shape[0]
+    cdef const double[::1] g = x.gradient
+    cdef const double[:, ::1] h = x.hessian
+    cdef np.ndarray gradient = np.empty(n)
+    cdef np.ndarray hessian = np.empty((n, n))
+    cdef double[::1] out_g = gradient
+    cdef double[:, ::1] out_h = hessian
+    for i in range(n):
+        out_g[i] = first * g[i]
+        for j in range(n):
+            out_h[i, j] = first * h[i, j] + second * g[i] * g[j]
+    return _make(value, gradient, hessian, x.space)
+
+cdef HyperDual _product(HyperDual x, HyperDual y):
+    """
+    Product rule to second order: a * K + b * H + g h^T + h g^T.
+    """
+    cdef Py_ssize_t i, j, n = max(x.gradient.shape[0], y.gradient.shape[0])
+    ga, ha = _widen(x.gradient, x.hessian, n)
+    gb, hb = _widen(y.gradient, y.hessian, n)
+    cdef const double[::1] g = ga
+    cdef const double[:, ::1] h = ha
+    cdef const double[::1] k = gb
+    cdef const double[:, ::1] m = hb
+    cdef double a = x.real, b = y.real
+    cdef np.ndarray gradient = np.empty(n)
+    cdef np.ndarray hessian = np.empty((n, n))
+    cdef double[::1] out_g = gradient
+    cdef double[:, ::1] out_h = hessian
+    for i in range(n):
+        out_g[i] = a * k[i] + b * g[i]
+        for j in range(n):
+            out_h[i, j] = a * m[i, j] + b * h[i, j] + g[i] * k[j] + k[i] * g[j]
+    return _make(a * b, gradient, hessian, x.space)
+
+cdef class HyperDual:
+    """
+    Second-order dual numbers class that carries a value, its gradient and its Hessian over the
+    slots of a VariableSpace.
+    """
+    cdef public double real
+    cdef public np.ndarray gradient
+    cdef public np.ndarray hessian
+    cdef public object space
+
+    def __init__(self, real_component, gradient, hessian, space):
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        if not isinstance(space, VariableSpace):
+            raise TypeError(
+                f"Expected 'space' to be a VariableSpace, but got {type(space).__name__}."
+            )
+        gradient = np.ascontiguousarray(gradient, dtype=np.float64)
+        hessian = np.ascontiguousarray(hessian, dtype=np.float64)
+        if gradient.ndim != 1 or len(gradient) > len(space) or hessian.shape != gradient.shape * 2:
+            raise ValueError(
+                f"Expected 'gradient' with at most {len(space)} entries and a matching square 'hessian', "
+                f"but got shapes {gradient.shape} and {hessian.shape}."
+            )
+        self.real = float(real_component)
+        self.gradient = gradient
+        self.hessian = hessian
+        self.space = space
+
+    @classmethod
+    def variable(cls, str name, value, space):
+        slot = space.slot(name)
+        gradient = np.zeros(len(space))
+        gradient[slot] = 1.0
+        return cls(value, gradient, np.zeros((len(space), len(space))), space)
+
+    @property
+    def dual(self):
+        return dict(zip(self.space.names, self.gradient.tolist()))
+
+    def __repr__(self):
+        return f"HyperDual(real={self.real}, gradient={self.gradient}, hessian={self.hessian})"
+
+    cdef tuple _derivatives(self, HyperDual other):
+        if other.space is not self.space:
+            raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+        cdef Py_ssize_t n = max(self.gradient.shape[0], other.gradient.shape[0])
+        return _widen(self.gradient, self.hessian, n) + _widen(other.gradient, other.hessian, n)
+
+    def __add__(self, other):
+        if isinstance(other, HyperDual):
+            ga, ha, gb, hb = self._derivatives(other)
+            return _make(self.real + other.real, ga + gb, ha + hb, self.space)
+        return _make(self.real + float(other), self.gradient, self.hessian, self.space)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, HyperDual):
+            ga, ha, gb, hb = self._derivatives(other)
+            return _make(self.real - other.real, ga - gb, ha - hb, self.space)
+        return _make(self.real - float(other), self.gradient, self.hessian, self.space)
+
+    def __rsub__(self, other):
+        return _make(float(other) - self.real, -self.gradient, -self.hessian, self.space)
+
+    def __mul__(self, other):
+        cdef double other_float
+        if isinstance(other, HyperDual):
+            if other.space is not self.space:
+                raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+            return _product(self, other)
+        other_float = float(other)
+        return _make(self.real * other_float, self.gradient * other_float, self.hessian * other_float, self.space)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    cdef HyperDual _reciprocal(self):
+        cdef double inverse
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        inverse = 1.0 / self.real
+        return _chain(self, inverse, -inverse * inverse, 2.0 * inverse * inverse * inverse)
+
+    def __truediv__(self, other):
+        cdef double other_float
+        if isinstance(other, HyperDual):
+            return self * (<HyperDual>other)._reciprocal()
+        other_float = float(other)
+        if other_float == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _make(self.real / other_float, self.gradient / other_float, self.hessian / other_float, self.space)
+
+    def __rtruediv__(self, other):
+        return self._reciprocal() * other
+
+    def __pow__(self, other, modulo=None):
+        cdef double n, first, second
+        if isinstance(other, HyperDual):
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            return np.exp(other * np.log(self))
+        n = float(other)
+        first = n * self.real ** (n - 1) if n != 0 else 0.0
+        second = n * (n - 1) * self.real ** (n - 2) if n != 0 and n != 1 else 0.0
+        return _chain(self, self.real ** n, first, second)
+
+    def __rpow__(self, other, modulo=None):
+        cdef double other_float, real_part, log_base
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        other_float = float(other)
+        real_part = other_float ** self.real
+        log_base = log(other_float)
+        return _chain(self, real_part, real_part * log_base, real_part * log_base * log_base)
+
+    def __neg__(self):
+        return _make(-self.real, -self.gradient, -self.hessian, self.space)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            fsecond = get_second_derivative(ufunc.__name__)
+            if fsecond is None:
+                raise ValueError(
+                    f"No second derivative registered for '{ufunc.__name__}', pass one to add_function."
+                )
+            return _chain(self, float(f(self.real)), float(fprime(self.real)), float(fsecond(self.real)))
+
+        return NotImplemented
+
+def hessian(f, x):
+    """Computes the exact Hessian of a scalar function in one evaluation on HyperDual numbers."""
+    values = np.asarray(x, dtype=np.float64)
+    n = values.size
+    space = VariableSpace([f"x{i}" for i in range(n)])
+    identity = np.eye(n)
+    zeros = np.zeros((n, n))
+    inputs = np.empty(n, dtype=object)
+    for i, value in enumerate(values.ravel().tolist()):
+        inputs[i] = HyperDual(value, identity[i], zeros, space)
+    result = f(inputs[0] if values.ndim == 0 else inputs.reshape(values.shape))
+    if not isinstance(result, HyperDual):
+        return np.zeros(values.shape * 2)
+    return result.hessian.reshape(values.shape * 2)
@@ -0,0 +1,12 @@
+from .tools cimport kernel, Rule
+
+cdef void scale_rows(const double[::1] scale, const double[:, ::1] dual, double[:, ::1] out) noexcept nogil
+cdef void combine_rows(const double[::1] alpha, const double[:, ::1] a, const double[::1] beta,
+                       const double[:, ::1] b, double[:, ::1] out) noexcept nogil
+cdef void map_rule(kernel func, kernel derivative, const double[::1] x, double[::1] values,
+                   double[::1] slopes) noexcept nogil
+
+cpdef void scale(const double[::1] factors, const double[:, ::1] dual, double[:, ::1] out)
+cpdef void combine(const double[::1] alpha, const double[:, ::1] a, const double[::1] beta,
+                   const double[:, ::1] b, double[:, ::1] out)
+cpdef void apply_rule(Rule rule, const double[::1] x, double[::1] values, double[::1] slopes)
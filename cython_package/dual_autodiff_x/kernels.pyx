@@ -0,0 +1,79 @@
+# cython: language_level=3, initializedcheck=False
+# distutils: language=c++
+
+import os
+from cython.parallel cimport prange
+from .tools cimport kernel, Rule
+
+# Number of threads the kernels split their points over, set with set_num_threads
+cdef int _num_threads = os.cpu_count() or 1
+
+# Fewest points per thread worth starting a parallel region for
+cdef Py_ssize_t _grain = 2048
+
+cdef inline int _threads(Py_ssize_t points) noexcept nogil:
+    cdef Py_ssize_t useful = points // _grain
+    if useful < 1:
+        return 1
+    return <int>useful if useful < _num_threads else _num_threads
+
+def set_num_threads(int n):
+    """Set the number of threads the array kernels use."""
+    global _num_threads
+    if n < 1:
+        raise ValueError(f"Expected a positive number of threads, but got {n}.")
+    _num_threads = n
+
+def get_num_threads():
+    """Get the number of threads the array kernels use."""
+    return _num_threads
+
+cdef void scale_rows(const double[::1] scale, const double[:, ::1] dual, double[:, ::1] out) noexcept nogil:
+    """
+    out[i, :] = scale[i] * dual[i, :], one row per point.
+    """
+    cdef Py_ssize_t i, j
+    for i in prange(dual.shape[0], num_threads=_threads(dual.shape[0]), schedule='static'):
+        for j in range(dual.shape[1]):
+            out[i, j] = scale[i] * dual[i, j]
+
+cdef void combine_rows(const double[::1] alpha, const double[:, ::1] a, const double[::1] beta,
+                       const double[:, ::1] b, double[:, ::1] out) noexcept nogil:
+    """
+    out[i, :] = alpha[i] * a[i, :] + beta[i] * b[i, :], the tangent of a product rule in one pass.
+    """
+    cdef Py_ssize_t i, j
+    for i in prange(a.shape[0], num_threads=_threads(a.shape[0]), schedule='static'):
+        for j in range(a.shape[1]):
+            out[i, j] = alpha[i] * a[i, j] + beta[i] * b[i, j]
+
+cdef void map_rule(kernel func, kernel derivative, const double[::1] x, double[::1] values,
+                   double[::1] slopes) noexcept nogil:
+    """
+    Evaluates a built-in tools function and its derivative at every point.
+    """
+    cdef Py_ssize_t i
+    for i in prange(x.shape[0], num_threads=_threads(x.shape[0]), schedule='static'):
+        values[i] = func(x[i])
+        slopes[i] = derivative(x[i])
+
+# Entry points for Python objects: the memoryviews are taken while holding the GIL, then the
+# kernels run without it so other Python threads keep running.
+
+cpdef void scale(const double[::1] factors, const double[:, ::1] dual, double[:, ::1] out):
+    """Set out[i, :] = factors[i] * dual[i, :] without holding the GIL."""
+    with nogil:
+        scale_rows(factors, dual, out)
+
+cpdef void combine(const double[::1] alpha, const double[:, ::1] a, const double[::1] beta,
+                   const double[:, ::1] b, double[:, ::1] out):
+    """Set out[i, :] = alpha[i] * a[i, :] + beta[i] * b[i, :] without holding the GIL."""
+    with nogil:
+        combine_rows(alpha, a, beta, b, out)
+
+cpdef void apply_rule(Rule rule, const double[::1] x, double[::1] values, double[::1] slopes):
+    """Evaluate a built-in Rule and its derivative at every point without holding the GIL."""
+    if not rule.native:
+        raise ValueError(f"{rule!r} has no C kernels.")
+    with nogil:
+        map_rule(rule.func_kernel, rule.derivative_kernel, x, values, slopes)
@@ -0,0 +1,245 @@
+# cython: language_level=3
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport log
+from .tools import get_implementation
+from .variables import VariableSpace, DenseDual
+
+cdef tuple _merge(const np.int64_t[::1] ia, const double[::1] va, double alpha,
+                  const np.int64_t[::1] ib, const double[::1] vb, double beta):
+    """
+    Two-pointer merge of sorted sparse vectors into alpha * a + beta * b, dropping zeros.
+    """
+    cdef Py_ssize_t i = 0, j = 0, n = 0
+    cdef Py_ssize_t na = ia.shape[0], nb = ib.shape[0]
+    cdef np.ndarray indices = np.empty(na + nb, dtype=np.int64)
+    cdef np.ndarray values = np.empty(na + nb, dtype=np.float64)
+    cdef np.int64_t[::1] out_i = indices
+    cdef double[::1] out_v = values
+    cdef np.int64_t slot
+    cdef double value
+    while i < na or j < nb:
+        if j >= nb or (i < na and ia[i] < ib[j]):
+            slot = ia[i]
+            value = alpha * va[i]
+            i += 1
+        elif i >= na or ib[j] < ia[i]:
+            slot = ib[j]
+            value = beta * vb[j]
+            j += 1
+        else:
+            slot = ia[i]
+            value = alpha * va[i] + beta * vb[j]
+            i += 1
+            j += 1
+        if value != 0:
+            out_i[n] = slot
+            out_v[n] = value
+            n += 1
+    return indices[:n], values[:n]
+
+cdef tuple _scale(np.ndarray indices, const double[::1] va, double alpha):
+    cdef Py_ssize_t i
+    cdef np.ndarray values
+    cdef double[::1] out_v
+    if alpha == 0:
+        return indices[:0], np.empty(0)
+    values = np.empty(va.shape[0])
+    out_v = values
+    for i in range(va.shape[0]):
+        out_v[i] = alpha * va[i]
+    return indices, values
+
+cdef inline SparseDual _make(double real, tuple pair, object space):
+    """
+    Creates a SparseDual from arrays computed by the library, skipping validation.
+    """
+    cdef SparseDual result = SparseDual.__new__(SparseDual)
+    result.real = real
+    result.indices = pair[0]
+    result.values = pair[1]
+    result.space = space
+    return result
+
+cdef class SparseDual:
+    """
+    Dual numbers class whose dual component is stored as sorted slot/value arrays over a
+    VariableSpace, keeping only nonzero entries.
+    """
+    cdef public double real
+    cdef public np.ndarray indices
+    cdef public np.ndarray values
+    cdef public object space
+
+    def __init__(self, real_component, indices, values, space):
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        if not isinstance(space, VariableSpace):
+            raise TypeError(
+                f"Expected 'space' to be a VariableSpace, but got {type(space).__name__}."
+            )
+        indices = np.ascontiguousarray(indices, dtype=np.int64)
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if indices.shape != values.shape or indices.ndim != 1:
+            raise ValueError("Expected 'indices' and 'values' to be 1-D arrays of the same length.")
+        if np.any(np.diff(indices) <= 0):
+            raise ValueError("Expected 'indices' to be strictly increasing.")
+        nonzero = values != 0
+        self.real = float(real_component)
+        self.indices = indices[nonzero]
+        self.values = values[nonzero]
+        self.space = space
+
+    @classmethod
+    def from_dict(cls, real_component, dict dual_component, space):
+        slots = np.array([space.slot(name) for name in dual_component], dtype=np.int64)
+        values = np.array(list(dual_component.values()), dtype=np.float64)
+        order = np.argsort(slots)
+        return cls(real_component, slots[order], values[order], space)
+
+    @property
+    def nnz(self):
+        return self.indices.shape[0]
+
+    @property
+    def dual(self):
+        names = self.space.names
+        return {names[i]: v for i, v in zip(self.indices.tolist(), self.values.tolist())}
+
+    def to_dense(self):
+        tangent = np.zeros(len(self.space))
+        tangent[self.indices] = self.values
+        return DenseDual(self.real, tangent, self.space)
+
+    def __repr__(self):
+        return f"SparseDual(real={self.real}, dual={self.dual})"
+
+    cdef inline void _check_space(self, SparseDual other) except *:
+        if other.space is not self.space:
+            raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+
+    def __add__(self, other):
+        cdef SparseDual o
+        if isinstance(other, SparseDual):
+            o = other
+            self._check_space(o)
+            return _make(self.real + o.real, _merge(self.indices, self.values, 1.0, o.indices, o.values, 1.0),
+                         self.space)
+        return _make(self.real + float(other), (self.indices, self.values), self.space)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        cdef SparseDual o
+        if isinstance(other, SparseDual):
+            o = other
+            self._check_space(o)
+            return _make(self.real - o.real, _merge(self.indices, self.values, 1.0, o.indices, o.values, -1.0),
+                         self.space)
+        return _make(self.real - float(other), (self.indices, self.values), self.space)
+
+    def __rsub__(self, other):
+        return _make(float(other) - self.real, _scale(self.indices, self.values, -1.0), self.space)
+
+    def __mul__(self, other):
+        cdef SparseDual o
+        cdef double other_float
+        if isinstance(other, SparseDual):
+            o = other
+            self._check_space(o)
+            return _make(self.real * o.real,
+                         _merge(self.indices, self.values, o.real, o.indices, o.values, self.real),
+                         self.space)
+        other_float = float(other)
+        return _make(self.real * other_float, _scale(self.indices, self.values, other_float), self.space)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        cdef SparseDual o
+        cdef double other_float
+        if isinstance(other, SparseDual):
+            o = other
+            self._check_space(o)
+            if o.real == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            return _make(self.real / o.real,
+                         _merge(self.indices, self.values, 1.0 / o.real,
+                                o.indices, o.values, -self.real / (o.real * o.real)),
+                         self.space)
+        other_float = float(other)
+        if other_float == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _make(self.real / other_float, _scale(self.indices, self.values, 1.0 / other_float), self.space)
+
+    def __rtruediv__(self, other):
+        cdef double other_float = float(other)
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _make(other_float / self.real,
+                     _scale(self.indices, self.values, -other_float / (self.real * self.real)), self.space)
+
+    def __pow__(self, other, modulo=None):
+        cdef SparseDual o
+        cdef double other_float, real_part
+        if isinstance(other, SparseDual):
+            o = other
+            self._check_space(o)
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            real_part = self.real ** o.real
+            return _make(real_part,
+                         _merge(self.indices, self.values, o.real * self.real ** (o.real - 1),
+                                o.indices, o.values, real_part * log(self.real)),
+                         self.space)
+        other_float = float(other)
+        if self.indices.shape[0] == 0: #the scale below is undefined at 0 for other < 1
+            return _make(self.real ** other_float, (self.indices, self.values), self.space)
+        return _make(self.real ** other_float,
+                     _scale(self.indices, self.values, other_float * self.real ** (other_float - 1)), self.space)
+
+    def __rpow__(self, other, modulo=None):
+        cdef double other_float, real_part
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        other_float = float(other)
+        real_part = other_float ** self.real
+        return _make(real_part, _scale(self.indices, self.values, real_part * log(other_float)), self.space)
+
+    def __neg__(self):
+        return _make(-self.real, _scale(self.indices, self.values, -1.0), self.space)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            return _make(float(f(self.real)), _scale(self.indices, self.values, float(fprime(self.real))),
+                         self.space)
+
+        return NotImplemented
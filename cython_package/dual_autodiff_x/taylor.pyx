@@ -0,0 +1,333 @@
+# cython: language_level=3
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport exp, log, sin, cos, sinh, cosh, sqrt, pow
+from math import factorial
+from .tools import get_implementation, base_implementations
+
+_builtin_pairs = dict(base_implementations)
+
+# Derivatives of the built-in functions as Taylor expressions, as the registry derivatives only
+# take floats
+_builtin_series = {
+    'tan': lambda x: 1.0 / (np.cos(x) * np.cos(x)),
+    'tanh': lambda x: 1.0 / (np.cosh(x) * np.cosh(x)),
+    'arcsin': lambda x: 1.0 / np.sqrt(1.0 - x * x),
+    'arccos': lambda x: -1.0 / np.sqrt(1.0 - x * x),
+    'arctan': lambda x: 1.0 / (1.0 + x * x),
+}
+
+# Every kernel works on (points, degree + 1) arrays of coefficients
+
+cdef np.ndarray _mul(const double[:, ::1] a, const double[:, ::1] b):
+    cdef Py_ssize_t p, j, k, n = a.shape[0], m = a.shape[1]
+    cdef np.ndarray out = np.empty((n, m))
+    cdef double[:, ::1] c = out
+    cdef double total
+    for p in range(n):
+        for k in range(m):
+            total = 0.0
+            for j in range(k + 1):
+                total += a[p, j] * b[p, k - j]
+            c[p, k] = total
+    return out
+
+cdef np.ndarray _div(const double[:, ::1] a, const double[:, ::1] b):
+    cdef Py_ssize_t p, j, k, n = a.shape[0], m = a.shape[1]
+    cdef np.ndarray out = np.empty((n, m))
+    cdef double[:, ::1] c = out
+    cdef double total
+    for p in range(n):
+        for k in range(m):
+            total = a[p, k]
+            for j in range(k):
+                total -= c[p, j] * b[p, k - j]
+            c[p, k] = total / b[p, 0]
+    return out
+
+cdef np.ndarray _integrate(const double[:, ::1] u, const double[:, ::1] w, const double[::1] value):
+    """
+    v_0 = value and v_k = (1/k) sum_{j=1}^k j u_j w_{k-j}: the chain rule for v = f(u) when w
+    holds the coefficients of f'(u).
+    """
+    cdef Py_ssize_t p, j, k, n = u.shape[0], m = u.shape[1]
+    cdef np.ndarray out = np.empty((n, m))
+    cdef double[:, ::1] v = out
+    cdef double total
+    for p in range(n):
+        v[p, 0] = value[p]
+        for k in range(1, m):
+            total = 0.0
+            for j in range(1, k + 1):
+                total += j * u[p, j] * w[p, k - j]
+            v[p, k] = total / k
+    return out
+
+cdef np.ndarray _exp(const double[:, ::1] u):
+    cdef Py_ssize_t p, j, k, n = u.shape[0], m = u.shape[1]
+    cdef np.ndarray out = np.empty((n, m))
+    cdef double[:, ::1] e = out
+    cdef double total
+    for p in range(n):
+        e[p, 0] = exp(u[p, 0])
+        for k in range(1, m):
+            total = 0.0
+            for j in range(1, k + 1):
+                total += j * u[p, j] * e[p, k - j]
+            e[p, k] = total / k
+    return out
+
+cdef np.ndarray _log(const double[:, ::1] u):
+    cdef Py_ssize_t p, j, k, n = u.shape[0], m = u.shape[1]
+    cdef np.ndarray out = np.empty((n, m))
+    cdef double[:, ::1] l = out
+    cdef double total
+    for p in range(n):
+        l[p, 0] = log(u[p, 0])
+        for k in range(1, m):
+            total = 0.0
+            for j in range(1, k):
+                total += j * l[p, j] * u[p, k - j]
+            l[p, k] = (u[p, k] - total / k) / u[p, 0]
+    return out
+
+cdef tuple _sin_cos(const double[:, ::1] u, bint hyperbolic):
+    cdef Py_ssize_t p, j, k, n = u.shape[0], m = u.shape[1]
+    cdef np.ndarray out_s = np.empty((n, m))
+    cdef np.ndarray out_c = np.empty((n, m))
+    cdef double[:, ::1] s = out_s
+    cdef double[:, ::1] c = out_c
+    cdef double sign = 1.0 if hyperbolic else -1.0
+    cdef double total_s, total_c
+    for p in range(n):
+        s[p, 0] = sinh(u[p, 0]) if hyperbolic else sin(u[p, 0])
+        c[p, 0] = cosh(u[p, 0]) if hyperbolic else cos(u[p, 0])
+        for k in range(1, m):
+            total_s = 0.0
+            total_c = 0.0
+            for j in range(1, k + 1):
+                total_s += j * u[p, j] * c[p, k - j]
+                total_c += j * u[p, j] * s[p, k - j]
+            s[p, k] = total_s / k
+            c[p, k] = sign * total_c / k
+    return out_s, out_c
+
+cdef np.ndarray _sqrt(const double[:, ::1] u):
+    cdef Py_ssize_t p, j, k, n = u.shape[0], m = u.shape[1]
+    cdef np.ndarray out = np.empty((n, m))
+    cdef double[:, ::1] r = out
+    cdef double total
+    for p in range(n):
+        r[p, 0] = sqrt(u[p, 0])
+        for k in range(1, m):
+            total = 0.0
+            for j in range(1, k):
+                total += r[p, j] * r[p, k - j]
+            r[p, k] = (u[p, k] - total) / (2.0 * r[p, 0])
+    return out
+
+cdef np.ndarray _pow(np.ndarray u, double power):
+    """
+    Non-negative integer powers use repeated squaring, which also works when u_0 = 0; other powers
+    use w_k = (1/(k u_0)) sum_{j=1}^k ((p + 1) j - k) u_j w_{k-j}.
+    """
+    cdef Py_ssize_t p, j, k, n = u.shape[0], m = u.shape[1]
+    cdef long e
+    cdef np.ndarray out
+    if power >= 0 and power == <long>power:
+        out = np.zeros((n, m))
+        out[:, 0] = 1.0
+        e = <long>power
+        while e:
+            if e & 1:
+                out = _mul(out, u)
+            e >>= 1
+            if e:
+                u = _mul(u, u)
+        return out
+    cdef const double[:, ::1] a = u
+    out = np.empty((n, m))
+    cdef double[:, ::1] w = out
+    cdef double total
+    for p in range(n):
+        w[p, 0] = pow(a[p, 0], power)
+        for k in range(1, m):
+            total = 0.0
+            for j in range(1, k + 1):
+                total += ((power + 1) * j - k) * a[p, j] * w[p, k - j]
+            w[p, k] = total / (k * a[p, 0])
+    return out
+
+cdef np.ndarray _constant(value, Py_ssize_t degree):
+    value = np.asarray(value, dtype=np.float64)
+    cdef np.ndarray coefficients = np.zeros(value.shape + (degree + 1,))
+    coefficients[..., 0] = value
+    return coefficients
+
+cdef np.ndarray _rows(np.ndarray coefficients):
+    return np.ascontiguousarray(coefficients.reshape(-1, coefficients.shape[coefficients.ndim - 1]))
+
+cdef class Taylor:
+    """
+    Truncated Taylor polynomial class to compute derivatives of arbitrary order of univariate
+    functions, vectorised over the leading axes of its coefficients.
+    """
+    cdef public object coefficients
+
+    def __init__(self, coefficients):
+        coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+        if coefficients.ndim == 0 or coefficients.shape[coefficients.ndim - 1] == 0:
+            raise ValueError("Expected 'coefficients' to have at least one coefficient along the last axis.")
+        self.coefficients = coefficients
+
+    @classmethod
+    def variable(cls, value, int degree):
+        if degree < 0:
+            raise ValueError(f"Expected 'degree' to be non-negative, but got {degree}.")
+        coefficients = _constant(value, degree)
+        if degree > 0:
+            coefficients[..., 1] = 1.0
+        return cls(coefficients)
+
+    @property
+    def degree(self):
+        return self.coefficients.shape[self.coefficients.ndim - 1] - 1
+
+    @property
+    def real(self):
+        return self.coefficients[..., 0]
+
+    def derivatives(self):
+        factorials = np.array([factorial(k) for k in range(self.degree + 1)], dtype=np.float64)
+        return self.coefficients * factorials
+
+    def __getitem__(self, index):
+        return Taylor(self.coefficients[index])
+
+    def __repr__(self):
+        return f"Taylor(coefficients={self.coefficients})"
+
+    cdef tuple _truncate(self, other):
+        """
+        Returns both operands broadcast to the same points and truncated to the lower degree.
+        """
+        b = other.coefficients if isinstance(other, Taylor) else _constant(other, self.degree)
+        cdef Py_ssize_t m = min(self.coefficients.shape[self.coefficients.ndim - 1], b.shape[b.ndim - 1])
+        a, b = np.broadcast_arrays(self.coefficients[..., :m], b[..., :m])
+        return a, b
+
+    cdef Taylor _binary(self, other, bint divide):
+        a, b = self._truncate(other)
+        result = _div(_rows(a), _rows(b)) if divide else _mul(_rows(a), _rows(b))
+        return Taylor(result.reshape(a.shape))
+
+    cdef Taylor _unary(self, str name):
+        cdef np.ndarray u = _rows(self.coefficients)
+        if name == 'exp':
+            result = _exp(u)
+        elif name == 'log':
+            result = _log(u)
+        elif name == 'sqrt':
+            result = _sqrt(u)
+        elif name in ('sin', 'cos'):
+            result = _sin_cos(u, False)[name == 'cos']
+        else:
+            result = _sin_cos(u, True)[name == 'cosh']
+        return Taylor(result.reshape(self.coefficients.shape))
+
+    def __add__(self, other):
+        a, b = self._truncate(other)
+        return Taylor(a + b)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        a, b = self._truncate(other)
+        return Taylor(a - b)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        if not isinstance(other, Taylor):
+            return Taylor(self.coefficients * np.asarray(other, dtype=np.float64)[..., None])
+        return self._binary(other, False)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        b = other.coefficients if isinstance(other, Taylor) else np.asarray(other, dtype=np.float64)[..., None]
+        if np.any(b[..., 0] == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return self._binary(other, True)
+
+    def __rtruediv__(self, other):
+        if np.any(self.coefficients[..., 0] == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return Taylor(_constant(other, self.degree)).__truediv__(self)
+
+    def __pow__(self, other, modulo=None):
+        if isinstance(other, Taylor):
+            if np.any(self.coefficients[..., 0] <= 0):
+                raise ValueError("For Dual number exponents, base must be positive")
+            return (<Taylor>(other * self._unary('log')))._unary('exp')
+        return Taylor(_pow(_rows(self.coefficients), float(other)).reshape(self.coefficients.shape))
+
+    def __rpow__(self, other, modulo=None):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        return (<Taylor>(self * log(float(other))))._unary('exp')
+
+    def __neg__(self):
+        return Taylor(-self.coefficients)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        name = ufunc.__name__
+        implementation = get_implementation(ufunc)
+        if implementation is None or len(inputs) != 1:
+            return NotImplemented
+        f, fprime = implementation
+        pair = _builtin_pairs.get(name)
+        builtin = pair is not None and pair[0] is f and pair[1] is fprime
+        if builtin and name in ('exp', 'log', 'sqrt', 'sin', 'cos', 'sinh', 'cosh'):
+            return self._unary(name)
+
+        derivative = _builtin_series[name](self) if builtin else fprime(self)
+        if isinstance(derivative, Taylor):
+            derivative = derivative.coefficients
+        else:
+            derivative = _constant(derivative, self.degree)
+        u, w = np.broadcast_arrays(self.coefficients, derivative)
+        value = np.ascontiguousarray(np.asarray(f(u[..., 0]), dtype=np.float64).reshape(-1))
+        return Taylor(_integrate(_rows(u), _rows(w), value).reshape(u.shape))
+
+def taylor_derivatives(f, x, int degree):
+    """Computes the derivatives of order 0 to `degree` of a univariate function."""
+    result = f(Taylor.variable(x, degree))
+    if not isinstance(result, Taylor):
+        return Taylor(_constant(np.broadcast_to(result, np.shape(x)), degree)).derivatives()
+    return result.derivatives()
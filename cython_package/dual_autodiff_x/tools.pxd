@@ -0,0 +1,9 @@
+ctypedef double (*kernel)(double) noexcept nogil
+
+cdef class Rule:
+    cdef readonly object func
+    cdef readonly object derivative
+    cdef kernel func_kernel
+    cdef kernel derivative_kernel
+
+cpdef Rule get_implementation(ufunc)
@@ -32,15 +32,130 @@ base_implementations = {
     'arctan': (np.arctan, lambda x: 1.0 / (1.0 + x * x))
 }
 
-cpdef add_function(str name, func, derivative):
+# Second derivatives, used by second-order number types such as HyperDual
+second_derivatives = {
+    'sin': lambda x: -sin(x),
+    'cos': lambda x: -cos(x),
+    'tan': lambda x: 2.0 * tan(x) / (cos(x) * cos(x)),
+
+    'sinh': lambda x: sinh(x),
+    'cosh': lambda x: cosh(x),
+    'tanh': lambda x: -2.0 * tanh(x) / (cosh(x) * cosh(x)),
+
+    'exp': lambda x: exp(x),
+    'log': lambda x: -1.0 / (x * x),
+    'sqrt': lambda x: -1.0 / (4.0 * x * sqrt(x)),
+
+    'arcsin': lambda x: x / ((1.0 - x * x) * sqrt(1.0 - x * x)),
+    'arccos': lambda x: -x / ((1.0 - x * x) * sqrt(1.0 - x * x)),
+    'arctan': lambda x: -2.0 * x / ((1.0 + x * x) * (1.0 + x * x))
+}
+
+# C versions of the built-in functions and derivatives, used by Rule while the registry still
+# holds the original pairs
+cdef double _sin(double x) noexcept nogil: return sin(x)
+cdef double _cos(double x) noexcept nogil: return cos(x)
+cdef double _tan(double x) noexcept nogil: return tan(x)
+cdef double _sinh(double x) noexcept nogil: return sinh(x)
+cdef double _cosh(double x) noexcept nogil: return cosh(x)
+cdef double _tanh(double x) noexcept nogil: return tanh(x)
+cdef double _exp(double x) noexcept nogil: return exp(x)
+cdef double _log(double x) noexcept nogil: return log(x)
+cdef double _sqrt(double x) noexcept nogil: return sqrt(x)
+cdef double _asin(double x) noexcept nogil: return asin(x)
+cdef double _acos(double x) noexcept nogil: return acos(x)
+cdef double _atan(double x) noexcept nogil: return atan(x)
+
+cdef double _d_sin(double x) noexcept nogil: return cos(x)
+cdef double _d_cos(double x) noexcept nogil: return -sin(x)
+cdef double _d_tan(double x) noexcept nogil: return 1.0 / (cos(x) * cos(x))
+cdef double _d_tanh(double x) noexcept nogil: return 1.0 / (cosh(x) * cosh(x))
+cdef double _d_log(double x) noexcept nogil: return 1.0 / x
+cdef double _d_sqrt(double x) noexcept nogil: return 1.0 / (2.0 * sqrt(x))
+cdef double _d_asin(double x) noexcept nogil: return 1.0 / sqrt(1.0 - x * x)
+cdef double _d_acos(double x) noexcept nogil: return -1.0 / sqrt(1.0 - x * x)
+cdef double _d_atan(double x) noexcept nogil: return 1.0 / (1.0 + x * x)
+
+cdef kernel _func_kernels[12]
+cdef kernel _derivative_kernels[12]
+_func_kernels[:] = [_sin, _cos, _tan, _sinh, _cosh, _tanh, _exp, _log, _sqrt, _asin, _acos, _atan]
+_derivative_kernels[:] = [_d_sin, _d_cos, _d_tan, _cosh, _sinh, _d_tanh, _exp, _d_log, _d_sqrt,
+                          _d_asin, _d_acos, _d_atan]
+_kernel_codes = {name: code for code, name in enumerate(base_implementations)}
+_builtin_pairs = dict(base_implementations)
+
+# Bumped by add_function and remove_function, so tables built from the registry know when to refresh
+cdef Py_ssize_t _version = 0
+
+# Rules keyed by ufunc object, filled on first use and cleared when _version changes
+cdef dict _dispatch = {}
+cdef Py_ssize_t _dispatch_version = 0
+
+cdef class Rule:
+    """
+    Registry entry for one ufunc. Unpacks to (function, derivative) like the tuples returned by
+    get_functions, and holds C kernels when the entry is a built-in one.
+    """
+    @property
+    def native(self):
+        return self.func_kernel != NULL
+
+    def __iter__(self):
+        return iter((self.func, self.derivative))
+
+    def __repr__(self):
+        return f"Rule(func={self.func!r}, derivative={self.derivative!r}, native={self.native})"
+
+cdef Rule _make_rule(str name, tuple pair):
+    cdef Rule rule = Rule.__new__(Rule)
+    rule.func, rule.derivative = pair
+    code = _kernel_codes.get(name)
+    builtin = _builtin_pairs.get(name)
+    if code is not None and builtin[0] is pair[0] and builtin[1] is pair[1]:
+        rule.func_kernel = _func_kernels[<int>code]
+        rule.derivative_kernel = _derivative_kernels[<int>code]
+    return rule
+
+cpdef add_function(str name, func, derivative, second_derivative=None):
     """Add a new function to the implementation dictionary."""
+    global _version
+    registered = base_implementations.get(name)
+    if second_derivative is not None:
+        second_derivatives[name] = second_derivative
+    elif registered is None or registered[0] is not func or registered[1] is not derivative:
+        second_derivatives.pop(name, None) #stale once the function changes
     base_implementations[name] = (func, derivative)
+    _version += 1
 
 cpdef get_functions():
     """Get the current implementation dictionary."""
     return base_implementations.copy()
 
+cpdef Rule get_implementation(ufunc):
+    """Get the Rule registered for a NumPy ufunc, without copying the registry."""
+    global _dispatch_version
+    if _dispatch_version != _version:
+        _dispatch.clear()
+        _dispatch_version = _version
+    rule = _dispatch.get(ufunc, False)
+    if rule is False:
+        name = getattr(ufunc, '__name__', None)
+        pair = base_implementations.get(name)
+        rule = _dispatch[ufunc] = None if pair is None else _make_rule(name, pair)
+    return rule
+
+cpdef Py_ssize_t registry_version():
+    """Get the version of the implementation dictionary."""
+    return _version
+
+cpdef get_second_derivative(str name):
+    """Get the second derivative of a function, or None if it was not provided."""
+    return second_derivatives.get(name)
+
 cpdef remove_function(str name):
     """Remove a function from the implementation dictionary."""
+    global _version
     if name in base_implementations:
-        del base_implementations[name]
\ No newline at end of file
+        del base_implementations[name]
+    second_derivatives.pop(name, None)
+    _version += 1
\ No newline at end of file
@@ -0,0 +1,237 @@
+# cython: language_level=3
+# distutils: language=c++
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport log
+from .tools import get_implementation
+
+cdef class VariableSpace:
+    """
+    Registry that interns variable names to integer slots.
+    """
+    cdef dict _slots
+    cdef public list names
+
+    def __init__(self, names=()):
+        self._slots = {}
+        self.names = []
+        for name in names:
+            self.slot(name)
+
+    cpdef Py_ssize_t slot(self, name) except -1:
+        slot = self._slots.get(name)
+        if slot is None:
+            if not isinstance(name, str):
+                raise TypeError(f"Expected variable name to be a str, but got {type(name).__name__}.")
+            slot = len(self.names)
+            self._slots[name] = slot
+            self.names.append(name)
+        return slot
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._slots
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __repr__(self):
+        return f"VariableSpace({self.names})"
+
+    def variable(self, str name, value):
+        cdef Py_ssize_t slot = self.slot(name)
+        tangent = np.zeros(len(self.names))
+        tangent[slot] = 1.0
+        return DenseDual(value, tangent, self)
+
+    def dual(self, real_component, dict dual_component):
+        slots = [self.slot(name) for name in dual_component]
+        tangent = np.zeros(len(self.names))
+        tangent[slots] = list(dual_component.values())
+        return DenseDual(real_component, tangent, self)
+
+cdef inline DenseDual _make(double real, np.ndarray tangent, VariableSpace space):
+    """
+    Creates a DenseDual from values computed by the library, skipping validation.
+    """
+    cdef DenseDual result = DenseDual.__new__(DenseDual)
+    result.real = real
+    result.tangent = tangent
+    result.space = space
+    return result
+
+cdef np.ndarray _combine(double alpha, const double[::1] a, double beta, const double[::1] b):
+    """
+    Returns alpha * a + beta * b, treating missing trailing entries of the shorter vector as zero.
+    """
+    cdef Py_ssize_t i, n = max(a.shape[0], b.shape[0])
+    cdef np.ndarray out = np.zeros(n)
+    cdef double[::1] view = out
+    for i in range(a.shape[0]):
+        view[i] = alpha * a[i]
+    for i in range(b.shape[0]):
+        view[i] += beta * b[i]
+    return out
+
+cdef np.ndarray _scale(double alpha, const double[::1] a):
+    cdef Py_ssize_t i
+    cdef np.ndarray out = np.empty(a.shape[0])
+    cdef double[::1] view = out
+    for i in range(a.shape[0]):
+        view[i] = alpha * a[i]
+    return out
+
+cdef class DenseDual:
+    """
+    Dual numbers class whose dual component is a contiguous float64 vector indexed by the
+    slots of a VariableSpace.
+    """
+    cdef public double real
+    cdef public np.ndarray tangent
+    cdef public VariableSpace space
+
+    def __init__(self, real_component, tangent, space):
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        if not isinstance(space, VariableSpace):
+            raise TypeError(
+                f"Expected 'space' to be a VariableSpace, but got {type(space).__name__}."
+            )
+        tangent = np.ascontiguousarray(tangent, dtype=np.float64)
+        if tangent.ndim != 1 or len(tangent) > len(space):
+            raise ValueError(
+                f"Expected 'tangent' to be 1-D with at most {len(space)} entries, but got shape {tangent.shape}."
+            )
+        self.real = float(real_component)
+        self.tangent = tangent
+        self.space = space
+
+    @property
+    def dual(self):
+        return dict(zip(self.space.names, self.tangent.tolist()))
+
+    def __repr__(self):
+        return f"DenseDual(real={self.real}, dual={self.dual})"
+
+    cdef inline void _check_space(self, DenseDual other) except *:
+        if other.space is not self.space:
+            raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+
+    def __add__(self, other):
+        cdef DenseDual o
+        if isinstance(other, DenseDual):
+            o = other
+            self._check_space(o)
+            return _make(self.real + o.real, _combine(1.0, self.tangent, 1.0, o.tangent), self.space)
+        return _make(self.real + float(other), self.tangent.copy(), self.space)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        cdef DenseDual o
+        if isinstance(other, DenseDual):
+            o = other
+            self._check_space(o)
+            return _make(self.real - o.real, _combine(1.0, self.tangent, -1.0, o.tangent), self.space)
+        return _make(self.real - float(other), self.tangent.copy(), self.space)
+
+    def __rsub__(self, other):
+        return _make(float(other) - self.real, _scale(-1.0, self.tangent), self.space)
+
+    def __mul__(self, other):
+        cdef DenseDual o
+        cdef double other_float
+        if isinstance(other, DenseDual):
+            o = other
+            self._check_space(o)
+            return _make(self.real * o.real, _combine(o.real, self.tangent, self.real, o.tangent), self.space)
+        other_float = float(other)
+        return _make(self.real * other_float, _scale(other_float, self.tangent), self.space)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        cdef DenseDual o
+        cdef double other_float
+        if isinstance(other, DenseDual):
+            o = other
+            self._check_space(o)
+            if o.real == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            return _make(self.real / o.real,
+                         _combine(1.0 / o.real, self.tangent, -self.real / (o.real * o.real), o.tangent),
+                         self.space)
+        other_float = float(other)
+        if other_float == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _make(self.real / other_float, _scale(1.0 / other_float, self.tangent), self.space)
+
+    def __rtruediv__(self, other):
+        cdef double other_float = float(other)
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return _make(other_float / self.real, _scale(-other_float / (self.real * self.real), self.tangent),
+                     self.space)
+
+    def __pow__(self, other, modulo=None):
+        cdef DenseDual o
+        cdef double other_float, real_part
+        if isinstance(other, DenseDual):
+            o = other
+            self._check_space(o)
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            real_part = self.real ** o.real
+            return _make(real_part,
+                         _combine(o.real * self.real ** (o.real - 1), self.tangent,
+                                  real_part * log(self.real), o.tangent),
+                         self.space)
+        other_float = float(other)
+        return _make(self.real ** other_float,
+                     _scale(other_float * self.real ** (other_float - 1), self.tangent), self.space)
+
+    def __rpow__(self, other, modulo=None):
+        cdef double other_float, real_part
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        other_float = float(other)
+        real_part = other_float ** self.real
+        return _make(real_part, _scale(real_part * log(other_float), self.tangent), self.space)
+
+    def __neg__(self):
+        return _make(-self.real, _scale(-1.0, self.tangent), self.space)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            return _make(float(f(self.real)), _scale(float(fprime(self.real)), self.tangent), self.space)
+
+        return NotImplemented
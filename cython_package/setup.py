@@ -1,6 +1,11 @@
 from setuptools import setup, find_packages, Extension
 from Cython.Build import cythonize
 import numpy as np
+import sys
+
+# OpenMP flags for the threaded array kernels
+openmp_compile_args = ['/openmp'] if sys.platform == 'win32' else ['-fopenmp']
+openmp_link_args = [] if sys.platform == 'win32' else ['-fopenmp']
 
 # Define extensions to be cythonized
 extensions = [
@@ -9,6 +14,43 @@ extensions = [
         ["dual_autodiff_x/dual.pyx"],
         include_dirs=[np.get_include()]
     ),
+    Extension(
+        "dual_autodiff_x.dualn",
+        ["dual_autodiff_x/dualn.pyx"],
+        include_dirs=[np.get_include()]
+    ),
+    Extension(
+        "dual_autodiff_x.kernels",
+        ["dual_autodiff_x/kernels.pyx"],
+        include_dirs=[np.get_include()],
+        extra_compile_args=openmp_compile_args,
+        extra_link_args=openmp_link_args
+    ),
+    Extension(
+        "dual_autodiff_x.dual_array",
+        ["dual_autodiff_x/dual_array.pyx"],
+        include_dirs=[np.get_include()]
+    ),
+    Extension(
+        "dual_autodiff_x.variables",
+        ["dual_autodiff_x/variables.pyx"],
+        include_dirs=[np.get_include()]
+    ),
+    Extension(
+        "dual_autodiff_x.sparse",
+        ["dual_autodiff_x/sparse.pyx"],
+        include_dirs=[np.get_include()]
+    ),
+    Extension(
+        "dual_autodiff_x.hyperdual",
+        ["dual_autodiff_x/hyperdual.pyx"],
+        include_dirs=[np.get_include()]
+    ),
+    Extension(
+        "dual_autodiff_x.taylor",
+        ["dual_autodiff_x/taylor.pyx"],
+        include_dirs=[np.get_include()]
+    ),
     Extension(
         "dual_autodiff_x.tools",
         ["dual_autodiff_x/tools.pyx"],
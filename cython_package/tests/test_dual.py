@@ -0,0 +1,63 @@
+# test_dual.py
+import pickle
+import pytest
+import numpy as np
+import dual_autodiff_x
+from dual_autodiff_x import Dual
+
+reference = pytest.importorskip("dual_autodiff")
+
+def _function(x, y):
+    return x * y + np.sin(x) / y - y**2.5 + np.exp(x) - 3 / x + 2**y - (x - 1.5) + np.sqrt(y) * np.log(x) + x**y
+
+def test_dual_matches_python_package():
+    """
+    Test that Dual arithmetic and ufuncs match the Python package.
+    """
+    result = _function(Dual(0.7, {'x': 1.0}), Dual(1.3, {'y': 1.0, 'z': 2.0}))
+    expected = _function(reference.Dual(0.7, {'x': 1.0}), reference.Dual(1.3, {'y': 1.0, 'z': 2.0}))
+    assert isinstance(result, Dual)
+    assert result.real == pytest.approx(expected.real)
+    assert result.dual == pytest.approx(expected.dual)
+    assert repr(-Dual(2.0, {'x': 1.0})) == repr(-reference.Dual(2.0, {'x': 1.0}))
+    assert repr(Dual(0, {}) ** 0.5) == repr(reference.Dual(0, {}) ** 0.5)
+
+def test_dual_results_own_their_dual():
+    """
+    Test that results built by the fast constructor do not share dual dicts with their operands,
+    and that Dual numbers reused from the freelist start from their own values.
+    """
+    x = Dual(2.0, {'x': 1.0})
+    results = [x + 0, x * 1, x - 0, x / 1, x ** 1, -(-x)]
+    for result in results:
+        assert result.dual is not x.dual
+        result.dual['x'] = 5.0
+    assert x.dual == {'x': 1.0}
+
+    for _ in range(3): #cycles Dual numbers through the freelist
+        values = [Dual(float(i), {'x': float(i)}) * 2 for i in range(1000)]
+        assert all(d.real == 2 * i and d.dual == {'x': 2.0 * i} for i, d in enumerate(values))
+        del values
+
+    restored = pickle.loads(pickle.dumps(x * Dual(3.0, {'y': 1.0})))
+    assert isinstance(restored, Dual)
+    assert restored.real == 6.0 and restored.dual == {'x': 3.0, 'y': 2.0}
+
+def test_dual_in_place_matches_python_package():
+    """
+    Test that the in-place operators give the Python package's results and update the left operand.
+    """
+    results = []
+    for module in (dual_autodiff_x, reference):
+        x = module.Dual(2.0, {'x': 1.0})
+        alias = x
+        x += module.Dual(1.0, {'y': 2.0})
+        x *= 3
+        x -= 1
+        x /= module.Dual(2.0, {'x': 1.0})
+        assert alias is x
+        x *= x
+        results.append(x)
+    result, expected = results
+    assert result.real == pytest.approx(expected.real)
+    assert result.dual == pytest.approx(expected.dual)
@@ -0,0 +1,31 @@
+# test_dualn.py
+import pytest
+import numpy as np
+from dual_autodiff_x import DualN
+
+class Scale:
+    """
+    Operand that handles its own operators with DualN numbers.
+    """
+    def __radd__(self, other):
+        return 'radd'
+
+    def __rmul__(self, other):
+        return 'rmul'
+
+def test_dualn_defers_to_other_operands():
+    """
+    Test that DualN arithmetic returns NotImplemented for operands it cannot treat as constants.
+    """
+    x, y = DualN.inputs([2.0, 3.0])
+    assert x + Scale() == 'radd' and x * Scale() == 'rmul'
+    for op in (lambda a, b: a + b, lambda a, b: a - b, lambda a, b: a * b, lambda a, b: a / b, lambda a, b: a ** b):
+        with pytest.raises(TypeError):
+            op(x, 's')
+        with pytest.raises(TypeError):
+            op('s', x)
+
+    # Python and NumPy numbers are still constants
+    z = (x * np.float64(2.0) + 1) / 2 - np.int64(1)
+    assert z.real == 1.5 and list(z.dual) == [1.0, 0.0]
+    assert (2 ** y).real == 8.0
@@ -0,0 +1,43 @@
+# test_hyperdual.py
+import pytest
+import numpy as np
+import dual_autodiff_x
+from dual_autodiff_x import VariableSpace, HyperDual, hessian
+
+reference = pytest.importorskip("dual_autodiff")
+
+def _function(p):
+    x, y = p[0], p[1]
+    return x * y + np.sin(x) / y - y**2.5 + np.exp(x) - 3 / x + 2**y + np.sqrt(y) * np.log(x) + x**y
+
+def test_hyperdual_matches_python_package():
+    """
+    Test that HyperDual values, gradients and Hessians match the Python package.
+    """
+    space, expected_space = VariableSpace(), reference.VariableSpace()
+    result = _function([HyperDual.variable('x', 0.7, space), HyperDual.variable('y', 1.3, space)])
+    expected = _function([reference.HyperDual.variable('x', 0.7, expected_space),
+                          reference.HyperDual.variable('y', 1.3, expected_space)])
+    assert isinstance(result, HyperDual)
+    assert result.real == pytest.approx(expected.real)
+    assert np.allclose(result.gradient, expected.gradient)
+    assert np.allclose(result.hessian, expected.hessian)
+
+    point = np.array([0.7, 1.3])
+    assert np.allclose(hessian(_function, point), reference.hessian(_function, point))
+    assert np.allclose(hessian(lambda x: 1 / x**2, 0.5), reference.hessian(lambda x: 1 / x**2, 0.5))
+
+def test_hyperdual_requires_second_derivative():
+    """
+    Test that functions registered without a second derivative are rejected like in the Python package.
+    """
+    for module in (dual_autodiff_x, reference):
+        x = module.HyperDual.variable('x', 0.5, module.VariableSpace())
+        with pytest.raises(TypeError):
+            np.cbrt(x) #not registered
+        module.tools.add_function('cbrt', np.cbrt, lambda x: x**(-2 / 3) / 3)
+        try:
+            with pytest.raises(ValueError):
+                np.cbrt(x)
+        finally:
+            module.tools.remove_function('cbrt')
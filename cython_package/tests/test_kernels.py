@@ -0,0 +1,79 @@
+# test_kernels.py
+import pytest
+import numpy as np
+from dual_autodiff_x import DualArray, set_num_threads, get_num_threads
+from dual_autodiff_x.kernels import scale, combine, apply_rule
+from dual_autodiff_x.tools import get_implementation
+
+@pytest.fixture
+def threads():
+    """
+    Restores the thread count after a test changes it.
+    """
+    previous = get_num_threads()
+    yield
+    set_num_threads(previous)
+
+def test_num_threads_round_trip(threads):
+    """
+    Test that the thread count set is the one reported, and that it must be positive.
+    """
+    set_num_threads(3)
+    assert get_num_threads() == 3
+    set_num_threads(1)
+    assert get_num_threads() == 1
+    with pytest.raises(ValueError):
+        set_num_threads(0)
+    assert get_num_threads() == 1
+
+def _run_kernels(x, a, b):
+    scaled = np.empty_like(a)
+    scale(x, a, scaled)
+    combined = np.empty_like(a)
+    combine(x, a, 2.0 * x, b, combined)
+    values, slopes = np.empty_like(x), np.empty_like(x)
+    apply_rule(get_implementation(np.sin), x, values, slopes)
+    return scaled, combined, values, slopes
+
+def test_kernels_match_numpy_on_any_thread_count(threads):
+    """
+    Test the kernels against NumPy, with identical results on one and on several threads.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.random(50000) #large enough to be split over threads
+    a, b = rng.random((50000, 3)), rng.random((50000, 3))
+
+    set_num_threads(1)
+    serial = _run_kernels(x, a, b)
+    set_num_threads(4)
+    parallel = _run_kernels(x, a, b)
+    for one, many in zip(serial, parallel):
+        np.testing.assert_array_equal(one, many)
+
+    scaled, combined, values, slopes = parallel
+    np.testing.assert_allclose(scaled, x[:, None] * a)
+    np.testing.assert_allclose(combined, x[:, None] * a + 2.0 * x[:, None] * b)
+    np.testing.assert_allclose(values, np.sin(x))
+    np.testing.assert_allclose(slopes, np.cos(x))
+
+    # DualArray operations built on the kernels agree as well
+    set_num_threads(1)
+    u, v = DualArray.from_inputs(u=x, v=x + 1.0)
+    expected = np.sin(u) * v / (u + 1.0)
+    set_num_threads(4)
+    result = np.sin(u) * v / (u + 1.0)
+    np.testing.assert_array_equal(result.real, expected.real)
+    np.testing.assert_array_equal(result.dual, expected.dual)
+
+def test_apply_rule_needs_a_builtin_rule():
+    """
+    Test that rules without C kernels are rejected.
+    """
+    from dual_autodiff_x.tools import add_function, remove_function
+    add_function('expm1', np.expm1, np.exp)
+    try:
+        x = np.ones(3)
+        with pytest.raises(ValueError):
+            apply_rule(get_implementation(np.expm1), x, np.empty(3), np.empty(3))
+    finally:
+        remove_function('expm1')
@@ -0,0 +1,33 @@
+# test_taylor.py
+import pytest
+import numpy as np
+import dual_autodiff_x
+from dual_autodiff_x import Taylor, taylor_derivatives
+
+reference = pytest.importorskip("dual_autodiff")
+
+def _function(t):
+    return np.sin(t) * np.exp(t) / (1 + t**2) + np.sqrt(t) * np.log(t) - 3**t + t**t + np.arctan(2 * t) - np.cosh(t)
+
+def test_taylor_matches_python_package():
+    """
+    Test that Taylor coefficients and derivatives match the Python package.
+    """
+    result, expected = _function(Taylor.variable(0.7, 6)), _function(reference.Taylor.variable(0.7, 6))
+    assert isinstance(result, Taylor)
+    assert result.degree == expected.degree
+    assert np.allclose(result.coefficients, expected.coefficients)
+    assert np.allclose(result.derivatives(), expected.derivatives())
+    assert np.allclose(taylor_derivatives(_function, 0.7, 8), reference.taylor_derivatives(_function, 0.7, 8))
+
+def test_taylor_degrees_match_python_package():
+    """
+    Test that mixed degrees are truncated and invalid degrees rejected like in the Python package.
+    """
+    for module in (dual_autodiff_x, reference):
+        mixed = module.Taylor.variable(2.0, 3) + module.Taylor.variable(1.0, 2)
+        assert mixed.degree == 2 and np.array_equal(mixed.coefficients, [3.0, 2.0, 0.0])
+        with pytest.raises(ValueError):
+            module.Taylor.variable(1.0, -1)
+        with pytest.raises(ValueError):
+            module.Taylor([])
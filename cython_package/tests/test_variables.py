@@ -0,0 +1,37 @@
+# test_variables.py
+import pytest
+import numpy as np
+import dual_autodiff_x
+from dual_autodiff_x import VariableSpace, DenseDual
+
+reference = pytest.importorskip("dual_autodiff")
+
+def _function(x, y):
+    return x * y + np.sin(x) / y - y**2.5 + np.exp(x) - 3 / x + 2**y - (x - 1.5) + np.sqrt(y) * np.log(x)
+
+def test_dense_dual_matches_python_package():
+    """
+    Test that DenseDual arithmetic and ufuncs match the Python package.
+    """
+    space, expected_space = VariableSpace(['x', 'y']), reference.VariableSpace(['x', 'y'])
+    result = _function(space.variable('x', 0.7), space.variable('y', 1.3))
+    expected = _function(expected_space.variable('x', 0.7), expected_space.variable('y', 1.3))
+    assert isinstance(result, DenseDual)
+    assert result.real == pytest.approx(expected.real)
+    assert np.allclose(result.tangent, expected.tangent)
+    assert result.dual == pytest.approx(expected.dual)
+
+def test_variable_space_matches_python_package():
+    """
+    Test that slots, growth of the space and mixing spaces behave like the Python package.
+    """
+    for module in (dual_autodiff_x, reference):
+        space = module.VariableSpace(['a'])
+        a, b = space.variable('a', 2.0), space.variable('b', 3.0)
+        product = a * b #a was created before b grew the space
+        assert product.dual == {'a': 3.0, 'b': 2.0}
+        assert np.array_equal(product.tangent, [3.0, 2.0])
+        assert space.slot('c') == 2 and list(space) == ['a', 'b', 'c']
+        assert np.array_equal(space.dual(1.0, {'a': 2.0, 'd': 1.0}).tangent, [2.0, 0.0, 0.0, 1.0])
+        with pytest.raises(ValueError):
+            a * module.VariableSpace(['a']).variable('a', 1.0)
@@ -1,2 +1,17 @@
 from .dual import Dual
+from .dual_array import DualArray
+from .variables import VariableSpace, DenseDual
+from .sparse import SparseDual
+from .hyperdual import HyperDual, hessian
+from .taylor import Taylor, taylor_derivatives
+from .reverse import Tape, Var, grad, vjp
+from .derivatives import jacobian, gradient
+from .compiler import compile, CompiledFunction
+from .incremental import IncrementalFunction
+from .memo import memoize
+from .parallel import evaluate_many
+from .batching import BatchEvaluator
+from .streaming import stream_derivatives
+from .out_of_core import jacobian_to_disk
+from .serialization import to_bytes, from_bytes
 from .tools import *
\ No newline at end of file
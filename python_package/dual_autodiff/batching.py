@@ -0,0 +1,162 @@
+import asyncio
+import numpy as np
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from dual_autodiff.dual_array import DualArray
+
+def _evaluate_batch(f: Callable, points: np.ndarray, shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates `f` and its Jacobian at a batch of points in one vectorized call, with one DualArray
+    per coordinate holding that coordinate of every point.
+
+    Args:
+        f (Callable): the function, called with a DualArray for scalar points or a list of
+        DualArrays, one per coordinate. It may return a value or a list or tuple of values.
+        points (np.ndarray): the points, one row per point.
+        shape (Tuple[int, ...]): the shape of a single point.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the values, with shape (number of points,) + output shape,
+        and the Jacobians, with shape (number of points,) + output shape + `shape`.
+    """
+    m, n = points.shape
+    variables = tuple(f"d{j}" for j in range(n))
+    inputs = list(DualArray.from_inputs(**{var: points[:, j] for j, var in enumerate(variables)}))
+    result = f(inputs[0] if shape == () else inputs)
+    items = list(result) if isinstance(result, (list, tuple)) else [result]
+    outputs = np.empty(len(items) if isinstance(result, (list, tuple)) else (), dtype=object)
+    for index, item in zip(np.ndindex(outputs.shape), items):
+        outputs[index] = item
+    values = np.zeros((m,) + outputs.shape)
+    jac = np.zeros((m,) + outputs.shape + (n,))
+    for index, out in np.ndenumerate(outputs):
+        if isinstance(out, DualArray):
+            values[(slice(None),) + index] = out.real
+            for j, var in enumerate(variables):
+                jac[(slice(None),) + index + (j,)] = out.partial(var)
+        else:
+            values[(slice(None),) + index] = out
+    return values, jac.reshape((m,) + outputs.shape + shape)
+
+class BatchEvaluator:
+    """
+    Asynchronous front-end that coalesces derivative requests from many asyncio tasks into
+    vectorized evaluations. Requests for the same function and point shape wait until
+    `max_batch_size` of them are pending or the oldest has waited `max_latency` seconds, and are
+    then evaluated together on DualArrays in `executor`, off the event loop.
+
+    The function is called with one DualArray per coordinate, holding that coordinate of every
+    point in the batch, so it must only use operations DualArray supports and must not branch on
+    values. An exception raised by the function is raised by every request of its batch.
+
+    Args:
+        max_batch_size (int): the most points evaluated in one call.
+        max_latency (float): the longest a request waits for its batch to fill, in seconds.
+        executor (Optional[Executor]): where batches are evaluated. Defaults to the event loop's
+        default thread pool.
+
+    Raises:
+        ValueError: If `max_batch_size` is not positive or `max_latency` is negative.
+
+    Example:
+        >>> from dual_autodiff.batching import BatchEvaluator
+        >>> def f(p):
+        >>>     return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+        >>> async def main():
+        >>>     async with BatchEvaluator(max_batch_size=256, max_latency=0.002) as evaluator:
+        >>>         return await asyncio.gather(*[evaluator.submit(f, [x, 1.0]) for x in np.linspace(0, 1, 1000)])
+        >>> results = asyncio.run(main()) #(value, gradient) per point, in 4 batches
+    """
+    def __init__(self, max_batch_size: int = 64, max_latency: float = 0.002, executor: Optional[Executor] = None):
+        """
+        Args:
+            max_batch_size (int): the most points evaluated in one call.
+            max_latency (float): the longest a request waits for its batch to fill, in seconds.
+            executor (Optional[Executor]): where batches are evaluated. Defaults to the event
+            loop's default thread pool.
+
+        Raises:
+            ValueError: If `max_batch_size` is not positive or `max_latency` is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"Expected 'max_batch_size' to be positive, but got {max_batch_size}.")
+        if max_latency < 0:
+            raise ValueError(f"Expected 'max_latency' to be non-negative, but got {max_latency}.")
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.executor = executor
+        self.batches = 0
+        self._pending: Dict[tuple, List[tuple]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._running: Set[asyncio.Task] = set()
+
+    async def submit(self, f: Callable, x) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluates `f` and its Jacobian at `x`, batched with other pending requests for `f`.
+
+        Args:
+            f (Callable): the function, called like in `jacobian` but with DualArrays.
+            x (Union[float, np.ndarray]): the point to evaluate at.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the value of `f`, and its Jacobian with shape
+            `np.shape(value) + np.shape(x)`.
+        """
+        loop = asyncio.get_running_loop()
+        point = np.asarray(x, dtype=float)
+        key = (f, point.shape)
+        future = loop.create_future()
+        queue = self._pending.setdefault(key, [])
+        queue.append((point.ravel(), future))
+        if len(queue) >= self.max_batch_size:
+            self._flush(key)
+        elif len(queue) == 1:
+            self._timers[key] = loop.call_later(self.max_latency, self._flush, key)
+        return await future
+
+    def _flush(self, key: tuple) -> None:
+        """
+        Starts evaluating the pending requests of `key` as one batch.
+        """
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(key, batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, key: tuple, batch: List[tuple]) -> None:
+        """
+        Evaluates a batch in the executor and resolves the futures of its requests.
+        """
+        f, shape = key
+        self.batches += 1
+        points = np.stack([point for point, _ in batch])
+        try:
+            values, jacobians = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _evaluate_batch, f, points, shape)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), value, jac in zip(batch, values, jacobians):
+            if not future.done():
+                future.set_result((value, jac))
+
+    async def flush(self) -> None:
+        """
+        Evaluates every pending request now and waits for all running batches.
+        """
+        for key in list(self._pending):
+            self._flush(key)
+        if self._running:
+            await asyncio.gather(*self._running)
+
+    async def __aenter__(self) -> 'BatchEvaluator':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.flush()
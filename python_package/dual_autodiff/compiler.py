@@ -0,0 +1,506 @@
+import inspect
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.tools import get_implementation, registry_version
+
+# Arithmetic ufuncs and the Tracer methods recording them, as in Var.__array_ufunc__
+_operators = {
+    np.add: ('__add__', '__radd__'),
+    np.subtract: ('__sub__', '__rsub__'),
+    np.multiply: ('__mul__', '__rmul__'),
+    np.divide: ('__truediv__', '__rtruediv__'),
+    np.power: ('__pow__', '__rpow__'),
+}
+
+class Graph:
+    """
+    Operation graph recorded by tracing a function with Tracer objects. Each node is an
+    (operation, argument indices, payload) triple, in the order the operations were applied, so
+    the nodes can be replayed as a straight-line program.
+
+    The operations are 'input' (payload: position of the argument), 'const' (payload: the value),
+    'add', 'sub', 'mul', 'div', 'pow', 'neg' and 'call' (payload: name of the tools function).
+    The (function, derivative) pair of every 'call' node is kept in `rules`, as registered when
+    the function was traced.
+    """
+    def __init__(self):
+        self.nodes: List[Tuple[str, Tuple[int, ...], object]] = []
+        self.rules: Dict[str, Tuple[Callable, Callable]] = {}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def input(self, position: int) -> 'Tracer':
+        """
+        Records the argument at `position` of the traced function.
+
+        Returns:
+            Tracer: the recorded input.
+        """
+        return self._record('input', (), position)
+
+    def constant(self, value) -> 'Tracer':
+        """
+        Records a constant used by the traced function.
+
+        Returns:
+            Tracer: the recorded constant.
+        """
+        return self._record('const', (), float(value))
+
+    def _record(self, op: str, args: Tuple[int, ...], payload=None) -> 'Tracer':
+        """
+        Appends a node to the graph.
+
+        Args:
+            op (str): the operation.
+            args (Tuple[int, ...]): indices of the argument nodes.
+            payload (object): the input position, constant value or function name of the node.
+
+        Returns:
+            Tracer: the recorded node.
+        """
+        self.nodes.append((op, args, payload))
+        return Tracer(self, len(self.nodes) - 1)
+
+    def active(self) -> List[bool]:
+        """
+        Finds the nodes that depend on an input, and so carry a tangent.
+
+        Returns:
+            List[bool]: for every node, whether it depends on an input.
+        """
+        active = []
+        for op, args, _ in self.nodes:
+            active.append(op == 'input' or any(active[arg] for arg in args))
+        return active
+
+def _untraceable(*args):
+    raise TypeError(
+        "Compiled functions cannot use the value of a traced input, e.g. in 'if' statements, "
+        "comparisons or float(); use NumPy functions of the inputs instead."
+    )
+
+class Tracer:
+    """
+    Placeholder for a value of a function being compiled. Operators and NumPy ufuncs applied to
+    a Tracer are recorded on its Graph instead of being computed. Tracers have no value, so
+    branching on them, comparing them or converting them to numbers raises a TypeError.
+
+    Args:
+        graph (Graph): the graph the node is recorded on.
+        index (int): position of the node on the graph.
+    """
+    def __init__(self, graph: Graph, index: int):
+        """
+        Args:
+            graph (Graph): the graph the node is recorded on.
+            index (int): position of the node on the graph.
+        """
+        self.graph = graph
+        self.index = index
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Tracer.
+
+        Returns:
+            string: a string in the format "Tracer(op=<operation>, index=<index>)".
+        """
+        return f"Tracer(op={self.graph.nodes[self.index][0]}, index={self.index})"
+
+    __bool__ = __float__ = __int__ = __index__ = _untraceable
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _untraceable
+    __hash__ = object.__hash__
+
+    def _operand(self, other) -> Optional[int]:
+        """
+        Returns the node index of `other`, recording it as a constant if it is a number, or None
+        if it cannot be used in a traced operation.
+
+        Raises:
+            ValueError: If `other` is a Tracer recorded on a different graph.
+        """
+        if isinstance(other, Tracer):
+            if other.graph is not self.graph:
+                raise ValueError("Cannot combine Tracers recorded on different graphs.")
+            return other.index
+        if isinstance(other, (int, float, np.number)):
+            return self.graph.constant(other).index
+        return None
+
+    def _binary(self, op: str, other, reflected: bool = False):
+        """
+        Records a binary operation between the current Tracer and `other`.
+
+        Returns:
+            Tracer or NotImplemented: the recorded node.
+        """
+        index = self._operand(other)
+        if index is None:
+            return NotImplemented
+        args = (index, self.index) if reflected else (self.index, index)
+        return self.graph._record(op, args)
+
+    def __add__(self, other):
+        return self._binary('add', other)
+
+    def __radd__(self, other):
+        return self._binary('add', other, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary('sub', other)
+
+    def __rsub__(self, other):
+        return self._binary('sub', other, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary('mul', other)
+
+    def __rmul__(self, other):
+        return self._binary('mul', other, reflected=True)
+
+    def __truediv__(self, other):
+        """
+        Raises:
+            ZeroDivisionError: if the divisor is the constant zero.
+        """
+        if not isinstance(other, Tracer) and other == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return self._binary('div', other)
+
+    def __rtruediv__(self, other):
+        return self._binary('div', other, reflected=True)
+
+    def __pow__(self, other):
+        return self._binary('pow', other)
+
+    def __rpow__(self, other):
+        """
+        Raises:
+            ValueError: If `other` is non-positive.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        return self._binary('pow', other, reflected=True)
+
+    def __neg__(self):
+        return self.graph._record('neg', (self.index,))
+
+    def __pos__(self):
+        return self
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Records NumPy universal functions (ufuncs) applied to the Tracer. The derivative of each
+        function is taken from the tools module when the function is traced.
+
+        Returns:
+            Tracer or NotImplemented:
+                - The recorded node if the ufunc is supported.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in _operators:
+            forward, reflected = _operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            self.graph.rules[ufunc.__name__] = implementation
+            return self.graph._record('call', (self.index,), ufunc.__name__)
+
+        return NotImplemented
+
+def _tangent_terms(op: str, i: int, v: List[str], t: List[Optional[str]], payload) -> List[Tuple[str, str]]:
+    """
+    Writes the forward-mode derivative rule of a node as signed terms, one per argument that
+    carries a tangent.
+
+    Args:
+        op (str): the operation of the node.
+        i (int): index of the node.
+        v (List[str]): names of the argument values.
+        t (List[Optional[str]]): names of the argument tangents, None for arguments without one.
+        payload (object): payload of the node.
+
+    Returns:
+        List[Tuple[str, str]]: the (sign, expression) terms of the tangent of the node.
+    """
+    if op == 'add':
+        terms = [('+', t[0]), ('+', t[1])]
+    elif op == 'sub':
+        terms = [('+', t[0]), ('-', t[1])]
+    elif op == 'neg':
+        terms = [('-', t[0])]
+    elif op == 'mul' and v[0] == v[1]:
+        terms = [('+', t[0] and f"2.0 * {t[0]} * {v[0]}")]
+    elif op == 'mul':
+        terms = [('+', t[0] and f"{t[0]} * {v[1]}"), ('+', t[1] and f"{t[1]} * {v[0]}")]
+    elif op == 'div':
+        terms = [('+', t[0] and f"{t[0]} / {v[1]}"), ('-', t[1] and f"{t[1]} * (v{i} / {v[1]})")]
+    elif op == 'pow':
+        terms = [('+', t[0] and f"{t[0]} * ({v[1]} * {v[0]} ** ({v[1]} - 1))"),
+                 ('+', t[1] and f"{t[1]} * (v{i} * np.log({v[0]}))")]
+    else:
+        terms = [('+', f"{t[0]} * d_{payload}({v[0]})")]
+    return [(sign, expression) for sign, expression in terms if expression]
+
+def _python_source(graph: Graph, outputs: Sequence[int], n_inputs: int) -> str:
+    """
+    Writes the graph as the source of a straight-line Python function of the inputs and their unit
+    tangents. Values and tangents are NumPy arrays; tangents have the variables on their first axis
+    so they broadcast against values. Constant nodes are not written: they are passed in as globals.
+
+    Args:
+        graph (Graph): the traced graph.
+        outputs (Sequence[int]): indices of the output nodes.
+        n_inputs (int): number of inputs of the traced function.
+
+    Returns:
+        str: the source of `evaluate(x0, ..., e0, ...)`, returning (value, tangent) per output,
+        with a tangent of None for outputs that do not depend on the inputs.
+    """
+    symbols = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/', 'pow': '**'}
+    active = graph.active()
+    signature = ", ".join([f"x{k}" for k in range(n_inputs)] + [f"e{k}" for k in range(n_inputs)])
+    lines = [f"def evaluate({signature}):"]
+    for i, (op, args, payload) in enumerate(graph.nodes):
+        v = [f"v{arg}" for arg in args]
+        t = [f"t{arg}" if active[arg] else None for arg in args]
+        if op == 'const':
+            continue
+        if op == 'input':
+            lines.append(f"    v{i} = x{payload}")
+            lines.append(f"    t{i} = e{payload}")
+            continue
+        if op == 'call':
+            lines.append(f"    v{i} = f_{payload}({v[0]})")
+        elif op == 'neg':
+            lines.append(f"    v{i} = -{v[0]}")
+        else:
+            lines.append(f"    v{i} = {v[0]} {symbols[op]} {v[1]}")
+        if active[i]:
+            terms = _tangent_terms(op, i, v, t, payload)
+            tangent = ("-" if terms[0][0] == '-' else "") + terms[0][1]
+            for sign, expression in terms[1:]:
+                tangent += f" {sign} {expression}"
+            lines.append(f"    t{i} = {tangent}")
+    results = [f"(v{out}, t{out})" if active[out] else f"(v{out}, None)" for out in outputs]
+    lines.append(f"    return ({', '.join(results)},)")
+    return "\n".join(lines) + "\n"
+
+def trace(f: Callable, n_inputs: int) -> Tuple[Graph, Tuple[int, ...], bool]:
+    """
+    Traces a function into a Graph by calling it once with one Tracer per input.
+
+    Args:
+        f (Callable): the function, taking one scalar per input and returning a scalar or a tuple
+        of scalars.
+        n_inputs (int): number of inputs of the function.
+
+    Returns:
+        Tuple[Graph, Tuple[int, ...], bool]: the graph, the indices of the output nodes, and whether
+        the function returns a single value rather than a tuple.
+
+    Raises:
+        TypeError: If `f` uses the value of an input, or returns something other than scalars.
+    """
+    graph = Graph()
+    result = f(*[graph.input(k) for k in range(n_inputs)])
+    single = not isinstance(result, (tuple, list))
+    outputs = []
+    for out in ([result] if single else result):
+        if isinstance(out, Tracer):
+            outputs.append(out.index)
+        elif isinstance(out, (int, float, np.number)):
+            outputs.append(graph.constant(out).index)
+        else:
+            raise TypeError(
+                f"Compiled functions must return scalars or tuples of scalars, but got {type(out).__name__}."
+            )
+    return graph, tuple(outputs), single
+
+def _dual_array(value, tangent, shape: Tuple[int, ...], variables: Tuple[str, ...]) -> DualArray:
+    """
+    Packs the value and tangent of an output into a DualArray of the broadcast input shape.
+
+    Args:
+        value (Union[float, np.ndarray]): the value, broadcastable to `shape`.
+        tangent (Optional[np.ndarray]): the tangent with the variables on its first axis, or None
+        if the output does not depend on the inputs.
+        shape (Tuple[int, ...]): shape of the broadcast inputs.
+        variables (Tuple[str, ...]): names of the inputs.
+
+    Returns:
+        DualArray: the output with its derivatives.
+    """
+    real = np.array(np.broadcast_to(value, shape), dtype=float)
+    if tangent is None:
+        return DualArray(real, np.zeros(shape + (len(variables),)), variables)
+    dual = np.moveaxis(np.asarray(tangent, dtype=float), 0, -1)
+    return DualArray(real, np.array(np.broadcast_to(dual, shape + (len(variables),))), variables)
+
+class CompiledFunction:
+    """
+    Function traced once into a Graph and replayed as a straight-line NumPy program. Each call
+    evaluates the function and its derivatives with respect to every input over whole arrays of
+    inputs, without dispatching the operators of each value through Dual numbers.
+
+    The function is traced with one Tracer per input, so it may only combine its inputs with
+    arithmetic operators and the NumPy ufuncs registered in the tools module. Branching on, comparing
+    or converting an input raises a TypeError when the function is compiled. The function is traced
+    again if the tools registry changes.
+
+    With backend='native', the graph is instead written as a Cython kernel (see the native module)
+    that is compiled once and cached on disk, so later processes load it without compiling.
+
+    Args:
+        f (Callable): the function, taking one scalar per input and returning a scalar or a tuple
+        of scalars.
+        variables (Optional[Sequence[str]]): names of the inputs. Defaults to the parameter names of `f`.
+        backend (str): 'python' for a NumPy evaluator, or 'native' for a compiled C kernel.
+        optimized (bool): whether to simplify the traced graph with `optimize.optimize`.
+
+    Raises:
+        TypeError: If `f` uses the value of an input, or returns something other than scalars.
+        ValueError: If the backend is unknown, or the native backend meets a function without a C implementation.
+    """
+    def __init__(self, f: Callable, variables: Optional[Sequence[str]] = None, backend: str = 'python',
+                 optimized: bool = True):
+        """
+        Args:
+            f (Callable): the function, taking one scalar per input and returning a scalar or a
+            tuple of scalars.
+            variables (Optional[Sequence[str]]): names of the inputs. Defaults to the parameter names of `f`.
+            backend (str): 'python' for a NumPy evaluator, or 'native' for a compiled C kernel.
+            optimized (bool): whether to simplify the traced graph with `optimize.optimize`.
+
+        Raises:
+            TypeError: If `f` uses the value of an input, or returns something other than scalars.
+            ValueError: If the backend is unknown, or the native backend meets a function without
+            a C implementation.
+        """
+        if backend not in ('python', 'native'):
+            raise ValueError(f"Expected 'backend' to be 'python' or 'native', but got {backend!r}.")
+        self.backend = backend
+        self.optimized = optimized
+        if variables is None:
+            variables = [name for name, parameter in inspect.signature(f).parameters.items()
+                         if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)]
+        self.f = f
+        self.variables = tuple(variables)
+        self._trace()
+
+    def _trace(self) -> None:
+        """
+        Traces the function into a Graph and builds its straight-line evaluator.
+        """
+        self._version = registry_version()
+        graph, self.outputs, self._single = trace(self.f, len(self.variables))
+        if self.optimized:
+            from dual_autodiff.optimize import optimize
+            graph, self.outputs = optimize(graph, self.outputs)
+        self.graph = graph
+        if self.backend == 'native':
+            from dual_autodiff.native import cython_source, load_kernel
+            self.source = cython_source(graph, self.outputs, len(self.variables))
+            self._kernel = load_kernel(self.f, graph, self.source)
+            return
+        self.source = _python_source(graph, self.outputs, len(self.variables))
+        namespace = {'np': np}
+        for i, (op, _, payload) in enumerate(graph.nodes):
+            if op == 'const':
+                namespace[f"v{i}"] = payload
+        for name, (func, derivative) in graph.rules.items():
+            namespace[f"f_{name}"], namespace[f"d_{name}"] = func, derivative
+        exec(self.source, namespace)
+        self._evaluate = namespace['evaluate']
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __call__(self, *inputs):
+        """
+        Evaluates the function and its derivatives.
+
+        Args:
+            *inputs (Union[float, np.ndarray]): one value or array of values per input; arrays are
+            broadcast against each other.
+
+        Returns:
+            Union[DualArray, Tuple[DualArray, ...]]: the value of each output with its derivatives
+            with respect to every input, named after `variables`.
+
+        Raises:
+            TypeError: If the number of inputs does not match the function.
+        """
+        if len(inputs) != len(self.variables):
+            raise TypeError(f"Expected {len(self.variables)} inputs, but got {len(inputs)}.")
+        if self._version != registry_version():
+            self._trace()
+        n = len(self.variables)
+        arrays = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in inputs])
+        shape = arrays[0].shape if arrays else ()
+        if self.backend == 'native':
+            return self._call_native(arrays, shape)
+        unit = np.eye(n).reshape((n, n) + (1,) * len(shape))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            evaluated = self._evaluate(*arrays, *unit)
+        results = tuple(_dual_array(value, tangent, shape, self.variables) for value, tangent in evaluated)
+        return results[0] if self._single else results
+
+    def _call_native(self, arrays: List[np.ndarray], shape: Tuple[int, ...]):
+        """
+        Evaluates the function and its derivatives with the compiled kernel.
+
+        Returns:
+            Union[DualArray, Tuple[DualArray, ...]]: as for `__call__`.
+        """
+        n, size = len(self.variables), int(np.prod(shape))
+        stacked = np.ascontiguousarray(np.reshape(arrays, (n, size)))
+        values = np.empty((len(self.outputs), size))
+        tangents = np.empty((len(self.outputs), size, n))
+        self._kernel(stacked, values, tangents)
+        results = tuple(DualArray(values[j].reshape(shape), tangents[j].reshape(shape + (n,)), self.variables)
+                        for j in range(len(self.outputs)))
+        return results[0] if self._single else results
+
+def compile(f: Callable, variables: Optional[Sequence[str]] = None, backend: str = 'python',
+            optimized: bool = True) -> CompiledFunction:
+    """
+    Compiles a function of scalars into a straight-line evaluator of its values and derivatives.
+    The function is traced once; every call then runs over whole NumPy arrays of inputs.
+
+    Args:
+        f (Callable): the function, taking one scalar per input and returning a scalar or a tuple
+        of scalars. It may use arithmetic operators and the NumPy ufuncs registered in the tools module.
+        variables (Optional[Sequence[str]]): names of the inputs. Defaults to the parameter names of `f`.
+        backend (str): 'python' for a NumPy evaluator, or 'native' for a C kernel compiled with
+        Cython and cached on disk (needs Cython and a C compiler the first time).
+        optimized (bool): whether to simplify the traced graph (common subexpressions, constants,
+        integer powers) before building the evaluator.
+
+    Returns:
+        CompiledFunction: a function of one array per input returning a DualArray per output.
+
+    Raises:
+        TypeError: If `f` branches on, compares or converts the value of an input.
+        ValueError: If the native backend meets a function without a C implementation.
+
+    Example:
+        >>> from dual_autodiff import compile
+        >>> fmv = compile(lambda x, y: y**2 * np.sinh(3 * x + 2) + 2 * y + x)
+        >>> result = fmv(np.linspace(0, 1, 5), 1.0)
+        >>> result.partial('x') #df/dx at every point
+    """
+    return CompiledFunction(f, variables, backend, optimized)
@@ -0,0 +1,117 @@
+import numpy as np
+from typing import Callable, Optional
+from dual_autodiff.variables import VariableSpace, DenseDual
+
+# Widest tangent carried through a forward pass when no chunk size is given
+MAX_CHUNK_SIZE = 16
+
+def default_chunk_size(n: int) -> int:
+    """
+    Picks the number of directions to seed per forward pass for a function of `n` inputs.
+    The fewest passes with tangents at most MAX_CHUNK_SIZE wide are used, and the inputs are then
+    split evenly between them so no pass carries a mostly empty tangent.
+
+    Args:
+        n (int): number of inputs.
+
+    Returns:
+        int: the chunk size.
+
+    Example:
+        >>> default_chunk_size(300) #19 passes of at most 16 directions
+        16
+        >>> default_chunk_size(20) #2 passes of 10 directions
+        10
+    """
+    if n <= MAX_CHUNK_SIZE:
+        return max(n, 1)
+    passes = -(-n // MAX_CHUNK_SIZE)
+    return -(-n // passes)
+
+def jacobian(f: Callable, x, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Computes the Jacobian of `f` at `x` in forward mode, seeding `chunk_size` input directions
+    per pass. Each pass evaluates `f` once on DenseDual numbers whose tangents are `chunk_size`
+    wide, so a function of n inputs takes ceil(n / chunk_size) passes.
+
+    Args:
+        f (Callable): the function. It is called with an object array of DenseDual numbers shaped
+        like `x` (a single DenseDual for scalar `x`) and may return a scalar or an array of values.
+        x (Union[float, np.ndarray]): the point to evaluate at.
+        chunk_size (Optional[int]): number of directions per pass, chosen by
+        `default_chunk_size` if not given.
+
+    Raises:
+        ValueError: If `chunk_size` is not a positive integer.
+
+    Returns:
+        np.ndarray: the Jacobian, with shape `np.shape(f(x)) + np.shape(x)`.
+
+    Example:
+        >>> from dual_autodiff import jacobian
+        >>> print(jacobian(lambda p: [p[0] * p[1], np.sin(p[0])], np.array([0.0, 2.0])))
+        [[2. 0.]
+         [1. 0.]]
+    """
+    values = np.asarray(x, dtype=float)
+    flat = values.ravel().tolist()
+    n = len(flat)
+    if chunk_size is None:
+        chunk_size = default_chunk_size(n)
+    if not isinstance(chunk_size, (int, np.integer)) or chunk_size < 1:
+        raise ValueError(f"Expected 'chunk_size' to be a positive integer, but got {chunk_size}.")
+    chunk_size = min(int(chunk_size), max(n, 1))
+
+    space = VariableSpace([f"d{j}" for j in range(chunk_size)])
+    zeros = np.zeros(chunk_size)
+    columns = []
+    output_shape = None
+    for start in range(0, n, chunk_size):
+        inputs = np.empty(n, dtype=object)
+        for i, value in enumerate(flat):
+            tangent = zeros
+            if start <= i < start + chunk_size:
+                tangent = np.zeros(chunk_size)
+                tangent[i - start] = 1.0
+            inputs[i] = DenseDual(value, tangent, space)
+        result = f(inputs[0] if values.ndim == 0 else inputs.reshape(values.shape))
+
+        outputs = np.empty(np.shape(result), dtype=object)
+        outputs[...] = result
+        output_shape = outputs.shape
+        block = np.zeros((outputs.size, chunk_size))
+        for row, out in enumerate(outputs.ravel()):
+            if isinstance(out, DenseDual):
+                block[row, :len(out.tangent)] = out.tangent
+        columns.append(block[:, :min(chunk_size, n - start)])
+
+    if output_shape is None:
+        output_shape = np.shape(f(values))
+    jac = np.hstack(columns) if columns else np.zeros((int(np.prod(output_shape)), 0))
+    return jac.reshape(output_shape + values.shape)
+
+def gradient(f: Callable, x, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Computes the gradient of a scalar function in forward mode, using `jacobian`.
+
+    Args:
+        f (Callable): the scalar function, called like in `jacobian`.
+        x (Union[float, np.ndarray]): the point to evaluate at.
+        chunk_size (Optional[int]): number of directions per pass, chosen by
+        `default_chunk_size` if not given.
+
+    Raises:
+        ValueError: If `f` does not return a scalar.
+
+    Returns:
+        np.ndarray: the gradient, with the shape of `x`.
+
+    Example:
+        >>> from dual_autodiff import gradient
+        >>> print(gradient(lambda p: p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0], [1.0, 2.0]))
+        [891.5193823  298.81284231]
+    """
+    jac = jacobian(f, x, chunk_size)
+    if jac.shape != np.shape(x):
+        raise ValueError("Expected 'f' to return a scalar, use jacobian for vector-valued functions.")
+    return jac
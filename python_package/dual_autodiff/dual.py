@@ -1,6 +1,108 @@
 import numpy as np
+from array import array
+from collections.abc import MutableMapping
 from typing import Dict, Union
-from dual_autodiff.tools import get_functions, remove_function
+from dual_autodiff.tools import get_implementation, remove_function
+
+_key_tuples = {} #shared tuples of tangent variables, one per distinct set of variables
+_max_key_tuples = 4096 #stop sharing new key tuples beyond this many distinct sets
+
+def _shared_keys(keys):
+    """
+    Returns the shared tuple for the given tangent variables, so that Dual numbers over the same
+    variables store their keys once.
+
+    Args:
+        keys (tuple): names of the tangent variables.
+
+    Returns:
+        tuple: a tuple equal to `keys`, shared between Dual numbers where possible.
+    """
+    shared = _key_tuples.get(keys)
+    if shared is None:
+        if len(_key_tuples) >= _max_key_tuples:
+            return keys
+        shared = _key_tuples[keys] = keys
+    return shared
+
+def _as_float(var, value) -> float:
+    """
+    Converts a dual component to the float stored for it.
+
+    Raises:
+        TypeError: If `value` cannot be converted to a float.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise TypeError(
+            f"Expected the dual component of '{var}' to be a number, but got {type(value).__name__}."
+        ) from None
+
+def _from_parts(real, keys, values):
+    """
+    Creates a Dual number directly from its compact parts, skipping the checks in `Dual.__init__`.
+
+    Args:
+        real (float): real component of the dual number.
+        keys (tuple): shared tuple of tangent variables.
+        values (array): tangent values, in the order of `keys`.
+
+    Returns:
+        Dual: the new dual number.
+    """
+    result = Dual.__new__(Dual)
+    result.real = real
+    result._keys = keys
+    result._values = values
+    return result
+
+class _DualView(MutableMapping):
+    """
+    Dictionary-like view of the dual components of a Dual number, returned by `Dual.dual`. Reads
+    and writes go to the compact storage of the Dual number; adding or deleting a variable
+    replaces its shared tuple of variables.
+    """
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner: 'Dual'):
+        self._owner = owner
+
+    def __getitem__(self, var):
+        owner = self._owner
+        try:
+            return owner._values[owner._keys.index(var)]
+        except ValueError:
+            raise KeyError(var) from None
+
+    def __setitem__(self, var, value):
+        owner = self._owner
+        value = _as_float(var, value)
+        if var in owner._keys:
+            owner._values[owner._keys.index(var)] = value
+        else:
+            owner._keys = _shared_keys(owner._keys + (var,))
+            owner._values.append(value)
+
+    def __delitem__(self, var):
+        owner = self._owner
+        if var not in owner._keys:
+            raise KeyError(var)
+        i = owner._keys.index(var)
+        owner._keys = _shared_keys(owner._keys[:i] + owner._keys[i + 1:])
+        del owner._values[i]
+
+    def __iter__(self):
+        return iter(self._owner._keys)
+
+    def __len__(self):
+        return len(self._owner._keys)
+
+    def copy(self) -> Dict[str, float]:
+        return self._owner._dict()
+
+    def __repr__(self):
+        return repr(self._owner._dict())
 
 class Dual:
     """
@@ -13,7 +115,8 @@ class Dual:
         dual_component (Dict[str, float]): dual components.
     
     Raises:
-        TypeError: If `real_component` is not a number or `dual_component` is not a dictionary.
+        TypeError: If `real_component` is not a number, `dual_component` is not a dictionary or one of
+        its values cannot be converted to a float.
 
     Example:
         >>> from dual_autodiff import Dual
@@ -23,8 +126,21 @@ class Dual:
         >>> print('The derivative of f at x = 3 is: 'f(x_dual).dual['x'])
         The derivative of f at x = 3 is: 12
     
+    The dual components are stored compactly in `__slots__`: a tuple of variable names shared by
+    all Dual numbers over the same variables, and an `array('d')` of their values, converted with
+    `float()` (so e.g. Decimal components are stored as floats). The `dual` property is a
+    dictionary-like view of this storage; writes through it update the Dual number.
+
+    The in-place operators (+=, -=, *=, /=) update the real part and the value array of the left
+    operand itself instead of creating a new Dual number. Every Dual number owns its value array, so
+    this never affects other Dual numbers, but any other name bound to the same Dual object sees the
+    update. Start accumulators from a new Dual number (e.g. `total = Dual(0, {})`) rather than from
+    an input that is still needed.
+
     For more examples please see the demo.
     """
+    __slots__ = ('real', '_keys', '_values')
+
     def __init__(self, real_component: Union[float, int], dual_component: Dict[str, float]):
         """
         Args:
@@ -32,18 +148,83 @@ class Dual:
             dual_component (Dict[str, float]): dual components.
         
         Raises:
-            TypeError: If `real_component` is not a number or `dual_component` is not a dictionary.
+            TypeError: If `real_component` is not a number, `dual_component` is not a dictionary or
+            one of its values cannot be converted to a float.
         """
         if not isinstance(real_component, (float, int)):
             raise TypeError(
                 f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
             )
-        if not isinstance(dual_component, dict):
+        if not isinstance(dual_component, (dict, _DualView)):
             raise TypeError(
                 f"Expected 'dual_component' to be a dictionary, but got {type(dual_component).__name__}."
         )
         self.real = real_component
-        self.dual = dual_component if isinstance(dual_component, dict) else {}
+        self.dual = dual_component
+
+    @property
+    def dual(self) -> '_DualView':
+        """
+        MutableMapping[str, float]: the dual components, as a view that reads and writes the compact
+        storage of this Dual number, so `x.dual['y'] = 1.0` updates x.
+        """
+        return _DualView(self)
+
+    def _dict(self) -> Dict[str, float]:
+        """
+        Returns the dual components as a new dictionary.
+        """
+        return dict(zip(self._keys, self._values))
+
+    @dual.setter
+    def dual(self, dual_component):
+        self._keys = _shared_keys(tuple(dual_component))
+        self._values = array('d', [_as_float(var, value) for var, value in dual_component.items()])
+
+    def _scaled(self, real, scale):
+        """
+        Returns a Dual number with the given real part and the dual components of this one multiplied by `scale`.
+        """
+        return _from_parts(real, self._keys, array('d', [scale * v for v in self._values]))
+
+    def _combined(self, real, alpha, other, beta):
+        """
+        Returns a Dual number with the given real part and dual components alpha * self + beta * other,
+        or None if the two Dual numbers are not over the same variables.
+        """
+        if self._keys is not other._keys:
+            return None
+        return _from_parts(real, self._keys,
+                           array('d', [alpha * a + beta * b for a, b in zip(self._values, other._values)]))
+
+    def _scale_in_place(self, scale):
+        """
+        Multiplies the dual components of this Dual number by `scale`, in place.
+        """
+        values = self._values
+        for i in range(len(values)):
+            values[i] *= scale
+
+    def _accumulate(self, scale, other):
+        """
+        Adds `scale` times the dual components of `other` to those of this Dual number, in place.
+        """
+        if self._keys is other._keys:
+            values = self._values
+            for i, v in enumerate(other._values):
+                values[i] += scale * v
+        else:
+            new_dual = self._dict()
+            for var, val in zip(other._keys, other._values):
+                new_dual[var] = new_dual.get(var, 0) + scale * val
+            self.dual = new_dual
+
+    def __getstate__(self):
+        return self.real, self._keys, self._values
+
+    def __setstate__(self, state):
+        self.real, keys, self._values = state
+        self._keys = _shared_keys(keys)
     
     def __repr__(self):
         """
@@ -52,7 +233,7 @@ class Dual:
         Returns:
             string: a string in the format "Dual(real=<real>, dual=<dual>)".
         """
-        return f"Dual(real={self.real}, dual={self.dual})"
+        return f"Dual(real={self.real}, dual={self._dict()})"
 
     def __add__(self, other):
         """
@@ -70,15 +251,35 @@ class Dual:
             Dual: the Dual number that is the result of the addition.
         """
         if isinstance(other, Dual):
-            new_dual = self.dual.copy()
-            for var, val in other.dual.items():
+            result = self._combined(self.real + other.real, 1.0, other, 1.0) #same variables: add the arrays
+            if result is not None:
+                return result
+            new_dual = self._dict()
+            for var, val in zip(other._keys, other._values):
                 new_dual[var] = new_dual.get(var, 0) + val #add the different dual parts component-wise
             return Dual(self.real + other.real, new_dual)
         else:
-            return Dual(self.real + other, self.dual.copy())
+            return _from_parts(self.real + other, self._keys, array('d', self._values))
     
     __radd__ = __add__ #Reverse addition to allow for scalar + dual
 
+    def __iadd__(self, other):
+        """
+        Adds a Dual number or a scalar to the current Dual number in place.
+
+        Args:
+            other (Union[Dual, float, int]): the value to be added.
+
+        Returns:
+            Dual: the current Dual number, updated.
+        """
+        if isinstance(other, Dual):
+            self._accumulate(1.0, other)
+            self.real += other.real
+        else:
+            self.real += other
+        return self
+
     def __mul__(self, other):
         """
         Multiplies a Dual number or a scalar to the current Dual number.
@@ -94,18 +295,43 @@ class Dual:
             Dual: the Dual number that is the result of the multiplication.
         """
         if isinstance(other, Dual):
+            result = self._combined(self.real * other.real, other.real, other, self.real)
+            if result is not None:
+                return result
             new_dual = {}
-            all_vars = set(self.dual.keys()) | set(other.dual.keys()) #collect all Dual variables
+            self_dual, other_dual = self._dict(), other._dict()
+            all_vars = set(self._keys) | set(other._keys) #collect all Dual variables
             for var in all_vars:
-                new_dual[var] = (self.real * other.dual.get(var, 0) + 
-                                self.dual.get(var, 0) * other.real)
+                new_dual[var] = (self.real * other_dual.get(var, 0) + 
+                                self_dual.get(var, 0) * other.real)
             return Dual(self.real * other.real, new_dual)
         else:
-            return Dual(self.real * other, 
-                       {k: v * other for k, v in self.dual.items()})
+            return self._scaled(self.real * other, other)
     
     __rmul__ = __mul__ #Reverse addition to allow for scalar * Dual
 
+    def __imul__(self, other):
+        """
+        Multiplies the current Dual number by a Dual number or a scalar in place.
+
+        Args:
+            other (Union[Dual, float, int]): the value to be multiplied with.
+
+        Returns:
+            Dual: the current Dual number, updated.
+        """
+        if isinstance(other, Dual):
+            a, b = self.real, other.real
+            if other is self: #x *= x reads the dual components it overwrites
+                other = _from_parts(b, self._keys, array('d', self._values))
+            self._scale_in_place(b)
+            self._accumulate(a, other)
+            self.real = a * b
+        else:
+            self._scale_in_place(other)
+            self.real *= other
+        return self
+
     def __sub__(self, other):
         """
         Subtracts a dual number or a scalar to the current dual number.
@@ -122,13 +348,33 @@ class Dual:
         """
 
         if isinstance(other, Dual):
-            new_dual = self.dual.copy()
-            for var, val in other.dual.items():
+            result = self._combined(self.real - other.real, 1.0, other, -1.0)
+            if result is not None:
+                return result
+            new_dual = self._dict()
+            for var, val in zip(other._keys, other._values):
                 new_dual[var] = new_dual.get(var, 0) - val
             return Dual(self.real - other.real, new_dual)
         else:
-            return Dual(self.real - other, self.dual.copy())
+            return _from_parts(self.real - other, self._keys, array('d', self._values))
     
+    def __isub__(self, other):
+        """
+        Subtracts a Dual number or a scalar from the current Dual number in place.
+
+        Args:
+            other (Union[Dual, float, int]): the value to be subtracted.
+
+        Returns:
+            Dual: the current Dual number, updated.
+        """
+        if isinstance(other, Dual):
+            self._accumulate(-1.0, other)
+            self.real -= other.real
+        else:
+            self.real -= other
+        return self
+
     def __rsub__(self, other):
         """
         Subtracts a dual number from a scalar.
@@ -142,7 +388,7 @@ class Dual:
         Returns:
              Dual: the Dual number that is the result of the subtraction.
         """
-        return Dual(other - self.real, {k: -v for k, v in self.dual.items()})
+        return self._scaled(other - self.real, -1.0)
 
     def __truediv__(self, other):
         """
@@ -169,21 +415,54 @@ class Dual:
         if isinstance(other, Dual):
             if other.real == 0:
                 raise ZeroDivisionError("Division by zero is not allowed.")
+            result = self._combined(self.real / other.real, 1 / other.real, other,
+                                    -self.real / (other.real * other.real))
+            if result is not None:
+                return result
             new_dual = {}
-            all_vars = set(self.dual.keys()) | set(other.dual.keys())
+            self_dual, other_dual = self._dict(), other._dict()
+            all_vars = set(self._keys) | set(other._keys)
             for var in all_vars:
                 new_dual[var] = (
-                    (self.dual.get(var, 0) * other.real - 
-                     self.real * other.dual.get(var, 0)) / 
+                    (self_dual.get(var, 0) * other.real - 
+                     self.real * other_dual.get(var, 0)) / 
                     (other.real * other.real)
                 )
             return Dual(self.real / other.real, new_dual)
         else:
             if other == 0:
                 raise ZeroDivisionError("Division by zero is not allowed.")
-            return Dual(self.real / other, 
-                       {k: v / other for k, v in self.dual.items()})
+            return self._scaled(self.real / other, 1 / other)
         
+    def __itruediv__(self, other):
+        """
+        Divides the current Dual number by a Dual number or a scalar in place.
+
+        Args:
+            other (Union[Dual, float, int]): the divisor.
+
+        Raises:
+            ZeroDivisionError: if the divisor, or its real component, is zero.
+
+        Returns:
+            Dual: the current Dual number, updated.
+        """
+        if isinstance(other, Dual):
+            if other.real == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            a, b = self.real, other.real
+            if other is self: #x /= x reads the dual components it overwrites
+                other = _from_parts(b, self._keys, array('d', self._values))
+            self._scale_in_place(1 / b)
+            self._accumulate(-a / (b * b), other)
+            self.real = a / b
+        else:
+            if other == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            self._scale_in_place(1 / other)
+            self.real /= other
+        return self
+
     def __rtruediv__(self, other):
         """
         Divides a scalar by a dual number.
@@ -205,7 +484,7 @@ class Dual:
             raise ZeroDivisionError("Division by zero is not allowed.")
         real_part = other / self.real
         dual_part = {k: -other * v / (self.real * self.real) 
-                    for k, v in self.dual.items()}
+                    for k, v in self._dict().items()}
         return Dual(real_part, dual_part)
 
     def __pow__(self, other):
@@ -234,18 +513,21 @@ class Dual:
             if self.real <= 0:
                 raise ValueError("For Dual number exponents, base must be positive")
             real_part = self.real ** other.real
+            base_scale = other.real * (self.real ** (other.real - 1)) #same for every variable
+            exp_scale = real_part * np.log(self.real)
+            result = self._combined(real_part, base_scale, other, exp_scale)
+            if result is not None:
+                return result
             dual_part = {}
-            all_vars = set(self.dual.keys()) | set(other.dual.keys())
+            self_dual, other_dual = self._dict(), other._dict()
+            all_vars = set(self._keys) | set(other._keys)
             for var in all_vars:
-                base_term = other.real * (self.real ** (other.real - 1)) * self.dual.get(var, 0)
-                exp_term = real_part * np.log(self.real) * other.dual.get(var, 0)
-                dual_part[var] = base_term + exp_term
+                dual_part[var] = base_scale * self_dual.get(var, 0) + exp_scale * other_dual.get(var, 0)
             return Dual(real_part, dual_part)
         else:
-            real_part = self.real ** other
-            dual_part = {k: other * (self.real ** (other - 1)) * v 
-                        for k, v in self.dual.items()}
-            return Dual(real_part, dual_part)
+            if not self._values: #the scale below is undefined at 0 for other < 1
+                return _from_parts(self.real ** other, self._keys, array('d'))
+            return self._scaled(self.real ** other, other * (self.real ** (other - 1)))
 
     def __rpow__(self, other):  
         """
@@ -274,9 +556,7 @@ class Dual:
         if not isinstance(other, (int, float)):
             return NotImplemented
         real_part = other ** self.real
-        dual_part = {k: real_part * np.log(other) * v 
-                    for k, v in self.dual.items()}
-        return Dual(real_part, dual_part)
+        return self._scaled(real_part, real_part * np.log(other))
     
     def __neg__(self):
         """
@@ -286,7 +566,33 @@ class Dual:
             Dual: a dual number where the signs on the real and dual components of the 
             original dual number have been inverted.
         """
-        return Dual(-self.real, {k: -v for k, v in self.dual.items()})
+        return self._scaled(-self.real, -1.0)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Handles NumPy functions (e.g., np.sum, np.dot, np.einsum, np.linalg.norm) called with Dual
+        numbers. The Dual numbers, and object arrays of them, are packed into DualArrays, which
+        evaluate these functions on whole arrays. Other functions are not supported.
+
+        Args:
+            func (Callable): the numpy function being called.
+            types (Collection[type]): types of the arguments that implement __array_function__.
+            args (tuple): positional arguments of the call.
+            kwargs (dict): keyword arguments of the call.
+
+        Returns:
+            Dual, DualArray or NotImplemented: the result of the function, as a Dual number when
+            it is a scalar.
+        """
+        from dual_autodiff.dual_array import DualArray, _array_functions
+        if func not in _array_functions:
+            return NotImplemented
+        packed = [DualArray.from_duals(arg) if isinstance(arg, Dual)
+                  or (isinstance(arg, np.ndarray) and arg.dtype == object) else arg for arg in args]
+        result = func(*packed, **kwargs)
+        if isinstance(result, DualArray) and result.real.ndim == 0:
+            return result[()] #scalar results stay Dual numbers
+        return result
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         """
@@ -297,20 +603,29 @@ class Dual:
 
         Args:
             ufunc (numpy.ufunc): the numpy universal function being applied.
-            method (str): the method of the ufunc being called (only "__call__" is supported).
+            method (str): the method of the ufunc being called. "reduce", "accumulate" and "outer"
+                    are handled by packing the operands into a DualArray.
             *inputs: The input arguments for the ufunc, which may include dual numbers
                     or scalars.
             **kwargs: Additional keyword arguments passed to the ufunc (e.g., out, where).
 
         Returns:
-            Dual or NotImplemented:
+            Dual, DualArray or NotImplemented:
                 - A new Dual number if the ufunc is supported and successfully applied.
-                - `NotImplemented` if the ufunc or method is unsupported or if an error occurs.
-        """
-        if method != "__call__": #does not support other methods such as reduction or accumulation
+                - A DualArray for the "reduce", "accumulate" and "outer" methods.
+                - `NotImplemented` if the ufunc or method is unsupported.
+            Errors raised while applying a supported ufunc propagate to the caller.
+        """
+        if method in ("reduce", "accumulate", "outer"):
+            #pack Dual numbers and object arrays of them into DualArrays, which implement these methods
+            from dual_autodiff.dual_array import DualArray
+            packed = [DualArray.from_duals(arg) if isinstance(arg, Dual)
+                      or (isinstance(arg, np.ndarray) and arg.dtype == object) else arg for arg in inputs]
+            return getattr(ufunc, method)(*packed, **kwargs)
+        if method != "__call__":
             return NotImplemented
         
-        implementations = get_functions() #functions stored in tools module
+        implementation = get_implementation(ufunc) #function stored in tools module, if any
         args = [] #stores real components
         dual_args = [] #stores dual components 
         #iterate over inputs provided by the ufunc to split into real and dual classes
@@ -318,30 +633,26 @@ class Dual:
         for arg in inputs:
             if isinstance(arg, Dual):
                 args.append(arg.real)
-                dual_args.append(arg.dual)
+                dual_args.append(arg._dict())
             else:
                 args.append(arg)
                 dual_args.append({})
         
         #functionality for np.add etc.
-        try:
-            if ufunc is np.add:
-                return self._handle_add(args, dual_args)
-            elif ufunc is np.multiply:
-                return self._handle_multiply(args, dual_args)
-            elif ufunc is np.divide:
-                return self._handle_divide(args, dual_args)
-            elif ufunc is np.power:
-                return self._handle_power(args, dual_args)
-            elif ufunc.__name__ in implementations:
-                f, fprime = implementations[ufunc.__name__]
-                real_part = f(args[0])
-                dual_part = {k: v * fprime(args[0]) 
-                           for k, v in dual_args[0].items()}
-                return Dual(real_part, dual_part)
-        except Exception as e:
-            print(f"Error in {ufunc.__name__}: {str(e)}")
-            return NotImplemented
+        if ufunc is np.add:
+            return self._handle_add(args, dual_args)
+        elif ufunc is np.multiply:
+            return self._handle_multiply(args, dual_args)
+        elif ufunc is np.divide:
+            return self._handle_divide(args, dual_args)
+        elif ufunc is np.power:
+            return self._handle_power(args, dual_args)
+        elif implementation is not None:
+            f, fprime = implementation
+            real_part = f(args[0])
+            dual_part = {k: v * fprime(args[0]) 
+                       for k, v in dual_args[0].items()}
+            return Dual(real_part, dual_part)
 
         return NotImplemented
 
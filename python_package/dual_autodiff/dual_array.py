@@ -0,0 +1,612 @@
+import numpy as np
+from string import ascii_letters
+from typing import Callable, Dict, Sequence, Tuple
+from dual_autodiff.dual import Dual
+from dual_autodiff.tools import get_implementation
+
+def _broadcast(dual: np.ndarray, real: np.ndarray) -> np.ndarray:
+    """
+    Broadcasts a dual component against the shape of its real component.
+    """
+    if dual.shape[:-1] == real.shape:
+        return dual
+    return np.broadcast_to(dual, real.shape + dual.shape[-1:]).copy()
+
+def _axes(axis, ndim: int) -> Tuple[int, ...]:
+    """
+    Normalises the `axis` argument of a ufunc reduction to a tuple of non-negative axes.
+    """
+    if axis is None:
+        return tuple(range(ndim))
+    axes = axis if isinstance(axis, tuple) else (axis,)
+    for a in axes:
+        if not -ndim <= a < ndim:
+            raise ValueError(f"Axis {a} is out of bounds for a DualArray with {ndim} dimensions.")
+    return tuple(a % ndim for a in axes)
+
+class DualArray:
+    """
+    Vectorised dual numbers class to compute derivatives at many points in one call.
+    The real components are stored as one ndarray and the dual components as an ndarray
+    with one extra trailing axis, one slot per variable in `variables`. For a 1-D array of
+    points the dual component is therefore a 2-D (points x variables) array.
+
+    All arithmetic and the functions in `tools` run as whole-array NumPy operations, so there
+    is no per-point Python dispatch.
+
+    Args:
+        real_component (np.ndarray): real components of the dual numbers.
+        dual_component (np.ndarray): dual components with shape `real_component.shape + (len(variables),)`.
+        variables (Sequence[str]): names of the variables along the last axis of `dual_component`.
+
+    Raises:
+        ValueError: If the shape of `dual_component` does not match `real_component` and `variables`.
+
+    Example:
+        >>> from dual_autodiff import DualArray
+        >>> x, y = DualArray.from_inputs(x=np.linspace(0, 1, 5), y=np.ones(5))
+        >>> result = y**2 * np.sinh(3 * x + 2) + 2 * y + x
+        >>> result.partial('x') #df/dx at every point
+        >>> result.dual #(5, 2) array of partial derivatives
+    """
+    def __init__(self, real_component, dual_component, variables: Sequence[str]):
+        """
+        Args:
+            real_component (np.ndarray): real components of the dual numbers.
+            dual_component (np.ndarray): dual components with shape `real_component.shape + (len(variables),)`.
+            variables (Sequence[str]): names of the variables along the last axis of `dual_component`.
+
+        Raises:
+            ValueError: If the shape of `dual_component` does not match `real_component` and `variables`.
+        """
+        real = np.asarray(real_component, dtype=float)
+        dual = np.asarray(dual_component, dtype=float)
+        variables = tuple(variables)
+        if dual.shape != real.shape + (len(variables),):
+            raise ValueError(
+                f"Expected 'dual_component' to have shape {real.shape + (len(variables),)}, but got {dual.shape}."
+            )
+        self.real = real
+        self.dual = dual
+        self.variables = variables
+
+    @classmethod
+    def from_inputs(cls, **inputs) -> Tuple['DualArray', ...]:
+        """
+        Creates one seeded DualArray per keyword argument, all sharing the same variables.
+        Each input gets a dual component of 1 for its own variable and 0 for the others,
+        so the result of a function of the inputs carries all of its partial derivatives.
+
+        Args:
+            **inputs: variable name and the array of points for that variable.
+
+        Returns:
+            Tuple[DualArray, ...]: the seeded inputs, in the order they were given.
+
+        Example:
+            >>> x, y = DualArray.from_inputs(x=[1.0, 2.0], y=[3.0, 4.0])
+        """
+        variables = tuple(inputs)
+        reals = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in inputs.values()])
+        seeded = []
+        for i, real in enumerate(reals):
+            dual = np.zeros(real.shape + (len(variables),))
+            dual[..., i] = 1.0
+            seeded.append(cls(real, dual, variables))
+        return tuple(seeded)
+
+    @classmethod
+    def from_duals(cls, duals) -> 'DualArray':
+        """
+        Packs a sequence (or object array) of Dual numbers into one DualArray.
+
+        Args:
+            duals (Sequence[Dual]): the dual numbers to pack.
+
+        Returns:
+            DualArray: a DualArray with the same shape as `duals`.
+        """
+        items = np.asarray(duals, dtype=object)
+        flat = items.ravel()
+        variables = tuple(dict.fromkeys(var for d in flat for var in d.dual))
+        slots = {var: i for i, var in enumerate(variables)}
+        real = np.array([d.real for d in flat], dtype=float)
+        dual = np.zeros((len(flat), len(variables)))
+        for i, d in enumerate(flat):
+            for var, val in d.dual.items():
+                dual[i, slots[var]] = val
+        return cls(real.reshape(items.shape), dual.reshape(items.shape + (len(variables),)), variables)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Returns:
+            Tuple[int, ...]: shape of the real component.
+        """
+        return self.real.shape
+
+    def __len__(self):
+        return len(self.real)
+
+    def __getitem__(self, index):
+        """
+        Indexes the points of the DualArray.
+
+        Returns:
+            Union[Dual, DualArray]: a Dual number if a single point is selected, otherwise a DualArray.
+        """
+        real = self.real[index]
+        dual = self.dual[index]
+        if real.ndim == 0:
+            return Dual(float(real), dict(zip(self.variables, dual.tolist())))
+        return DualArray(real, dual, self.variables)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the DualArray.
+
+        Returns:
+            string: a string in the format "DualArray(real=<real>, dual=<dual>, variables=<variables>)".
+        """
+        return f"DualArray(real={self.real}, dual={self.dual}, variables={self.variables})"
+
+    def __reduce__(self):
+        """
+        Pickles the real and dual components as two contiguous arrays, which pickle protocol 5
+        can pass out-of-band without copying.
+        """
+        return DualArray, (np.ascontiguousarray(self.real), np.ascontiguousarray(self.dual), self.variables)
+
+    def reshape(self, *shape) -> 'DualArray':
+        """
+        Gives the points a new shape without changing them.
+
+        Args:
+            *shape: the new shape, as for `np.reshape`.
+
+        Returns:
+            DualArray: the reshaped DualArray.
+        """
+        real = self.real.reshape(*shape)
+        return DualArray(real, self.dual.reshape(real.shape + (len(self.variables),)), self.variables)
+
+    def partial(self, variable: str) -> np.ndarray:
+        """
+        Gets the partial derivative with respect to one variable at every point.
+
+        Args:
+            variable (str): name of the variable.
+
+        Returns:
+            np.ndarray: the partial derivatives, zero if the array does not depend on `variable`.
+        """
+        if variable not in self.variables:
+            return np.zeros_like(self.real)
+        return self.dual[..., self.variables.index(variable)]
+
+    def _with_variables(self, variables: Tuple[str, ...]) -> np.ndarray:
+        """
+        Returns the dual component laid out over `variables`, which must contain `self.variables`.
+        """
+        if variables == self.variables:
+            return self.dual
+        dual = np.zeros(self.real.shape + (len(variables),))
+        dual[..., [variables.index(var) for var in self.variables]] = self.dual
+        return dual
+
+    def _operands(self, other):
+        """
+        Splits `other` into real and dual components aligned with the variables of this array.
+
+        Args:
+            other (Union[DualArray, Dual, np.ndarray, float, int]): the other operand.
+
+        Returns:
+            tuple: (variables, self dual component, other real component, other dual component).
+            The other dual component is None when `other` has no dual part.
+        """
+        if isinstance(other, DualArray):
+            variables = self.variables + tuple(v for v in other.variables if v not in self.variables)
+            return (variables, self._with_variables(variables),
+                    other.real, other._with_variables(variables))
+        if isinstance(other, Dual):
+            variables = self.variables + tuple(v for v in other.dual if v not in self.variables)
+            other_dual = np.array([other.dual.get(var, 0.0) for var in variables])
+            return variables, self._with_variables(variables), other.real, other_dual
+        return self.variables, self.dual, np.asarray(other, dtype=float), None
+
+    def __add__(self, other):
+        """
+        Adds a DualArray, Dual number, array or scalar to the current DualArray.
+
+        Returns:
+            DualArray: the result of the addition.
+        """
+        variables, dual, other_real, other_dual = self._operands(other)
+        real = self.real + other_real
+        dual = dual if other_dual is None else dual + other_dual
+        return DualArray(real, _broadcast(dual, real), variables)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a DualArray, Dual number, array or scalar from the current DualArray.
+
+        Returns:
+            DualArray: the result of the subtraction.
+        """
+        variables, dual, other_real, other_dual = self._operands(other)
+        real = self.real - other_real
+        dual = dual if other_dual is None else dual - other_dual
+        return DualArray(real, _broadcast(dual, real), variables)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the current DualArray from a Dual number, array or scalar.
+
+        Returns:
+            DualArray: the result of the subtraction.
+        """
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        """
+        Multiplies the current DualArray by a DualArray, Dual number, array or scalar.
+        For x = a + bε and y = c + dε the dual part is a * d + b * c.
+
+        Returns:
+            DualArray: the result of the multiplication.
+        """
+        variables, dual, other_real, other_dual = self._operands(other)
+        real = self.real * other_real
+        dual = dual * np.asarray(other_real)[..., None]
+        if other_dual is not None:
+            dual = dual + self.real[..., None] * other_dual
+        return DualArray(real, _broadcast(dual, real), variables)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divides the current DualArray by a DualArray, Dual number, array or scalar.
+        For x = a + bε and y = c + dε the dual part is (b * c - a * d) / c^2.
+
+        Raises:
+            ZeroDivisionError: if any real component of the divisor is zero.
+
+        Returns:
+            DualArray: the result of the division.
+        """
+        variables, dual, other_real, other_dual = self._operands(other)
+        if np.any(other_real == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        real = self.real / other_real
+        divisor = np.asarray(other_real)[..., None]
+        dual = dual / divisor
+        if other_dual is not None:
+            dual = dual - real[..., None] * other_dual / divisor
+        return DualArray(real, _broadcast(dual, real), variables)
+
+    def __rtruediv__(self, other):
+        """
+        Divides a Dual number, array or scalar by the current DualArray.
+
+        Raises:
+            ZeroDivisionError: if any real component of the current DualArray is zero.
+
+        Returns:
+            DualArray: the result of the division.
+        """
+        if np.any(self.real == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        reciprocal = DualArray(1 / self.real, -self.dual / (self.real * self.real)[..., None], self.variables)
+        return reciprocal * other
+
+    def __pow__(self, other):
+        """
+        Raises the current DualArray to the power of a DualArray, Dual number, array or scalar.
+        - For a scalar exponent n the dual part is n * a^(n-1) * b.
+        - For a dual exponent y = c + dε the dual part is a^c * [(b * c) / a + d * ln(a)].
+
+        Raises:
+            ValueError: if the exponent has a dual part and any base is not positive.
+
+        Returns:
+            DualArray: the result of the power calculation.
+        """
+        variables, dual, other_real, other_dual = self._operands(other)
+        if other_dual is not None and np.any(self.real <= 0):
+            raise ValueError("For Dual number exponents, base must be positive")
+        real = self.real ** other_real
+        dual = np.asarray(other_real * self.real ** (other_real - 1))[..., None] * dual
+        if other_dual is not None:
+            dual = dual + (real * np.log(self.real))[..., None] * other_dual
+        return DualArray(real, _broadcast(dual, real), variables)
+
+    def __rpow__(self, other):
+        """
+        Raises a Dual number, array or scalar to the power of the current DualArray.
+
+        Raises:
+            ValueError: if any base is not positive.
+
+        Returns:
+            DualArray: the result of the power calculation.
+        """
+        if isinstance(other, Dual):
+            return DualArray(np.asarray(other.real, dtype=float), np.array(list(other.dual.values())),
+                             tuple(other.dual)) ** self
+        other = np.asarray(other, dtype=float)
+        if np.any(other <= 0):
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        real = other ** self.real
+        return DualArray(real, (real * np.log(other))[..., None] * self.dual, self.variables)
+
+    def __neg__(self):
+        """
+        Negates the real and dual components of the current DualArray.
+
+        Returns:
+            DualArray: the negated DualArray.
+        """
+        return DualArray(-self.real, -self.dual, self.variables)
+
+    def _reduce(self, ufunc, axis=0, keepdims: bool = False) -> 'DualArray':
+        """
+        Implements `ufunc.reduce` for np.add, np.subtract and np.multiply with one pass over the
+        dual component, instead of one intermediate result per element.
+
+        For a product the derivative with respect to each factor is the product of the other
+        factors, taken from exclusive prefix and suffix products so that zero factors are exact.
+        """
+        axes = _axes(axis, self.real.ndim)
+        if ufunc is np.subtract:
+            if len(axes) != 1:
+                raise ValueError("np.subtract.reduce is only defined along a single axis.")
+            first = np.take(self.real, [0], axis=axes[0]), np.take(self.dual, [0], axis=axes[0])
+            rest = np.delete(self.real, 0, axis=axes[0]), np.delete(self.dual, 0, axis=axes[0])
+            real = first[0].sum(axis=axes, keepdims=keepdims) - rest[0].sum(axis=axes, keepdims=keepdims)
+            dual = first[1].sum(axis=axes, keepdims=keepdims) - rest[1].sum(axis=axes, keepdims=keepdims)
+            return DualArray(real, dual, self.variables)
+        if ufunc is np.add:
+            return DualArray(self.real.sum(axis=axes, keepdims=keepdims),
+                             self.dual.sum(axis=axes, keepdims=keepdims), self.variables)
+
+        # Move the reduced axes to the end (before the variables axis) and merge them into one
+        ndim = self.real.ndim
+        kept = tuple(a for a in range(ndim) if a not in axes)
+        shape = tuple(self.real.shape[a] for a in kept)
+        real = np.transpose(self.real, kept + axes).reshape(shape + (-1,))
+        dual = np.transpose(self.dual, kept + axes + (ndim,)).reshape(shape + (-1, len(self.variables)))
+        ones = np.ones(shape + (1,))
+        prefix = np.cumprod(np.concatenate([ones, real], axis=-1), axis=-1)[..., :-1]
+        suffix = np.cumprod(np.concatenate([ones, real[..., ::-1]], axis=-1), axis=-1)[..., -2::-1]
+        product = np.prod(real, axis=-1)
+        dual = np.einsum('...n,...nk->...k', prefix * suffix, dual)
+        if keepdims:
+            product = np.expand_dims(product, axes)
+            dual = np.expand_dims(dual, axes)
+        return DualArray(product, dual, self.variables)
+
+    def _accumulate(self, ufunc, axis: int = 0) -> 'DualArray':
+        """
+        Implements `ufunc.accumulate` for np.add, np.subtract and np.multiply with cumulative
+        sums over the dual component.
+        """
+        (axis,) = _axes(axis, self.real.ndim)
+        real = np.cumsum(self.real, axis=axis)
+        dual = np.cumsum(self.dual, axis=axis)
+        if ufunc is np.add:
+            return DualArray(real, dual, self.variables)
+        if ufunc is np.subtract:
+            #x0 - x1 - ... - xk = 2 * x0 - (x0 + ... + xk)
+            first = np.take(self.real, [0], axis=axis), np.take(self.dual, [0], axis=axis)
+            return DualArray(2 * first[0] - real, 2 * first[1] - dual, self.variables)
+
+        product = np.cumprod(self.real, axis=axis)
+        if np.all(self.real != 0):
+            #d(x0 * ... * xk) = (x0 * ... * xk) * (dx0 / x0 + ... + dxk / xk)
+            dual = product[..., None] * np.cumsum(self.dual / self.real[..., None], axis=axis)
+            return DualArray(product, dual, self.variables)
+        #Zero factors: apply the product rule one step at a time
+        real = np.moveaxis(self.real, axis, 0)
+        dual = np.moveaxis(self.dual, axis, 0).copy()
+        running = np.moveaxis(product, axis, 0)
+        for i in range(1, len(real)):
+            dual[i] = dual[i - 1] * real[i][..., None] + running[i - 1][..., None] * dual[i]
+        return DualArray(product, np.moveaxis(dual, 0, axis), self.variables)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Handles NumPy functions for the DualArray class. np.sum, np.mean, np.prod, np.dot,
+        np.einsum and np.linalg.norm run on the real and dual components as whole arrays, and
+        np.shape, np.ndim and np.size read the shape; other functions are not supported.
+
+        Returns:
+            DualArray or NotImplemented: the result of the function.
+        """
+        if func not in _array_functions:
+            return NotImplemented
+        return _array_functions[func](*args, **kwargs)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Handles NumPy universal functions (ufuncs) for the DualArray class.
+
+        Arithmetic ufuncs are routed to the operators above and the functions stored in the
+        tools module are applied to the whole real component at once, with the chain rule
+        applied along the last axis of the dual component.
+
+        `reduce` and `accumulate` are supported for np.add, np.subtract and np.multiply (with the
+        `axis` and, for `reduce`, `keepdims` arguments), and `outer` for the arithmetic ufuncs.
+
+        Args:
+            ufunc (numpy.ufunc): the numpy universal function being applied.
+            method (str): the method of the ufunc being called.
+            *inputs: The input arguments for the ufunc.
+            **kwargs: Additional keyword arguments passed to the ufunc.
+
+        Returns:
+            DualArray or NotImplemented:
+                - A new DualArray if the ufunc is supported and successfully applied.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        reducible = (np.add, np.subtract, np.multiply)
+        if method == "reduce" and ufunc in reducible and set(kwargs) <= {'axis', 'keepdims'}:
+            return self._reduce(ufunc, **kwargs)
+        if method == "accumulate" and ufunc in reducible and set(kwargs) <= {'axis'}:
+            return self._accumulate(ufunc, **kwargs)
+        if method == "outer" and ufunc in operators and not kwargs:
+            left, right = inputs
+            ndim = np.ndim(right.real if isinstance(right, (Dual, DualArray)) else right)
+            shape = np.shape(left.real if isinstance(left, (Dual, DualArray)) else left) + (1,) * ndim
+            if isinstance(left, DualArray):
+                left = left.reshape(shape)
+            elif not isinstance(left, Dual):
+                left = np.reshape(left, shape)
+            return ufunc(left, right)
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            real = np.asarray(f(self.real), dtype=float)
+            derivative = np.asarray(fprime(self.real), dtype=float)
+            return DualArray(real, _broadcast(derivative[..., None] * self.dual, real), self.variables)
+
+        return NotImplemented
+
+# NumPy functions implemented on whole DualArrays, looked up by __array_function__
+_array_functions: Dict[Callable, Callable] = {}
+
+def _implements(func: Callable):
+    """
+    Registers the decorated function as the DualArray implementation of `func`.
+    """
+    def register(implementation):
+        _array_functions[func] = implementation
+        return implementation
+    return register
+
+def _as_dual_array(value):
+    """
+    Converts Dual numbers to 0-d DualArrays and leaves other values unchanged.
+    """
+    if isinstance(value, Dual):
+        return DualArray.from_duals(value)
+    return value
+
+def _align(operands) -> Tuple[str, ...]:
+    """
+    Returns the union of the variables of the DualArray operands, in order of appearance.
+    """
+    variables = ()
+    for operand in operands:
+        if isinstance(operand, DualArray):
+            variables += tuple(v for v in operand.variables if v not in variables)
+    return variables
+
+@_implements(np.sum)
+def _sum(a, axis=None, keepdims=False):
+    return np.add.reduce(a, axis=axis, keepdims=keepdims)
+
+@_implements(np.prod)
+def _prod(a, axis=None, keepdims=False):
+    return np.multiply.reduce(a, axis=axis, keepdims=keepdims)
+
+@_implements(np.mean)
+def _mean(a, axis=None, keepdims=False):
+    total = np.add.reduce(a, axis=axis, keepdims=keepdims)
+    return total / (a.real.size / max(total.real.size, 1))
+
+@_implements(np.shape)
+def _shape(a):
+    return a.shape
+
+@_implements(np.ndim)
+def _ndim(a):
+    return a.real.ndim
+
+@_implements(np.size)
+def _size(a, axis=None):
+    return np.size(a.real, axis)
+
+@_implements(np.dot)
+def _dot(a, b):
+    """
+    np.dot with the product rule d(a.b) = da.b + a.db, as one tensordot on the real components
+    and one per dual operand on the dual components.
+    """
+    a, b = _as_dual_array(a), _as_dual_array(b)
+    a_real = a.real if isinstance(a, DualArray) else np.asarray(a, dtype=float)
+    b_real = b.real if isinstance(b, DualArray) else np.asarray(b, dtype=float)
+    if a_real.ndim == 0 or b_real.ndim == 0:
+        return a * b
+    axes = ([a_real.ndim - 1], [0 if b_real.ndim == 1 else b_real.ndim - 2])
+    variables = _align((a, b))
+    real = np.dot(a_real, b_real)
+    dual = np.zeros(np.shape(real) + (len(variables),))
+    if isinstance(a, DualArray):
+        #contracting the dual of a leaves its variables axis before the remaining axes of b
+        dual += np.moveaxis(np.tensordot(a._with_variables(variables), b_real, axes), a_real.ndim - 1, -1)
+    if isinstance(b, DualArray):
+        dual += np.tensordot(a_real, b._with_variables(variables), axes)
+    return DualArray(real, dual, variables)
+
+@_implements(np.einsum)
+def _einsum(subscripts, *operands, optimize=False):
+    """
+    np.einsum on multilinear operands: the dual component is the sum, over the DualArray
+    operands, of the same contraction with that operand replaced by its dual component and an
+    extra index for the variables axis.
+    """
+    if not isinstance(subscripts, str):
+        return NotImplemented
+    operands = [_as_dual_array(operand) for operand in operands]
+    subscripts = subscripts.replace(' ', '')
+    inputs, _, output = subscripts.partition('->')
+    inputs = inputs.split(',')
+    if '->' not in subscripts:
+        #implicit output: ellipsis first, then the indices that appear exactly once, sorted
+        letters = ''.join(inputs).replace('.', '')
+        output = ('...' if '...' in subscripts else '') + ''.join(
+            sorted(c for c in set(letters) if letters.count(c) == 1))
+    index = next(c for c in ascii_letters if c not in subscripts)
+
+    variables = _align(operands)
+    reals = [op.real if isinstance(op, DualArray) else op for op in operands]
+    real = np.einsum(f"{','.join(inputs)}->{output}", *reals, optimize=optimize)
+    dual = np.zeros(np.shape(real) + (len(variables),))
+    for i, operand in enumerate(operands):
+        if isinstance(operand, DualArray):
+            terms = inputs[:i] + [inputs[i] + index] + inputs[i + 1:]
+            args = reals[:i] + [operand._with_variables(variables)] + reals[i + 1:]
+            dual += np.einsum(f"{','.join(terms)}->{output}{index}", *args, optimize=optimize)
+    return DualArray(real, dual, variables)
+
+@_implements(np.linalg.norm)
+def _norm(x, ord=None, axis=None, keepdims=False):
+    """
+    The 2-norm (Frobenius norm for matrices), with derivative sum(x * dx) / norm.
+    """
+    matrix = isinstance(axis, tuple) or (axis is None and x.real.ndim != 1)
+    if ord not in (None, 2, 'fro') or (ord == 2 and matrix) or (ord == 'fro' and not matrix):
+        return NotImplemented
+    return np.sqrt(np.add.reduce(x * x, axis=axis, keepdims=keepdims))
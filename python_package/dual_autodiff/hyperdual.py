@@ -0,0 +1,338 @@
+import numpy as np
+from typing import Callable, Dict, Union
+from dual_autodiff.tools import get_implementation, get_second_derivative
+from dual_autodiff.variables import VariableSpace
+
+class HyperDual:
+    """
+    Second-order dual numbers class that carries a value, its gradient and its Hessian over the
+    slots of a VariableSpace. Every operation applies the first- and second-order chain rule, so
+    evaluating a function once on HyperDual inputs gives its exact Hessian.
+
+    For a function f applied to x with gradient g and Hessian H:
+    - gradient: f'(x) * g
+    - Hessian: f'(x) * H + f''(x) * g g^T
+
+    Args:
+        real_component (Union[float, int]): real component.
+        gradient (np.ndarray): first derivatives, one entry per slot of `space`.
+        hessian (np.ndarray): second derivatives, a square matrix matching `gradient`.
+        space (VariableSpace): the variable space that `gradient` and `hessian` are indexed by.
+
+    Raises:
+        TypeError: If `real_component` is not a number or `space` is not a VariableSpace.
+        ValueError: If `gradient` and `hessian` do not have matching shapes.
+
+    Example:
+        >>> from dual_autodiff import VariableSpace, HyperDual
+        >>> space = VariableSpace()
+        >>> x = HyperDual.variable('x', 2.0, space)
+        >>> y = HyperDual.variable('y', 3.0, space)
+        >>> print((x**2 * y).hessian)
+        [[6. 4.]
+         [4. 0.]]
+    """
+    def __init__(self, real_component: Union[float, int], gradient, hessian, space: VariableSpace):
+        """
+        Args:
+            real_component (Union[float, int]): real component.
+            gradient (np.ndarray): first derivatives, one entry per slot of `space`.
+            hessian (np.ndarray): second derivatives, a square matrix matching `gradient`.
+            space (VariableSpace): the variable space that `gradient` and `hessian` are indexed by.
+
+        Raises:
+            TypeError: If `real_component` is not a number or `space` is not a VariableSpace.
+            ValueError: If `gradient` and `hessian` do not have matching shapes.
+        """
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        if not isinstance(space, VariableSpace):
+            raise TypeError(
+                f"Expected 'space' to be a VariableSpace, but got {type(space).__name__}."
+            )
+        gradient = np.ascontiguousarray(gradient, dtype=np.float64)
+        hessian = np.ascontiguousarray(hessian, dtype=np.float64)
+        if gradient.ndim != 1 or len(gradient) > len(space) or hessian.shape != gradient.shape * 2:
+            raise ValueError(
+                f"Expected 'gradient' with at most {len(space)} entries and a matching square 'hessian', "
+                f"but got shapes {gradient.shape} and {hessian.shape}."
+            )
+        self.real = real_component
+        self.gradient = gradient
+        self.hessian = hessian
+        self.space = space
+
+    @classmethod
+    def variable(cls, name: str, value: Union[float, int], space: VariableSpace) -> 'HyperDual':
+        """
+        Creates a HyperDual number seeded with respect to one variable.
+
+        Args:
+            name (str): name of the variable.
+            value (Union[float, int]): real component of the variable.
+            space (VariableSpace): the variable space to register the variable in.
+
+        Returns:
+            HyperDual: a HyperDual number with a unit gradient in the slot of `name` and a zero Hessian.
+        """
+        slot = space.slot(name)
+        gradient = np.zeros(len(space))
+        gradient[slot] = 1.0
+        return cls(value, gradient, np.zeros((len(space), len(space))), space)
+
+    @property
+    def dual(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: the first derivatives keyed by variable name, as used by `Dual`.
+        """
+        return dict(zip(self.space.names, self.gradient.tolist()))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the HyperDual number.
+
+        Returns:
+            string: a string in the format "HyperDual(real=<real>, gradient=<gradient>, hessian=<hessian>)".
+        """
+        return f"HyperDual(real={self.real}, gradient={self.gradient}, hessian={self.hessian})"
+
+    def _derivatives(self, other: 'HyperDual'):
+        """
+        Returns the gradients and Hessians of both operands padded to the same width.
+
+        Raises:
+            ValueError: If the operands belong to different variable spaces.
+        """
+        if other.space is not self.space:
+            raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+        ga, ha, gb, hb = self.gradient, self.hessian, other.gradient, other.hessian
+        if len(ga) != len(gb):
+            width = max(len(ga), len(gb))
+            ga, gb = np.pad(ga, (0, width - len(ga))), np.pad(gb, (0, width - len(gb)))
+            ha, hb = np.pad(ha, (0, width - len(ha))), np.pad(hb, (0, width - len(hb)))
+        return ga, ha, gb, hb
+
+    def _chain(self, value, first, second) -> 'HyperDual':
+        """
+        Applies a function with the given value, first and second derivative at `self.real`.
+        """
+        return HyperDual(value, first * self.gradient,
+                         first * self.hessian + second * np.outer(self.gradient, self.gradient), self.space)
+
+    def __add__(self, other):
+        """
+        Adds a HyperDual number or a scalar to the current HyperDual number.
+
+        Returns:
+            HyperDual: the result of the addition.
+        """
+        if isinstance(other, HyperDual):
+            ga, ha, gb, hb = self._derivatives(other)
+            return HyperDual(self.real + other.real, ga + gb, ha + hb, self.space)
+        return HyperDual(self.real + other, self.gradient, self.hessian, self.space)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a HyperDual number or a scalar from the current HyperDual number.
+
+        Returns:
+            HyperDual: the result of the subtraction.
+        """
+        if isinstance(other, HyperDual):
+            ga, ha, gb, hb = self._derivatives(other)
+            return HyperDual(self.real - other.real, ga - gb, ha - hb, self.space)
+        return HyperDual(self.real - other, self.gradient, self.hessian, self.space)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the current HyperDual number from a scalar.
+
+        Returns:
+            HyperDual: the result of the subtraction.
+        """
+        return HyperDual(other - self.real, -self.gradient, -self.hessian, self.space)
+
+    def __mul__(self, other):
+        """
+        Multiplies the current HyperDual number by a HyperDual number or a scalar.
+        For x with (a, g, H) and y with (b, h, K):
+        - gradient: a * h + b * g
+        - Hessian: a * K + b * H + g h^T + h g^T
+
+        Returns:
+            HyperDual: the result of the multiplication.
+        """
+        if isinstance(other, HyperDual):
+            ga, ha, gb, hb = self._derivatives(other)
+            cross = np.outer(ga, gb)
+            return HyperDual(self.real * other.real, self.real * gb + other.real * ga,
+                             self.real * hb + other.real * ha + cross + cross.T, self.space)
+        return HyperDual(self.real * other, self.gradient * other, self.hessian * other, self.space)
+
+    __rmul__ = __mul__
+
+    def _reciprocal(self) -> 'HyperDual':
+        """
+        Raises:
+            ZeroDivisionError: if the real component is zero.
+
+        Returns:
+            HyperDual: 1 / self.
+        """
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        inverse = 1 / self.real
+        return self._chain(inverse, -inverse * inverse, 2 * inverse * inverse * inverse)
+
+    def __truediv__(self, other):
+        """
+        Divides the current HyperDual number by a HyperDual number or a scalar.
+
+        Raises:
+            ZeroDivisionError: if the real component of the divisor is zero.
+
+        Returns:
+            HyperDual: the result of the division.
+        """
+        if isinstance(other, HyperDual):
+            return self * other._reciprocal()
+        if other == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return HyperDual(self.real / other, self.gradient / other, self.hessian / other, self.space)
+
+    def __rtruediv__(self, other):
+        """
+        Divides a scalar by the current HyperDual number.
+
+        Raises:
+            ZeroDivisionError: if the real component of the current HyperDual number is zero.
+
+        Returns:
+            HyperDual: the result of the division.
+        """
+        return self._reciprocal() * other
+
+    def __pow__(self, other):
+        """
+        Raises the current HyperDual number to the power of a HyperDual number or a scalar.
+        A HyperDual exponent y is handled as exp(y * log(x)).
+
+        Raises:
+            ValueError: if the exponent is a HyperDual number and the base is not positive.
+
+        Returns:
+            HyperDual: the result of the power calculation.
+        """
+        if isinstance(other, HyperDual):
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            return np.exp(other * np.log(self))
+        first = other * self.real ** (other - 1) if other != 0 else 0.0
+        second = other * (other - 1) * self.real ** (other - 2) if other not in (0, 1) else 0.0
+        return self._chain(self.real ** other, first, second)
+
+    def __rpow__(self, other):
+        """
+        Raises a scalar to the power of the current HyperDual number.
+
+        Raises:
+            ValueError: If `other` is non-positive.
+
+        Returns:
+            HyperDual: the result of the power calculation.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        real_part = other ** self.real
+        log_base = np.log(other)
+        return self._chain(real_part, real_part * log_base, real_part * log_base * log_base)
+
+    def __neg__(self):
+        """
+        Negates the real and derivative components of the current HyperDual number.
+
+        Returns:
+            HyperDual: the negated HyperDual number.
+        """
+        return HyperDual(-self.real, -self.gradient, -self.hessian, self.space)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Handles NumPy universal functions (ufuncs) for the HyperDual class, using the functions,
+        derivatives and second derivatives stored in the tools module.
+
+        Raises:
+            ValueError: If the function has no second derivative in the tools module.
+
+        Returns:
+            HyperDual or NotImplemented:
+                - A new HyperDual if the ufunc is supported and successfully applied.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            fsecond = get_second_derivative(ufunc.__name__)
+            if fsecond is None:
+                raise ValueError(
+                    f"No second derivative registered for '{ufunc.__name__}', pass one to add_function."
+                )
+            return self._chain(float(f(self.real)), float(fprime(self.real)), float(fsecond(self.real)))
+
+        return NotImplemented
+
+def hessian(f: Callable, x) -> np.ndarray:
+    """
+    Computes the exact Hessian of a scalar function in one evaluation on HyperDual numbers.
+
+    Args:
+        f (Callable): the scalar function. It is called with an object array of HyperDual
+        numbers shaped like `x` (a single HyperDual for scalar `x`).
+        x (Union[float, np.ndarray]): the point to evaluate at.
+
+    Returns:
+        np.ndarray: the Hessian, with shape `np.shape(x) + np.shape(x)`.
+
+    Example:
+        >>> from dual_autodiff import hessian
+        >>> print(hessian(lambda p: p[0]**2 * p[1], [2.0, 3.0]))
+        [[6. 4.]
+         [4. 0.]]
+    """
+    values = np.asarray(x, dtype=float)
+    n = values.size
+    space = VariableSpace([f"x{i}" for i in range(n)])
+    identity = np.eye(n)
+    zeros = np.zeros((n, n))
+    inputs = np.empty(n, dtype=object)
+    for i, value in enumerate(values.ravel().tolist()):
+        inputs[i] = HyperDual(value, identity[i], zeros, space)
+    result = f(inputs[0] if values.ndim == 0 else inputs.reshape(values.shape))
+    if not isinstance(result, HyperDual):
+        return np.zeros(values.shape * 2)
+    return result.hessian.reshape(values.shape * 2)
@@ -0,0 +1,172 @@
+import inspect
+import numpy as np
+from typing import Callable, List, Optional, Sequence
+from dual_autodiff.compiler import _dual_array, trace
+from dual_autodiff.optimize import optimize
+from dual_autodiff.tools import registry_version
+
+def _combine(*terms):
+    """
+    Sums the tangent terms that are present, or returns None if there are none.
+    """
+    present = [term for term in terms if term is not None]
+    if not present:
+        return None
+    total = present[0]
+    for term in present[1:]:
+        total = total + term
+    return total
+
+def _forward(op: str, payload, rules, a, b, ta, tb):
+    """
+    Applies one graph operation to the values and tangents of its arguments.
+
+    Args:
+        op (str): the operation of the node.
+        payload (object): the payload of the node.
+        rules (dict): the (function, derivative) pairs of the graph.
+        a, b: values of the arguments (b is None for unary operations).
+        ta, tb: tangents of the arguments, None for arguments that do not depend on an input.
+
+    Returns:
+        tuple: the value and the tangent (or None) of the node.
+    """
+    if op == 'add':
+        return a + b, _combine(ta, tb)
+    if op == 'sub':
+        return a - b, _combine(ta, None if tb is None else -tb)
+    if op == 'neg':
+        return -a, -ta if ta is not None else None
+    if op == 'mul':
+        return a * b, _combine(None if ta is None else ta * b, None if tb is None else tb * a)
+    if op == 'div':
+        value = a / b
+        return value, _combine(None if ta is None else ta / b, None if tb is None else -tb * (value / b))
+    if op == 'pow':
+        value = a ** b
+        return value, _combine(None if ta is None else ta * (b * a ** (b - 1)),
+                               None if tb is None else tb * (value * np.log(a)))
+    func, derivative = rules[payload]
+    return func(a), None if ta is None else ta * derivative(a)
+
+class IncrementalFunction:
+    """
+    Function traced once into a Graph whose node values and tangents are kept between calls. The
+    inputs every node depends on are recorded, so a call recomputes only the nodes downstream of
+    the inputs that changed since the previous call and reuses the others. Sweeping one parameter
+    of a many-parameter function then costs only the operations that parameter reaches.
+
+    The function is traced like in `compile`, so it may only combine its inputs with arithmetic
+    operators and the NumPy ufuncs registered in the tools module. A change of the input shapes or
+    of the tools registry recomputes every node.
+
+    Args:
+        f (Callable): the function, taking one scalar per input and returning a scalar or a tuple
+        of scalars.
+        variables (Optional[Sequence[str]]): names of the inputs. Defaults to the parameter names of `f`.
+
+    Raises:
+        TypeError: If `f` uses the value of an input, or returns something other than scalars.
+
+    Example:
+        >>> from dual_autodiff.incremental import IncrementalFunction
+        >>> f = IncrementalFunction(lambda x, y: np.sin(x) * np.exp(y) + x**2)
+        >>> f(1.0, 0.0).partial('x')
+        >>> f(1.0, 0.5).partial('y') #only the nodes depending on y are recomputed
+        >>> f.recomputed
+    """
+    def __init__(self, f: Callable, variables: Optional[Sequence[str]] = None):
+        """
+        Args:
+            f (Callable): the function, taking one scalar per input and returning a scalar or a
+            tuple of scalars.
+            variables (Optional[Sequence[str]]): names of the inputs. Defaults to the parameter names of `f`.
+
+        Raises:
+            TypeError: If `f` uses the value of an input, or returns something other than scalars.
+        """
+        if variables is None:
+            variables = [name for name, parameter in inspect.signature(f).parameters.items()
+                         if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)]
+        self.f = f
+        self.variables = tuple(variables)
+        self._trace()
+
+    def _trace(self) -> None:
+        """
+        Traces the function and finds, for every input, the nodes downstream of it.
+        """
+        self._version = registry_version()
+        graph, outputs, self._single = trace(self.f, len(self.variables))
+        self.graph, self.outputs = optimize(graph, outputs)
+        depends = []
+        for op, args, payload in self.graph.nodes:
+            depends.append({payload} if op == 'input' else set().union(*[depends[arg] for arg in args]))
+        self._downstream: List[List[int]] = [[i for i, inputs in enumerate(depends) if k in inputs]
+                                             for k in range(len(self.variables))]
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Drops the kept values, so the next call recomputes every node.
+        """
+        self._inputs = None
+        self._values = [None] * len(self.graph)
+        self._tangents = [None] * len(self.graph)
+        self.recomputed = 0
+
+    def __len__(self):
+        return len(self.graph)
+
+    def _evaluate(self, nodes: Sequence[int], arrays: List[np.ndarray], shape) -> None:
+        """
+        Recomputes the values and tangents of `nodes`, in graph order.
+        """
+        n = len(self.variables)
+        values, tangents, rules = self._values, self._tangents, self.graph.rules
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i in nodes:
+                op, args, payload = self.graph.nodes[i]
+                if op == 'const':
+                    values[i] = payload
+                elif op == 'input':
+                    values[i] = arrays[payload]
+                    tangents[i] = np.eye(n)[payload].reshape((n,) + (1,) * len(shape))
+                else:
+                    a, ta = values[args[0]], tangents[args[0]]
+                    b, tb = (values[args[1]], tangents[args[1]]) if len(args) > 1 else (None, None)
+                    values[i], tangents[i] = _forward(op, payload, rules, a, b, ta, tb)
+        self.recomputed = len(nodes)
+
+    def __call__(self, *inputs):
+        """
+        Evaluates the function and its derivatives, recomputing only what depends on changed inputs.
+
+        Args:
+            *inputs (Union[float, np.ndarray]): one value or array of values per input; arrays are
+            broadcast against each other.
+
+        Returns:
+            Union[DualArray, Tuple[DualArray, ...]]: the value of each output with its derivatives
+            with respect to every input, named after `variables`.
+
+        Raises:
+            TypeError: If the number of inputs does not match the function.
+        """
+        if len(inputs) != len(self.variables):
+            raise TypeError(f"Expected {len(self.variables)} inputs, but got {len(inputs)}.")
+        if self._version != registry_version():
+            self._trace()
+        arrays = np.broadcast_arrays(*[np.array(x, dtype=float) for x in inputs])
+        shape = arrays[0].shape if arrays else ()
+        previous = self._inputs
+        if previous is None or (arrays and previous[0].shape != shape):
+            nodes = range(len(self.graph))
+        else:
+            changed = [k for k in range(len(arrays)) if not np.array_equal(arrays[k], previous[k])]
+            nodes = sorted(set().union(*[self._downstream[k] for k in changed]))
+        self._evaluate(nodes, arrays, shape)
+        self._inputs = arrays
+        results = tuple(_dual_array(self._values[out], self._tangents[out], shape, self.variables)
+                        for out in self.outputs)
+        return results[0] if self._single else results
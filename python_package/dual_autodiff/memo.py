@@ -0,0 +1,172 @@
+import functools
+import threading
+import numpy as np
+from array import array
+from collections import OrderedDict, namedtuple
+from typing import Callable, Optional
+from dual_autodiff.dual import Dual, _from_parts
+from dual_autodiff.dual_array import DualArray
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_missing = object() #marks a key absent from the cache, as results may be None
+
+class _Uncacheable(Exception):
+    """
+    Raised while building a cache key for an argument that cannot be keyed.
+    """
+
+def _key(value):
+    """
+    Builds a hashable key for an argument from its real value and its seed directions, so equal
+    points with equal seeds share a key whatever objects hold them. Other values are keyed with
+    their type, so equal numbers of different types are cached separately.
+
+    Raises:
+        _Uncacheable: If the argument is of a type that cannot be keyed.
+    """
+    if isinstance(value, Dual):
+        return ('dual', value.real, value._keys, tuple(value._values))
+    if isinstance(value, (int, float, str, bool, type(None), np.number)):
+        return (type(value), value) #typed, so 1, 1.0 and True are different keys
+    if isinstance(value, (tuple, list)):
+        return (type(value).__name__,) + tuple(_key(item) for item in value)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return ('objects', value.shape) + tuple(_key(item) for item in value.ravel())
+        return ('array', value.dtype.str, value.shape, value.tobytes())
+    raise _Uncacheable(type(value).__name__)
+
+def _copy(result):
+    """
+    Copies the mutable parts of a cached result (Dual numbers and arrays), so in-place updates
+    by the caller never reach the cache.
+    """
+    if isinstance(result, Dual):
+        return _from_parts(result.real, result._keys, array('d', result._values))
+    if isinstance(result, (tuple, list)):
+        return type(result)(_copy(item) for item in result)
+    if isinstance(result, np.ndarray):
+        if result.dtype == object:
+            copied = np.empty(result.shape, dtype=object)
+            for index, item in np.ndenumerate(result):
+                copied[index] = _copy(item)
+            return copied
+        return result.copy()
+    if isinstance(result, DualArray):
+        return DualArray(result.real.copy(), result.dual.copy(), result.variables)
+    return result
+
+def _pack(result):
+    """
+    Stores a result compactly: a Dual number as its real part and value array, and a tuple, list or
+    object array of Dual numbers as one DualArray. Other results are stored as copies.
+
+    Returns:
+        tuple: the stored form, tagged with how to rebuild the result.
+    """
+    if isinstance(result, Dual):
+        return ('dual', result.real, result._keys, array('d', result._values))
+    items = np.asarray(result, dtype=object) if isinstance(result, (tuple, list, np.ndarray)) else None
+    if items is not None and items.size and all(isinstance(item, Dual) for item in items.ravel()):
+        return (type(result), DualArray.from_duals(result))
+    return ('copy', _copy(result))
+
+def _unpack(stored):
+    """
+    Rebuilds a result stored by `_pack`. Dual numbers rebuilt from a DualArray carry every variable
+    of the result, with zeros where an entry had no dual component.
+    """
+    if stored[0] == 'dual':
+        return _from_parts(stored[1], stored[2], array('d', stored[3]))
+    if stored[0] == 'copy':
+        return _copy(stored[1])
+    kind, packed = stored
+    items = [packed[index] for index in np.ndindex(packed.shape)]
+    if kind is np.ndarray:
+        result = np.empty(packed.shape, dtype=object)
+        for index, item in zip(np.ndindex(packed.shape), items):
+            result[index] = item
+        return result
+    return kind(items)
+
+def memoize(f: Optional[Callable] = None, *, maxsize: int = 128, compact: bool = False):
+    """
+    Caches the results of a function of Dual numbers by the real values and seed directions
+    (dual components) of its arguments, evicting the least recently used results beyond `maxsize`.
+    Arguments may be Dual numbers, numbers, strings, arrays and tuples or lists of these; calls
+    with other arguments are evaluated without the cache.
+
+    Cached results are returned as copies, so in-place operators applied to a returned Dual
+    number never change the cache.
+
+    Args:
+        f (Optional[Callable]): the function. If omitted, `memoize` returns a decorator.
+        maxsize (int): the number of results kept.
+        compact (bool): whether to store Dual results as arrays (a value array per Dual number,
+        one DualArray per sequence of Dual numbers) rather than as Dual objects.
+
+    Returns:
+        Callable: the memoized function, with `cache_info()` returning the hits, misses, maxsize
+        and current size, and `cache_clear()` emptying the cache.
+
+    Raises:
+        ValueError: If `maxsize` is not positive.
+
+    Example:
+        >>> from dual_autodiff import Dual, memoize
+        >>> @memoize(maxsize=1024)
+        >>> def f(x, y):
+        >>>     return y**2 * np.sinh(3 * x + 2) + 2 * y + x
+        >>> f(Dual(0.5, {'x': 1}), Dual(1.0, {'y': 1}))
+        >>> f(Dual(0.5, {'x': 1}), Dual(1.0, {'y': 1})) #served from the cache
+        >>> f.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+    """
+    if f is None:
+        return functools.partial(memoize, maxsize=maxsize, compact=compact)
+    if maxsize <= 0:
+        raise ValueError(f"Expected 'maxsize' to be positive, but got {maxsize}.")
+
+    cache: OrderedDict = OrderedDict()
+    lock = threading.Lock()
+    stats = [0, 0] #hits, misses
+    store, load = (_pack, _unpack) if compact else (_copy, _copy)
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (_key(args), _key(sorted(kwargs.items())) if kwargs else None)
+        except _Uncacheable:
+            with lock:
+                stats[1] += 1
+            return f(*args, **kwargs)
+        with lock:
+            stored = cache.get(key, _missing)
+            if stored is not _missing:
+                cache.move_to_end(key)
+                stats[0] += 1
+        if stored is not _missing:
+            return load(stored)
+        result = f(*args, **kwargs)
+        stored = store(result)
+        with lock:
+            stats[1] += 1
+            cache[key] = stored
+            cache.move_to_end(key)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        return result
+
+    def cache_info() -> CacheInfo:
+        with lock:
+            return CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+            stats[0] = stats[1] = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
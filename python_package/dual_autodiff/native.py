@@ -0,0 +1,233 @@
+import hashlib
+import importlib.util
+import os
+import shutil
+import sysconfig
+import tempfile
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Set
+from dual_autodiff.tools import base_implementations
+
+# The registry entries as shipped; only these have C implementations
+_builtin_pairs = dict(base_implementations)
+
+# C expressions of each built-in function and its derivative, in terms of the argument {x}
+_c_functions: Dict[str, tuple] = {
+    'sin': ("sin({x})", "cos({x})"),
+    'cos': ("cos({x})", "-sin({x})"),
+    'tan': ("tan({x})", "1.0 / (cos({x}) * cos({x}))"),
+    'sinh': ("sinh({x})", "cosh({x})"),
+    'cosh': ("cosh({x})", "sinh({x})"),
+    'tanh': ("tanh({x})", "1.0 / (cosh({x}) * cosh({x}))"),
+    'exp': ("exp({x})", "exp({x})"),
+    'log': ("log({x})", "1.0 / {x}"),
+    'sqrt': ("sqrt({x})", "1.0 / (2.0 * sqrt({x}))"),
+    'arcsin': ("asin({x})", "1.0 / sqrt(1.0 - {x} * {x})"),
+    'arccos': ("acos({x})", "-1.0 / sqrt(1.0 - {x} * {x})"),
+    'arctan': ("atan({x})", "1.0 / (1.0 + {x} * {x})"),
+}
+
+# Kernels loaded by this process, keyed by cache key
+_loaded: Dict[str, Callable] = {}
+
+def cache_directory() -> str:
+    """
+    Get the directory compiled kernels are cached in: $DUAL_AUTODIFF_CACHE if set, otherwise
+    ~/.cache/dual_autodiff.
+
+    Returns:
+        str: the cache directory.
+    """
+    default = os.path.join(os.path.expanduser("~"), ".cache", "dual_autodiff")
+    return os.environ.get("DUAL_AUTODIFF_CACHE", default)
+
+def _literal(value: float) -> str:
+    """
+    Writes a float constant as a Cython expression.
+    """
+    if np.isnan(value):
+        return "NAN"
+    if np.isinf(value):
+        return "INFINITY" if value > 0 else "-INFINITY"
+    return repr(float(value))
+
+def _dependencies(graph) -> List[Set[int]]:
+    """
+    Finds the inputs each node depends on, so tangent components that are always zero are not written.
+
+    Returns:
+        List[Set[int]]: for every node, the positions of the inputs it depends on.
+    """
+    depends = []
+    for op, args, payload in graph.nodes:
+        depends.append({payload} if op == 'input' else set().union(*[depends[arg] for arg in args]))
+    return depends
+
+def cython_source(graph, outputs: Sequence[int], n_inputs: int) -> str:
+    """
+    Writes the graph as a Cython kernel looping over points. Every value and tangent component is
+    a C double, and tangent components of inputs a node does not depend on are left out.
+
+    Args:
+        graph (Graph): the traced graph.
+        outputs (Sequence[int]): indices of the output nodes.
+        n_inputs (int): number of inputs of the traced function.
+
+    Returns:
+        str: the source of a module with `evaluate(inputs, values, tangents)`, filling `values`
+        (outputs x points) and `tangents` (outputs x points x inputs) from `inputs` (inputs x points).
+
+    Raises:
+        ValueError: If the graph calls a function without a C implementation.
+    """
+    depends = _dependencies(graph)
+    body = []
+
+    def tangent(node, k):
+        return f"t{node}_{k}" if k in depends[node] else None
+
+    for i, (op, args, payload) in enumerate(graph.nodes):
+        v = [f"v{arg}" for arg in args]
+        if op == 'const':
+            body.append(f"v{i} = {_literal(payload)}")
+            continue
+        if op == 'input':
+            body.append(f"v{i} = inputs[{payload}, p]")
+            body.append(f"t{i}_{payload} = 1.0")
+            continue
+        if op == 'call':
+            if graph.rules[payload] != _builtin_pairs.get(payload):
+                raise ValueError(f"Function '{payload}' has no native implementation; use backend='python'.")
+            func, derivative = _c_functions[payload]
+            body.append(f"v{i} = {func.format(x=v[0])}")
+            if depends[i]:
+                body.append(f"d{i} = {derivative.format(x=v[0])}")
+        elif op == 'neg':
+            body.append(f"v{i} = -{v[0]}")
+        elif op == 'pow':
+            body.append(f"v{i} = pow({v[0]}, {v[1]})")
+            if depends[args[0]]:
+                body.append(f"d{i} = {v[1]} * pow({v[0]}, {v[1]} - 1.0)")
+        else:
+            symbol = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/'}[op]
+            body.append(f"v{i} = {v[0]} {symbol} {v[1]}")
+        for k in sorted(depends[i]):
+            a = tangent(args[0], k)
+            b = tangent(args[1], k) if len(args) > 1 else None
+            if op == 'add':
+                terms = [a, b]
+            elif op == 'sub':
+                terms = [a, b and f"-{b}"]
+            elif op == 'neg':
+                terms = [f"-{a}"]
+            elif op == 'mul' and args[0] == args[1]:
+                terms = [a and f"2.0 * {a} * {v[0]}"]
+            elif op == 'mul':
+                terms = [a and f"{a} * {v[1]}", b and f"{b} * {v[0]}"]
+            elif op == 'div':
+                terms = [a and f"{a} / {v[1]}", b and f"-{b} * (v{i} / {v[1]})"]
+            elif op == 'pow':
+                terms = [a and f"{a} * d{i}", b and f"{b} * (v{i} * log({v[0]}))"]
+            else:
+                terms = [f"{a} * d{i}"]
+            body.append(f"t{i}_{k} = " + " + ".join(term for term in terms if term))
+    for j, out in enumerate(outputs):
+        body.append(f"values[{j}, p] = v{out}")
+        for k in range(n_inputs):
+            body.append(f"tangents[{j}, p, {k}] = {tangent(out, k) or '0.0'}")
+
+    declared = [line.split(" = ")[0] for line in body if not line.startswith(("values[", "tangents["))]
+    lines = [
+        "# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True",
+        "from libc.math cimport sin, cos, tan, sinh, cosh, tanh, exp, log, sqrt, asin, acos, atan, pow, NAN, INFINITY",
+        "",
+        "def evaluate(const double[:, ::1] inputs, double[:, ::1] values, double[:, :, ::1] tangents):",
+        "    cdef Py_ssize_t p",
+        f"    cdef double {', '.join(declared)}",
+        "    with nogil:",
+        "        for p in range(values.shape[1]):",
+    ]
+    lines += [f"            {line}" for line in body]
+    return "\n".join(lines) + "\n"
+
+def cache_key(f: Callable, graph, source: str) -> str:
+    """
+    Hashes everything a compiled kernel depends on: the bytecode of the function, the registry
+    entries it calls, the emitted source (which also covers constants captured by closures) and
+    the interpreter the kernel is built for.
+
+    Returns:
+        str: the hexadecimal cache key.
+    """
+    import Cython
+    code = getattr(f, '__code__', None)
+    digest = hashlib.sha256()
+    digest.update(code.co_code if code is not None else b"")
+    digest.update(repr(code.co_consts if code is not None else ()).encode())
+    digest.update(repr(sorted(graph.rules)).encode())
+    digest.update(source.encode())
+    digest.update(f"{Cython.__version__}{sysconfig.get_config_var('EXT_SUFFIX')}".encode())
+    return digest.hexdigest()
+
+def _build(name: str, source: str, directory: str) -> str:
+    """
+    Cythonizes and compiles a kernel module, moving the extension into `directory` once it is
+    complete so concurrent processes never load a partial file.
+
+    Returns:
+        str: the path of the compiled extension.
+    """
+    from Cython.Build import cythonize
+    from setuptools import Distribution, Extension
+    os.makedirs(directory, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix=name, dir=directory)
+    try:
+        path = os.path.join(build_dir, f"{name}.pyx")
+        with open(path, "w") as file:
+            file.write(source)
+        extensions = cythonize([Extension(name, [path], extra_compile_args=["-O3"])], quiet=True)
+        distribution = Distribution({"ext_modules": extensions, "script_name": "setup.py"})
+        command = distribution.get_command_obj("build_ext")
+        command.build_lib = build_dir
+        command.build_temp = os.path.join(build_dir, "temp")
+        distribution.run_command("build_ext")
+        target = os.path.join(directory, name + sysconfig.get_config_var("EXT_SUFFIX"))
+        os.replace(command.get_ext_fullpath(name), target)
+        return target
+    finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+def load_kernel(f: Callable, graph, source: str, directory: Optional[str] = None) -> Callable:
+    """
+    Gets the native kernel of a traced function, from this process, from the disk cache, or by
+    compiling it. Needs Cython and a C compiler the first time a kernel is built.
+
+    Args:
+        f (Callable): the traced function.
+        graph (Graph): its traced graph.
+        source (str): the kernel source written by `cython_source`.
+        directory (Optional[str]): the cache directory. Defaults to `cache_directory()`.
+
+    Returns:
+        Callable: the kernel `evaluate(inputs, values, tangents)`.
+
+    Raises:
+        ImportError: If Cython is not installed.
+    """
+    try:
+        import Cython  # noqa: F401
+    except ImportError as error:
+        raise ImportError("The native backend needs Cython: pip install dual_autodiff[native]") from error
+    key = cache_key(f, graph, source)
+    if key in _loaded:
+        return _loaded[key]
+    directory = directory or cache_directory()
+    name = f"_kernel_{key[:32]}"
+    path = os.path.join(directory, name + sysconfig.get_config_var("EXT_SUFFIX"))
+    if not os.path.exists(path):
+        path = _build(name, source, directory)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    kernel = _loaded[key] = module.evaluate
+    return kernel
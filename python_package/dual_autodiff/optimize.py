@@ -0,0 +1,182 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from dual_autodiff.compiler import Graph
+
+# Largest integer exponent rewritten as a chain of multiplications
+MAX_POWER = 4
+
+def _fold(op: str, payload, rules, a: float, b: Optional[float] = None) -> float:
+    """
+    Evaluates an operation whose arguments are all constants, with the float64 semantics the
+    evaluators use at run time.
+
+    Returns:
+        float: the value of the operation.
+    """
+    a = np.float64(a)
+    b = None if b is None else np.float64(b)
+    with np.errstate(all='ignore'):
+        if op == 'add':
+            return float(a + b)
+        if op == 'sub':
+            return float(a - b)
+        if op == 'mul':
+            return float(a * b)
+        if op == 'div':
+            return float(np.divide(a, b))
+        if op == 'pow':
+            return float(np.power(a, b))
+        if op == 'neg':
+            return float(-a)
+        return float(rules[payload][0](a))
+
+def optimize(graph: Graph, outputs: Sequence[int]) -> Tuple[Graph, Tuple[int, ...]]:
+    """
+    Simplifies a traced graph without changing the values or derivatives of its outputs:
+
+    - constant folding: operations on constants become constants, which carry no tangent;
+    - algebraic simplification: adding or subtracting 0, multiplying or dividing by 1 or -1, powers
+      0 and 1 and double negation are removed;
+    - strength reduction: integer powers up to MAX_POWER become multiplications by repeated squaring,
+      whose derivatives need no pow calls;
+    - common-subexpression elimination: repeated constants and operations on the same arguments
+      (in either order for + and \\*) are computed once;
+    - dead-code elimination: nodes the outputs do not use are dropped.
+
+    Tangent terms of arguments that do not depend on an input are never written by the evaluators,
+    so every node folded into a constant also drops its tangent contributions.
+
+    Args:
+        graph (Graph): the traced graph.
+        outputs (Sequence[int]): indices of the output nodes.
+
+    Returns:
+        Tuple[Graph, Tuple[int, ...]]: the simplified graph and the indices of its output nodes.
+
+    Example:
+        >>> from dual_autodiff.compiler import trace
+        >>> graph, outputs, _ = trace(lambda x: np.sinh(3 * x + 2) * np.cosh(3 * x + 2) + x**2, 1)
+        >>> simplified, outputs = optimize(graph, outputs)
+        >>> len(graph), len(simplified)
+        (15, 10)
+    """
+    result = Graph()
+    result.rules = dict(graph.rules)
+    known: Dict[tuple, int] = {}
+
+    def constant_of(index):
+        op, _, payload = result.nodes[index]
+        return payload if op == 'const' else None
+
+    def emit(op, args=(), payload=None):
+        constants = [constant_of(arg) for arg in args]
+        if args and all(c is not None for c in constants):
+            return emit('const', (), _fold(op, payload, result.rules, *constants))
+        x, y = (tuple(args) + (None, None))[:2]
+        a, b = (constants + [None, None])[:2]
+        if op == 'add':
+            if a == 0:
+                return y
+            if b == 0:
+                return x
+        elif op == 'sub':
+            if b == 0:
+                return x
+            if a == 0:
+                return emit('neg', (y,))
+        elif op == 'mul':
+            if a == 1 or b == 1:
+                return y if a == 1 else x
+            if a == -1 or b == -1:
+                return emit('neg', (y if a == -1 else x,))
+        elif op == 'div':
+            if b == 1:
+                return x
+            if b == -1:
+                return emit('neg', (x,))
+        elif op == 'pow' and b is not None:
+            if b == 0:
+                return emit('const', (), 1.0)
+            if b == 1:
+                return x
+            if float(b).is_integer() and 2 <= abs(b) <= MAX_POWER:
+                power = chain(x, int(abs(b)))
+                return power if b > 0 else emit('div', (emit('const', (), 1.0), power))
+        elif op == 'neg' and result.nodes[x][0] == 'neg':
+            return result.nodes[x][1][0]
+        if op in ('add', 'mul'):
+            args = tuple(sorted(args))
+        key = (op, tuple(args), repr(payload) if op == 'const' else payload)
+        index = known.get(key)
+        if index is None:
+            result.nodes.append((op, tuple(args), payload))
+            index = known[key] = len(result.nodes) - 1
+        return index
+
+    def chain(x, n):
+        power, base = None, x
+        while n:
+            if n & 1:
+                power = base if power is None else emit('mul', (power, base))
+            n >>= 1
+            if n:
+                base = emit('mul', (base, base))
+        return power
+
+    mapping: List[int] = []
+    for op, args, payload in graph.nodes:
+        mapping.append(emit(op, tuple(mapping[arg] for arg in args), payload))
+    return _prune(result, [mapping[out] for out in outputs])
+
+def _prune(graph: Graph, outputs: Sequence[int]) -> Tuple[Graph, Tuple[int, ...]]:
+    """
+    Drops the nodes that no output uses, keeping every input.
+
+    Returns:
+        Tuple[Graph, Tuple[int, ...]]: the pruned graph and the indices of its output nodes.
+    """
+    used = [op == 'input' for op, _, _ in graph.nodes]
+    for out in outputs:
+        used[out] = True
+    for i in range(len(graph.nodes) - 1, -1, -1):
+        if used[i]:
+            for arg in graph.nodes[i][1]:
+                used[arg] = True
+    pruned = Graph()
+    index: Dict[int, int] = {}
+    for i, (op, args, payload) in enumerate(graph.nodes):
+        if used[i]:
+            pruned.nodes.append((op, tuple(index[arg] for arg in args), payload))
+            index[i] = len(pruned.nodes) - 1
+            if op == 'call':
+                pruned.rules[payload] = graph.rules[payload]
+    return pruned, tuple(index[out] for out in outputs)
+
+def count_operations(graph: Graph) -> int:
+    """
+    Counts the arithmetic operations and function calls an evaluator of the graph performs per
+    point and per tangent direction, following the derivative rules the evaluators write: tangent
+    terms are only written for arguments that depend on an input.
+
+    Args:
+        graph (Graph): the graph.
+
+    Returns:
+        int: the number of operations.
+    """
+    # (value, first tangent term, second tangent term) costs of each operation
+    costs = {'add': (1, 0, 1), 'sub': (1, 0, 1), 'neg': (1, 1, 0), 'mul': (1, 1, 2), 'div': (1, 1, 3),
+             'pow': (1, 4, 4), 'call': (1, 2, 0)}
+    active = graph.active()
+    count = 0
+    for op, args, _ in graph.nodes:
+        if op in ('input', 'const'):
+            continue
+        value, first, second = costs[op]
+        if op == 'mul' and args[0] == args[1]:
+            first, second = 2, 0 #2 * t * x
+        terms = [cost for arg, cost in zip(args, (first, second)) if active[arg]]
+        count += value + sum(terms)
+        if op in ('sub', 'neg') and len(terms) == 1 and not active[args[0]]:
+            count += 1 #-t
+    return count
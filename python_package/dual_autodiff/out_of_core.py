@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import numpy as np
+from typing import Callable, Tuple, Union
+from dual_autodiff.batching import _evaluate_batch
+
+def _write_progress(path: str, progress: dict) -> None:
+    """
+    Records progress atomically, so an interrupted write never leaves a partial record.
+    """
+    temporary = path + ".tmp"
+    with open(temporary, "w") as file:
+        json.dump(progress, file)
+    os.replace(temporary, path)
+
+def _fingerprint(inputs, points: np.ndarray, chunk_size: int) -> str:
+    """
+    Identifies the input points of a run: for a file, its path, size and modification time with
+    its first and last chunks; for an array in memory, all of its points.
+
+    Returns:
+        str: the hexadecimal fingerprint.
+    """
+    digest = hashlib.sha256()
+    if isinstance(inputs, (str, os.PathLike)):
+        status = os.stat(inputs)
+        digest.update(f"{os.path.abspath(inputs)}:{status.st_size}:{status.st_mtime_ns}".encode())
+        digest.update(np.ascontiguousarray(points[:chunk_size]).tobytes())
+        digest.update(np.ascontiguousarray(points[-chunk_size:]).tobytes())
+    else:
+        digest.update(np.ascontiguousarray(points).tobytes())
+    return digest.hexdigest()
+
+def jacobian_to_disk(f: Callable, inputs: Union[str, np.ndarray], directory: str,
+                     chunk_size: int = 65536) -> Tuple[np.memmap, np.memmap]:
+    """
+    Evaluates a function and its Jacobian at every point of an input array on disk, writing the
+    values and Jacobian rows into memory-mapped `.npy` files chunk by chunk. Only one chunk of
+    points and results is in memory at once, so the outputs may be far larger than RAM.
+
+    Progress is recorded in `progress.json` after each chunk is flushed to disk, with a fingerprint
+    of the inputs: the path, size and modification time of an input file and its first and last
+    chunks, or a hash of an array in memory. Calling again with the same inputs, directory and
+    chunk size resumes after the last completed chunk; a finished run returns the existing outputs
+    without evaluating anything.
+
+    Each chunk is evaluated in one vectorized call, with one DualArray per coordinate, so `f` must
+    only use operations DualArray supports.
+
+    Args:
+        f (Callable): the function, called with a DualArray for 1-D inputs or a list of DualArrays,
+        one per coordinate. It may return a value or a list or tuple of values.
+        inputs (Union[str, np.ndarray]): the points, or the path of a `.npy` file holding them, with
+        shape (number of points, number of inputs); 1-D inputs are scalar points. Files are
+        memory-mapped read-only.
+        directory (str): where `values.npy`, `jacobian.npy` and `progress.json` are written.
+        chunk_size (int): the number of points evaluated per call.
+
+    Returns:
+        Tuple[np.memmap, np.memmap]: read-only maps of the values, with shape (number of points,) +
+        output shape, and of the Jacobians, with shape (number of points,) + output shape + point shape.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive, the inputs are empty or have more than two
+        dimensions, or `directory` holds a run with different inputs or chunk size.
+
+    Example:
+        >>> from dual_autodiff import jacobian_to_disk
+        >>> def f(p):
+        >>>     return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+        >>> np.save("points.npy", np.random.rand(10**9, 2))
+        >>> values, jac = jacobian_to_disk(f, "points.npy", "sweep", chunk_size=10**6)
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Expected 'chunk_size' to be positive, but got {chunk_size}.")
+    points = np.load(inputs, mmap_mode='r') if isinstance(inputs, (str, os.PathLike)) else inputs
+    if points.ndim not in (1, 2) or len(points) == 0:
+        raise ValueError(f"Expected non-empty 1-D or 2-D inputs, but got shape {points.shape}.")
+    m = len(points)
+    shape = points.shape[1:]
+    n = int(np.prod(shape))
+    os.makedirs(directory, exist_ok=True)
+    values_path = os.path.join(directory, "values.npy")
+    jacobian_path = os.path.join(directory, "jacobian.npy")
+    progress_path = os.path.join(directory, "progress.json")
+    run = {"points": m, "shape": list(points.shape), "chunk_size": chunk_size,
+           "inputs": _fingerprint(inputs, points, chunk_size)}
+
+    completed = 0
+    values = jac = None
+    if os.path.exists(progress_path):
+        with open(progress_path) as file:
+            progress = json.load(file)
+        if {key: progress.get(key) for key in run} != run:
+            raise ValueError(f"Directory '{directory}' holds a run with different inputs or chunk size.")
+        completed = progress["completed"]
+        values = np.lib.format.open_memmap(values_path, mode='r+')
+        jac = np.lib.format.open_memmap(jacobian_path, mode='r+')
+
+    for start in range(completed * chunk_size, m, chunk_size):
+        stop = min(start + chunk_size, m)
+        batch = np.ascontiguousarray(points[start:stop], dtype=float).reshape(stop - start, n)
+        chunk_values, chunk_jac = _evaluate_batch(f, batch, shape)
+        if values is None: #the first chunk fixes the output shape
+            values = np.lib.format.open_memmap(values_path, mode='w+', dtype=np.float64,
+                                               shape=(m,) + chunk_values.shape[1:])
+            jac = np.lib.format.open_memmap(jacobian_path, mode='w+', dtype=np.float64,
+                                            shape=(m,) + chunk_jac.shape[1:])
+        values[start:stop] = chunk_values
+        jac[start:stop] = chunk_jac
+        values.flush()
+        jac.flush()
+        completed += 1
+        _write_progress(progress_path, dict(run, completed=completed))
+
+    del values, jac
+    return np.load(values_path, mmap_mode='r'), np.load(jacobian_path, mmap_mode='r')
@@ -0,0 +1,161 @@
+import os
+import pickle
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Tuple
+from dual_autodiff.tools import get_registry, set_registry
+from dual_autodiff.variables import VariableSpace, DenseDual
+
+# Function evaluated by this worker process, installed by _initialize
+_worker_function: Optional[Callable] = None
+
+def _evaluate_point(f: Callable, point: np.ndarray, space: VariableSpace, scalar: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates `f` and its Jacobian at one point in a single forward pass, with one DenseDual per
+    input seeded in its own direction.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the value of `f` and its Jacobian, with the input direction last.
+    """
+    n = len(point)
+    inputs = np.empty(n, dtype=object)
+    for i, value in enumerate(point.tolist()):
+        tangent = np.zeros(n)
+        tangent[i] = 1.0
+        inputs[i] = DenseDual(value, tangent, space)
+    result = f(inputs[0] if scalar else inputs)
+    outputs = np.empty(np.shape(result), dtype=object)
+    outputs[...] = result
+    values = np.zeros(outputs.shape)
+    jac = np.zeros(outputs.shape + (n,))
+    for index, out in np.ndenumerate(outputs):
+        if isinstance(out, DenseDual):
+            values[index] = out.real
+            jac[index][:len(out.tangent)] = out.tangent
+        else:
+            values[index] = out
+    return values, jac
+
+def _initialize(f: Callable, registry) -> None:
+    """
+    Installs the function and the parent's tools registry in a worker process.
+    """
+    global _worker_function
+    _worker_function = f
+    set_registry(registry)
+
+def _attach(name: str, shape: Tuple[int, ...]):
+    """
+    Attaches to a shared memory block and views it as a float64 array.
+
+    Returns:
+        Tuple[SharedMemory, np.ndarray]: the block, to close after use, and the array.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+def _evaluate_chunk(blocks, shapes, scalar: bool, start: int, stop: int) -> None:
+    """
+    Evaluates the points start to stop of the shared input array, writing the values and Jacobians
+    into the shared output arrays.
+    """
+    attached = [_attach(name, shape) for name, shape in zip(blocks, shapes)]
+    try:
+        points, values, jacobians = [array for _, array in attached]
+        space = VariableSpace([f"d{j}" for j in range(points.shape[1])])
+        for p in range(start, stop):
+            values[p], jacobians[p] = _evaluate_point(_worker_function, points[p], space, scalar)
+    finally:
+        for block, _ in attached:
+            block.close()
+
+def evaluate_many(f: Callable, points, workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                  mp_context=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates a function and its Jacobian at many independent points, spread over a pool of
+    worker processes. The points, values and Jacobians live in shared memory, so only chunk
+    bounds are sent to the workers. The function and the tools registry are sent once per worker
+    by reference, so `f` and every function registered with `add_function` must be defined at
+    module level.
+
+    Args:
+        f (Callable): the function. It is called with an object array of DenseDual numbers, one per
+        coordinate of a point (a single DenseDual for 1-D `points`), and may return a scalar or an
+        array of values of fixed shape.
+        points (np.ndarray): the points, with shape (number of points, number of inputs); a 1-D
+        array is a set of scalar inputs.
+        workers (Optional[int]): number of worker processes. Defaults to the number of CPUs; with
+        1 the points are evaluated in this process.
+        chunk_size (Optional[int]): number of points per task. Defaults to splitting the points
+        into four tasks per worker.
+        mp_context (Optional[multiprocessing.context.BaseContext]): the multiprocessing context
+        of the pool.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the values, with shape (number of points,) + output shape,
+        and the Jacobians, with shape (number of points,) + output shape + (number of inputs,).
+
+    Raises:
+        TypeError: If `f` or the registry cannot be pickled to send to the workers.
+        ValueError: If there are no points, or `workers` or `chunk_size` is not positive.
+
+    Example:
+        >>> from dual_autodiff.parallel import evaluate_many
+        >>> def fmv(p):
+        >>>     return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+        >>> values, jacobians = evaluate_many(fmv, np.random.rand(100000, 2), workers=8)
+    """
+    points = np.asarray(points, dtype=float)
+    scalar = points.ndim == 1
+    if scalar:
+        points = points[:, None]
+    if points.ndim != 2:
+        raise ValueError(f"Expected 'points' to have 1 or 2 dimensions, but got {points.ndim}.")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError(f"Expected 'workers' to be positive, but got {workers}.")
+    m, n = points.shape
+    if chunk_size is None:
+        chunk_size = max(1, -(-m // (4 * workers)))
+    if chunk_size < 1:
+        raise ValueError(f"Expected 'chunk_size' to be positive, but got {chunk_size}.")
+
+    space = VariableSpace([f"d{j}" for j in range(n)])
+    if m == 0:
+        raise ValueError("Expected at least one point.")
+    first_value, first_jac = _evaluate_point(f, points[0], space, scalar) #fixes the output shape
+    shapes = [points.shape, (m,) + first_value.shape, (m,) + first_jac.shape]
+    if workers == 1 or m <= chunk_size:
+        values, jacobians = np.empty(shapes[1]), np.empty(shapes[2])
+        values[0], jacobians[0] = first_value, first_jac
+        for p in range(1, m):
+            values[p], jacobians[p] = _evaluate_point(f, points[p], space, scalar)
+        return values, jacobians
+
+    registry = get_registry()
+    try:
+        pickle.dumps((f, registry))
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise TypeError(
+            "evaluate_many sends 'f' and the functions registered with add_function to worker "
+            "processes by reference, so they must be defined at module level (not lambdas or nested functions)."
+        ) from error
+
+    blocks = [shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8)) for shape in shapes]
+    try:
+        np.ndarray(shapes[0], dtype=np.float64, buffer=blocks[0].buf)[...] = points
+        names = [block.name for block in blocks]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                 initializer=_initialize, initargs=(f, registry)) as pool:
+            tasks = [pool.submit(_evaluate_chunk, names, shapes, scalar, start, min(start + chunk_size, m))
+                     for start in range(0, m, chunk_size)]
+            for task in tasks:
+                task.result()
+        values = np.ndarray(shapes[1], dtype=np.float64, buffer=blocks[1].buf).copy()
+        jacobians = np.ndarray(shapes[2], dtype=np.float64, buffer=blocks[2].buf).copy()
+        return values, jacobians
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
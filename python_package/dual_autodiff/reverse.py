@@ -0,0 +1,370 @@
+import numpy as np
+from typing import Callable, List, Sequence, Tuple, Union
+from dual_autodiff.tools import get_implementation
+
+class Tape:
+    """
+    Records the operations applied to Var objects so that derivatives can be computed in reverse
+    mode. Each recorded node stores its parents and the local derivative with respect to each
+    parent; one backward sweep over the tape then gives the derivative of one output with respect
+    to every input, whatever the number of inputs.
+
+    Example:
+        >>> from dual_autodiff.reverse import Tape
+        >>> tape = Tape()
+        >>> x = tape.variable(2.0)
+        >>> y = tape.variable(3.0)
+        >>> z = x * y + np.sin(x)
+        >>> print(tape.gradient(z, [x, y]))
+        [2.58385316 2.        ]
+    """
+    def __init__(self):
+        self._parents: List[Tuple[Tuple[int, float], ...]] = []
+
+    def __len__(self):
+        return len(self._parents)
+
+    def variable(self, value: Union[float, int]) -> 'Var':
+        """
+        Creates an input variable on the tape.
+
+        Args:
+            value (Union[float, int]): real value of the variable.
+
+        Returns:
+            Var: the recorded variable.
+        """
+        return self._record(value, ())
+
+    def _record(self, value, parents: Tuple[Tuple[int, float], ...]) -> 'Var':
+        """
+        Appends a node to the tape.
+
+        Args:
+            value (float): real value of the node.
+            parents (Tuple[Tuple[int, float], ...]): (parent index, local derivative) pairs.
+
+        Returns:
+            Var: the recorded node.
+        """
+        self._parents.append(parents)
+        return Var(value, self, len(self._parents) - 1)
+
+    def adjoints(self, outputs: Sequence['Var'], seeds: Sequence[float]) -> np.ndarray:
+        """
+        Runs one backward sweep over the tape.
+
+        Args:
+            outputs (Sequence[Var]): the nodes the sweep starts from.
+            seeds (Sequence[float]): the adjoint each output starts with.
+
+        Returns:
+            np.ndarray: the adjoint of every node on the tape.
+        """
+        adjoint = [0.0] * len(self._parents)
+        for output, seed in zip(outputs, seeds):
+            adjoint[output.index] += seed
+        for index in range(len(self._parents) - 1, -1, -1):
+            bar = adjoint[index]
+            if bar == 0:
+                continue
+            for parent, local in self._parents[index]:
+                adjoint[parent] += bar * local
+        return np.array(adjoint)
+
+    def gradient(self, output: 'Var', wrt: Sequence['Var']) -> np.ndarray:
+        """
+        Computes the derivative of `output` with respect to each variable in `wrt`.
+
+        Args:
+            output (Var): the value to differentiate.
+            wrt (Sequence[Var]): the variables to differentiate with respect to.
+
+        Returns:
+            np.ndarray: the partial derivatives, in the order of `wrt`.
+        """
+        if not isinstance(output, Var):
+            return np.zeros(len(wrt))
+        adjoint = self.adjoints([output], [1.0])
+        return adjoint[[var.index for var in wrt]]
+
+class Var:
+    """
+    Real value recorded on a Tape for reverse-mode differentiation. Supports the same
+    operators and NumPy ufuncs as the Dual class.
+
+    Args:
+        real (float): real value of the node.
+        tape (Tape): the tape the node is recorded on.
+        index (int): position of the node on the tape.
+    """
+    def __init__(self, real, tape: Tape, index: int):
+        """
+        Args:
+            real (float): real value of the node.
+            tape (Tape): the tape the node is recorded on.
+            index (int): position of the node on the tape.
+        """
+        self.real = real
+        self.tape = tape
+        self.index = index
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Var.
+
+        Returns:
+            string: a string in the format "Var(real=<real>, index=<index>)".
+        """
+        return f"Var(real={self.real}, index={self.index})"
+
+    def _check_tape(self, other: 'Var') -> None:
+        """
+        Raises:
+            ValueError: If the operands are recorded on different tapes.
+        """
+        if other.tape is not self.tape:
+            raise ValueError("Cannot combine Vars recorded on different tapes.")
+
+    def __add__(self, other):
+        """
+        Adds a Var or a scalar to the current Var.
+
+        Returns:
+            Var: the recorded sum.
+        """
+        if isinstance(other, Var):
+            self._check_tape(other)
+            return self.tape._record(self.real + other.real, ((self.index, 1.0), (other.index, 1.0)))
+        return self.tape._record(self.real + other, ((self.index, 1.0),))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a Var or a scalar from the current Var.
+
+        Returns:
+            Var: the recorded difference.
+        """
+        if isinstance(other, Var):
+            self._check_tape(other)
+            return self.tape._record(self.real - other.real, ((self.index, 1.0), (other.index, -1.0)))
+        return self.tape._record(self.real - other, ((self.index, 1.0),))
+
+    def __rsub__(self, other):
+        """
+        Subtracts the current Var from a scalar.
+
+        Returns:
+            Var: the recorded difference.
+        """
+        return self.tape._record(other - self.real, ((self.index, -1.0),))
+
+    def __mul__(self, other):
+        """
+        Multiplies the current Var by a Var or a scalar.
+
+        Returns:
+            Var: the recorded product.
+        """
+        if isinstance(other, Var):
+            self._check_tape(other)
+            return self.tape._record(self.real * other.real,
+                                     ((self.index, other.real), (other.index, self.real)))
+        return self.tape._record(self.real * other, ((self.index, other),))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divides the current Var by a Var or a scalar.
+
+        Raises:
+            ZeroDivisionError: if the divisor is zero.
+
+        Returns:
+            Var: the recorded quotient.
+        """
+        if isinstance(other, Var):
+            self._check_tape(other)
+            if other.real == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            return self.tape._record(self.real / other.real,
+                                     ((self.index, 1 / other.real),
+                                      (other.index, -self.real / (other.real * other.real))))
+        if other == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return self.tape._record(self.real / other, ((self.index, 1 / other),))
+
+    def __rtruediv__(self, other):
+        """
+        Divides a scalar by the current Var.
+
+        Raises:
+            ZeroDivisionError: if the current Var is zero.
+
+        Returns:
+            Var: the recorded quotient.
+        """
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return self.tape._record(other / self.real, ((self.index, -other / (self.real * self.real)),))
+
+    def __pow__(self, other):
+        """
+        Raises the current Var to the power of a Var or a scalar.
+
+        Raises:
+            ValueError: if the exponent is a Var and the base is not positive.
+
+        Returns:
+            Var: the recorded power.
+        """
+        if isinstance(other, Var):
+            self._check_tape(other)
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            real_part = self.real ** other.real
+            return self.tape._record(real_part,
+                                     ((self.index, other.real * self.real ** (other.real - 1)),
+                                      (other.index, real_part * np.log(self.real))))
+        return self.tape._record(self.real ** other, ((self.index, other * self.real ** (other - 1)),))
+
+    def __rpow__(self, other):
+        """
+        Raises a scalar to the power of the current Var.
+
+        Raises:
+            ValueError: If `other` is non-positive.
+
+        Returns:
+            Var: the recorded power.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        real_part = other ** self.real
+        return self.tape._record(real_part, ((self.index, real_part * np.log(other)),))
+
+    def __neg__(self):
+        """
+        Negates the current Var.
+
+        Returns:
+            Var: the recorded negation.
+        """
+        return self.tape._record(-self.real, ((self.index, -1.0),))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Handles NumPy universal functions (ufuncs) for the Var class. The local derivative of
+        each function is taken from the tools module.
+
+        Returns:
+            Var or NotImplemented:
+                - A new Var if the ufunc is supported and successfully applied.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            return self.tape._record(float(f(self.real)), ((self.index, float(fprime(self.real))),))
+
+        return NotImplemented
+
+def _record_inputs(tape: Tape, x) -> Tuple[np.ndarray, object]:
+    """
+    Records the entries of `x` as input variables.
+
+    Returns:
+        Tuple[np.ndarray, object]: the flat array of input Vars and the object passed to the
+        function, a single Var for scalar `x` or an object array shaped like `x` otherwise.
+    """
+    values = np.asarray(x, dtype=float)
+    inputs = np.empty(values.size, dtype=object)
+    for i, value in enumerate(values.ravel().tolist()):
+        inputs[i] = tape.variable(value)
+    if values.ndim == 0:
+        return inputs, inputs[0]
+    return inputs, inputs.reshape(values.shape)
+
+def grad(f: Callable) -> Callable:
+    """
+    Builds the gradient of a scalar function using reverse mode. The function is evaluated once
+    while recording a tape, and one backward sweep gives the derivative with respect to every input.
+
+    Args:
+        f (Callable): the function. It is called with a Var for scalar inputs or an object array
+        of Vars shaped like the input, and must return a single (scalar) value.
+
+    Returns:
+        Callable: a function of `x` that returns the gradient of `f` at `x`, with the shape of `x`.
+
+    Example:
+        >>> from dual_autodiff import grad
+        >>> def loss(p):
+        >>>     return (p[0] - 1)**2 + np.exp(p[1]) * p[0]
+        >>> print(grad(loss)(np.array([2.0, 0.0])))
+        [3. 2.]
+    """
+    def gradient(x):
+        tape = Tape()
+        inputs, args = _record_inputs(tape, x)
+        result = tape.gradient(f(args), inputs)
+        return result.reshape(np.shape(x))
+    return gradient
+
+def vjp(f: Callable, x) -> Tuple[np.ndarray, Callable]:
+    """
+    Evaluates a function and returns its vector-Jacobian product. The tape recorded during the
+    evaluation is reused by every call of the returned function.
+
+    Args:
+        f (Callable): the function. It is called like in `grad` and may return a scalar or a
+        sequence of values.
+        x (Union[float, np.ndarray]): the point to evaluate at.
+
+    Returns:
+        Tuple[np.ndarray, Callable]: the value of `f` at `x`, and a function of a cotangent `v`
+        (shaped like the value) returning `v` times the Jacobian of `f`, shaped like `x`.
+
+    Example:
+        >>> value, pullback = vjp(lambda p: [p[0] * p[1], np.sin(p[0])], np.array([1.0, 2.0]))
+        >>> print(pullback(np.array([1.0, 0.0])))
+        [2. 1.]
+    """
+    tape = Tape()
+    inputs, args = _record_inputs(tape, x)
+    result = f(args)
+    outputs = np.empty(np.shape(result), dtype=object)
+    outputs[...] = result
+    flat = outputs.ravel()
+    value = np.array([out.real if isinstance(out, Var) else out for out in flat], dtype=float)
+    recorded = [i for i, out in enumerate(flat) if isinstance(out, Var)]
+
+    def pullback(v):
+        seeds = np.broadcast_to(np.asarray(v, dtype=float), outputs.shape).ravel()
+        adjoint = tape.adjoints([flat[i] for i in recorded], seeds[recorded])
+        return adjoint[[var.index for var in inputs]].reshape(np.shape(x))
+
+    return value.reshape(outputs.shape), pullback
@@ -0,0 +1,100 @@
+import struct
+import numpy as np
+from array import array
+from typing import List, Union
+from dual_autodiff.dual import Dual, _from_parts, _shared_keys
+from dual_autodiff.dual_array import DualArray
+
+# Magic bytes, format version, kind, number of dimensions, number of variables
+_header = struct.Struct("<4sBBBxI")
+_MAGIC = b"DUAL"
+_VERSION = 1
+
+# Kinds of serialized values
+_DUAL, _SEQUENCE, _ARRAY = 0, 1, 2
+
+def to_bytes(value: Union[Dual, DualArray, List[Dual]]) -> bytes:
+    """
+    Serializes a Dual number, a sequence of Dual numbers or a DualArray into a compact binary
+    format: a header with the shape and the variable names, written once, followed by contiguous
+    float64 buffers of the real and dual components (the dual components with one row per entry).
+
+    This is the format to use for batches of Dual numbers: pickling a Dual or a list of them is
+    always in-band, even with protocol 5, whose out-of-band buffers only apply to DualArray.
+
+    Args:
+        value (Union[Dual, DualArray, List[Dual]]): the value to serialize.
+
+    Returns:
+        bytes: the serialized value.
+
+    Raises:
+        TypeError: If `value` is not a Dual, a DualArray or a sequence of Dual numbers.
+
+    Example:
+        >>> from dual_autodiff.serialization import to_bytes, from_bytes
+        >>> results = [Dual(x, {'x': 1.0, 'y': 2.0}) for x in range(1000)]
+        >>> data = to_bytes(results) #the names 'x' and 'y' are written once
+        >>> from_bytes(data)[10]
+        Dual(real=10.0, dual={'x': 1.0, 'y': 2.0})
+    """
+    if isinstance(value, Dual):
+        kind, packed = _DUAL, DualArray(value.real, np.array(value._values), value._keys)
+    elif isinstance(value, DualArray):
+        kind, packed = _ARRAY, value
+    elif isinstance(value, (list, tuple)) and all(isinstance(item, Dual) for item in value):
+        empty = DualArray(np.zeros(0), np.zeros((0, 0)), ())
+        kind, packed = _SEQUENCE, DualArray.from_duals(list(value)) if value else empty
+    else:
+        raise TypeError(f"Expected a Dual, a DualArray or a sequence of Dual numbers, but got {type(value).__name__}.")
+    names = [name.encode() for name in packed.variables]
+    parts = [_header.pack(_MAGIC, _VERSION, kind, packed.real.ndim, len(names)),
+             struct.pack(f"<{packed.real.ndim}q", *packed.real.shape)]
+    parts += [struct.pack("<I", len(name)) + name for name in names]
+    size = sum(len(part) for part in parts)
+    parts.append(b"\0" * (-size % 8)) #aligns the buffers to 8 bytes
+    parts.append(np.ascontiguousarray(packed.real, dtype='<f8').tobytes())
+    parts.append(np.ascontiguousarray(packed.dual, dtype='<f8').tobytes())
+    return b"".join(parts)
+
+def from_bytes(data) -> Union[Dual, DualArray, List[Dual]]:
+    """
+    Rebuilds a value serialized by `to_bytes`. A DualArray is returned as views of `data` without
+    copying, so it is read-only when `data` is (as for bytes or a read-only memory map). Dual numbers
+    rebuilt from a sequence carry every variable of the sequence, with zeros where an entry had
+    no dual component.
+
+    Args:
+        data (bytes-like): the serialized value, e.g. bytes, a memoryview or an np.memmap.
+
+    Returns:
+        Union[Dual, DualArray, List[Dual]]: the value, of the kind it was serialized from.
+
+    Raises:
+        ValueError: If `data` is not in the format written by `to_bytes`.
+    """
+    view = memoryview(data).cast('B')
+    if len(view) < _header.size:
+        raise ValueError("Expected data written by to_bytes, but it is too short.")
+    magic, version, kind, ndim, count = _header.unpack_from(view, 0)
+    if magic != _MAGIC or version != _VERSION or kind not in (_DUAL, _SEQUENCE, _ARRAY):
+        raise ValueError("Expected data written by to_bytes.")
+    offset = _header.size
+    shape = struct.unpack_from(f"<{ndim}q", view, offset)
+    offset += 8 * ndim
+    variables = []
+    for _ in range(count):
+        (length,) = struct.unpack_from("<I", view, offset)
+        variables.append(bytes(view[offset + 4:offset + 4 + length]).decode())
+        offset += 4 + length
+    offset += -offset % 8
+    size = int(np.prod(shape))
+    real = np.frombuffer(view, dtype='<f8', count=size, offset=offset).reshape(shape)
+    dual = np.frombuffer(view, dtype='<f8', count=size * count, offset=offset + 8 * size)
+    dual = dual.reshape(tuple(shape) + (count,))
+    if kind == _ARRAY:
+        return DualArray(real, dual, variables)
+    keys = _shared_keys(tuple(variables))
+    duals = [_from_parts(float(r), keys, array('d', row.tolist()))
+             for r, row in zip(real.ravel(), dual.reshape(size, count))]
+    return duals[0] if kind == _DUAL else duals
@@ -0,0 +1,355 @@
+import numpy as np
+from typing import Dict, Tuple, Union
+from dual_autodiff.tools import get_implementation
+from dual_autodiff.variables import VariableSpace, DenseDual
+
+def _merge(indices_a: np.ndarray, values_a: np.ndarray, alpha: float,
+           indices_b: np.ndarray, values_b: np.ndarray, beta: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merges two sorted sparse vectors into alpha * a + beta * b, dropping entries that are zero.
+
+    Args:
+        indices_a (np.ndarray): sorted slots of the nonzeros of a.
+        values_a (np.ndarray): nonzero values of a.
+        alpha (float): scale applied to a.
+        indices_b (np.ndarray): sorted slots of the nonzeros of b.
+        values_b (np.ndarray): nonzero values of b.
+        beta (float): scale applied to b.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the sorted slots and values of the nonzeros of the result.
+    """
+    if indices_a is indices_b or np.array_equal(indices_a, indices_b):
+        indices, values = indices_a, alpha * values_a + beta * values_b
+    else:
+        indices = np.union1d(indices_a, indices_b)
+        values = np.zeros(len(indices))
+        values[np.searchsorted(indices, indices_a)] = alpha * values_a
+        values[np.searchsorted(indices, indices_b)] += beta * values_b
+    nonzero = values != 0
+    if nonzero.all():
+        return indices, values
+    return indices[nonzero], values[nonzero]
+
+def _scale(indices: np.ndarray, values: np.ndarray, alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scales a sparse vector, dropping every entry if the scale is zero.
+    """
+    if alpha == 0:
+        return indices[:0], values[:0]
+    return indices, alpha * values
+
+class SparseDual:
+    """
+    Dual numbers class whose dual component is stored as sorted slot/value arrays over a
+    VariableSpace. Only nonzero entries are kept, so the cost of every operation scales with
+    the number of variables a value actually depends on rather than with the size of the space.
+
+    Args:
+        real_component (Union[float, int]): real component of dual number.
+        indices (np.ndarray): strictly increasing slots of the nonzero dual components.
+        values (np.ndarray): dual components at `indices`.
+        space (VariableSpace): the variable space that `indices` refers to.
+
+    Raises:
+        TypeError: If `real_component` is not a number or `space` is not a VariableSpace.
+        ValueError: If `indices` and `values` differ in length or `indices` is not strictly increasing.
+
+    Example:
+        >>> from dual_autodiff import VariableSpace, SparseDual
+        >>> space = VariableSpace()
+        >>> x = SparseDual.from_dict(1.0, {'x': 1, 'y': 0}, space) #explicit zero for y is dropped
+        >>> print(x.nnz)
+        1
+    """
+    def __init__(self, real_component: Union[float, int], indices, values, space: VariableSpace):
+        """
+        Args:
+            real_component (Union[float, int]): real component of dual number.
+            indices (np.ndarray): strictly increasing slots of the nonzero dual components.
+            values (np.ndarray): dual components at `indices`.
+            space (VariableSpace): the variable space that `indices` refers to.
+
+        Raises:
+            TypeError: If `real_component` is not a number or `space` is not a VariableSpace.
+            ValueError: If `indices` and `values` differ in length or `indices` is not strictly increasing.
+        """
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        if not isinstance(space, VariableSpace):
+            raise TypeError(
+                f"Expected 'space' to be a VariableSpace, but got {type(space).__name__}."
+            )
+        indices = np.ascontiguousarray(indices, dtype=np.int64)
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if indices.shape != values.shape or indices.ndim != 1:
+            raise ValueError("Expected 'indices' and 'values' to be 1-D arrays of the same length.")
+        if np.any(np.diff(indices) <= 0):
+            raise ValueError("Expected 'indices' to be strictly increasing.")
+        nonzero = values != 0
+        self.real = real_component
+        self.indices = indices[nonzero]
+        self.values = values[nonzero]
+        self.space = space
+
+    @classmethod
+    def from_dict(cls, real_component: Union[float, int], dual_component: Dict[str, float],
+                  space: VariableSpace) -> 'SparseDual':
+        """
+        Converts a dictionary dual component, as used by `Dual`, into a sparse dual number.
+        Explicit zeros in `dual_component` are dropped.
+
+        Args:
+            real_component (Union[float, int]): real component of the dual number.
+            dual_component (Dict[str, float]): dual components keyed by variable name.
+            space (VariableSpace): the variable space to register the variables in.
+
+        Returns:
+            SparseDual: the equivalent sparse dual number.
+        """
+        slots = np.array([space.slot(name) for name in dual_component], dtype=np.int64)
+        values = np.array(list(dual_component.values()), dtype=np.float64)
+        order = np.argsort(slots)
+        return cls(real_component, slots[order], values[order], space)
+
+    @classmethod
+    def _new(cls, real_component, indices: np.ndarray, values: np.ndarray, space: VariableSpace) -> 'SparseDual':
+        """
+        Creates a sparse dual number from arrays that are already sorted and free of zeros.
+        """
+        result = cls.__new__(cls)
+        result.real = real_component
+        result.indices = indices
+        result.values = values
+        result.space = space
+        return result
+
+    @property
+    def nnz(self) -> int:
+        """
+        Returns:
+            int: number of stored (nonzero) dual components.
+        """
+        return len(self.indices)
+
+    @property
+    def dual(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: the nonzero dual components keyed by variable name, as used by `Dual`.
+        """
+        names = self.space.names
+        return {names[i]: v for i, v in zip(self.indices.tolist(), self.values.tolist())}
+
+    def to_dense(self) -> DenseDual:
+        """
+        Returns:
+            DenseDual: the equivalent dense dual number over the same variable space.
+        """
+        tangent = np.zeros(len(self.space))
+        tangent[self.indices] = self.values
+        return DenseDual(self.real, tangent, self.space)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the sparse dual number.
+
+        Returns:
+            string: a string in the format "SparseDual(real=<real>, dual=<dual>)".
+        """
+        return f"SparseDual(real={self.real}, dual={self.dual})"
+
+    def _check_space(self, other: 'SparseDual') -> None:
+        """
+        Raises:
+            ValueError: If the operands belong to different variable spaces.
+        """
+        if other.space is not self.space:
+            raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+
+    def __add__(self, other):
+        """
+        Adds a sparse dual number or a scalar to the current sparse dual number.
+
+        Returns:
+            SparseDual: the result of the addition.
+        """
+        if isinstance(other, SparseDual):
+            self._check_space(other)
+            return SparseDual._new(self.real + other.real,
+                                   *_merge(self.indices, self.values, 1.0, other.indices, other.values, 1.0),
+                                   self.space)
+        return SparseDual._new(self.real + other, self.indices, self.values, self.space)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a sparse dual number or a scalar from the current sparse dual number.
+
+        Returns:
+            SparseDual: the result of the subtraction.
+        """
+        if isinstance(other, SparseDual):
+            self._check_space(other)
+            return SparseDual._new(self.real - other.real,
+                                   *_merge(self.indices, self.values, 1.0, other.indices, other.values, -1.0),
+                                   self.space)
+        return SparseDual._new(self.real - other, self.indices, self.values, self.space)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the current sparse dual number from a scalar.
+
+        Returns:
+            SparseDual: the result of the subtraction.
+        """
+        return SparseDual._new(other - self.real, self.indices, -self.values, self.space)
+
+    def __mul__(self, other):
+        """
+        Multiplies the current sparse dual number by a sparse dual number or a scalar.
+        For x = a + bε and y = c + dε the dual part is a * d + b * c.
+
+        Returns:
+            SparseDual: the result of the multiplication.
+        """
+        if isinstance(other, SparseDual):
+            self._check_space(other)
+            return SparseDual._new(self.real * other.real,
+                                   *_merge(self.indices, self.values, other.real,
+                                           other.indices, other.values, self.real),
+                                   self.space)
+        return SparseDual._new(self.real * other, *_scale(self.indices, self.values, other), self.space)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divides the current sparse dual number by a sparse dual number or a scalar.
+        For x = a + bε and y = c + dε the dual part is (b * c - a * d) / c^2.
+
+        Raises:
+            ZeroDivisionError: if the real component of the divisor is zero.
+
+        Returns:
+            SparseDual: the result of the division.
+        """
+        if isinstance(other, SparseDual):
+            self._check_space(other)
+            if other.real == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            return SparseDual._new(self.real / other.real,
+                                   *_merge(self.indices, self.values, 1 / other.real,
+                                           other.indices, other.values, -self.real / (other.real * other.real)),
+                                   self.space)
+        if other == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return SparseDual._new(self.real / other, self.indices, self.values / other, self.space)
+
+    def __rtruediv__(self, other):
+        """
+        Divides a scalar by the current sparse dual number.
+
+        Raises:
+            ZeroDivisionError: if the real component of the current sparse dual number is zero.
+
+        Returns:
+            SparseDual: the result of the division.
+        """
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return SparseDual._new(other / self.real,
+                               *_scale(self.indices, self.values, -other / (self.real * self.real)),
+                               self.space)
+
+    def __pow__(self, other):
+        """
+        Raises the current sparse dual number to the power of a sparse dual number or a scalar.
+
+        Raises:
+            ValueError: if the exponent is a sparse dual number and the base is not positive.
+
+        Returns:
+            SparseDual: the result of the power calculation.
+        """
+        if isinstance(other, SparseDual):
+            self._check_space(other)
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            real_part = self.real ** other.real
+            return SparseDual._new(real_part,
+                                   *_merge(self.indices, self.values, other.real * self.real ** (other.real - 1),
+                                           other.indices, other.values, real_part * np.log(self.real)),
+                                   self.space)
+        if len(self.indices) == 0: #the scale below is undefined at 0 for other < 1
+            return SparseDual._new(self.real ** other, self.indices, self.values, self.space)
+        return SparseDual._new(self.real ** other,
+                               *_scale(self.indices, self.values, other * self.real ** (other - 1)),
+                               self.space)
+
+    def __rpow__(self, other):
+        """
+        Raises a scalar to the power of the current sparse dual number.
+
+        Raises:
+            ValueError: If `other` is non-positive.
+
+        Returns:
+            SparseDual: the result of the power calculation.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        real_part = other ** self.real
+        return SparseDual._new(real_part, *_scale(self.indices, self.values, real_part * np.log(other)),
+                               self.space)
+
+    def __neg__(self):
+        """
+        Negates the real and dual components of the current sparse dual number.
+
+        Returns:
+            SparseDual: the negated sparse dual number.
+        """
+        return SparseDual._new(-self.real, self.indices, -self.values, self.space)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Handles NumPy universal functions (ufuncs) for the SparseDual class, using the
+        functions stored in the tools module.
+
+        Returns:
+            SparseDual or NotImplemented:
+                - A new SparseDual if the ufunc is supported and successfully applied.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            return SparseDual._new(float(f(self.real)),
+                                   *_scale(self.indices, self.values, float(fprime(self.real))),
+                                   self.space)
+
+        return NotImplemented
@@ -0,0 +1,57 @@
+import itertools
+import numpy as np
+from typing import Callable, Iterable, Iterator, Tuple
+from dual_autodiff.batching import _evaluate_batch
+
+def stream_derivatives(f: Callable, points: Iterable, chunk_size: int = 4096) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Evaluates a function and its Jacobian over a stream of points, pulling `chunk_size` points at
+    a time from `points` and yielding the results of each chunk as it is computed. Only one chunk
+    of points and results is held at once, so memory stays bounded for streams of any length,
+    including infinite generators.
+
+    Each chunk is evaluated in one vectorized call, with one DualArray per coordinate holding that
+    coordinate of every point in the chunk, so `f` must only use operations DualArray supports.
+
+    Args:
+        f (Callable): the function, called with a DualArray for scalar points or a list of
+        DualArrays, one per coordinate. It may return a value or a list or tuple of values.
+        points (Iterable): the points, all of the same shape.
+        chunk_size (int): the number of points evaluated per call.
+
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: the values of a chunk, with shape (points in chunk,) + output
+        shape, and their Jacobians, with shape (points in chunk,) + output shape + point shape. The
+        last chunk may be shorter.
+
+    Raises:
+        ValueError: If `chunk_size` is not positive or the points do not all have the same shape.
+
+    Example:
+        >>> from dual_autodiff import stream_derivatives
+        >>> def sweep():
+        >>>     for x in np.linspace(0, 1, 10**9):
+        >>>         yield (x, 1.0)
+        >>> def f(p):
+        >>>     return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+        >>> worst = 0.0
+        >>> for values, gradients in stream_derivatives(f, sweep(), chunk_size=10000):
+        >>>     worst = max(worst, np.abs(gradients).max())
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Expected 'chunk_size' to be positive, but got {chunk_size}.")
+    iterator = iter(points)
+    shape = None
+    while True:
+        chunk = [np.asarray(point, dtype=float) for point in itertools.islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        if shape is None:
+            shape = chunk[0].shape
+        if any(point.shape != shape for point in chunk):
+            raise ValueError(f"Expected every point to have shape {shape}.")
+        batch = np.empty((len(chunk), int(np.prod(shape))))
+        for row, point in zip(batch, chunk):
+            row[:] = point.ravel()
+        del chunk
+        yield _evaluate_batch(f, batch, shape)
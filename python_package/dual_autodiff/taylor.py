@@ -0,0 +1,424 @@
+import numpy as np
+from math import factorial
+from typing import Callable, Union
+from dual_autodiff.tools import get_implementation, base_implementations
+
+_builtin_pairs = dict(base_implementations)
+
+def _constant(value, degree: int) -> np.ndarray:
+    """
+    Returns the Taylor coefficients of a constant (or array of constants).
+    """
+    value = np.asarray(value, dtype=float)
+    coefficients = np.zeros(value.shape + (degree + 1,))
+    coefficients[..., 0] = value
+    return coefficients
+
+def _mul(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Cauchy product c_k = sum_{j<=k} a_j b_{k-j}.
+    """
+    a, b = np.broadcast_arrays(a, b)
+    c = np.empty(a.shape)
+    for k in range(a.shape[-1]):
+        c[..., k] = np.sum(a[..., :k + 1] * b[..., k::-1], axis=-1)
+    return c
+
+def _div(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Quotient c = a / b from c_k = (a_k - sum_{j<k} c_j b_{k-j}) / b_0.
+    """
+    a, b = np.broadcast_arrays(a, b)
+    c = np.empty(a.shape)
+    for k in range(a.shape[-1]):
+        c[..., k] = (a[..., k] - np.sum(c[..., :k] * b[..., k:0:-1], axis=-1)) / b[..., 0]
+    return c
+
+def _integrate(u: np.ndarray, w: np.ndarray, value) -> np.ndarray:
+    """
+    Coefficients of v with v_0 = value and v' = w u', i.e. v_k = (1/k) sum_{j=1}^k j u_j w_{k-j}.
+    This is the chain rule for v = f(u) when w holds the coefficients of f'(u).
+    """
+    u, w = np.broadcast_arrays(u, w)
+    v = np.empty(u.shape)
+    v[..., 0] = value
+    j = np.arange(u.shape[-1])
+    for k in range(1, u.shape[-1]):
+        v[..., k] = np.sum(j[1:k + 1] * u[..., 1:k + 1] * w[..., k - 1::-1], axis=-1) / k
+    return v
+
+def _exp(u: np.ndarray) -> np.ndarray:
+    """
+    e = exp(u) from e_k = (1/k) sum_{j=1}^k j u_j e_{k-j}.
+    """
+    e = np.empty(u.shape)
+    e[..., 0] = np.exp(u[..., 0])
+    j = np.arange(u.shape[-1])
+    for k in range(1, u.shape[-1]):
+        e[..., k] = np.sum(j[1:k + 1] * u[..., 1:k + 1] * e[..., k - 1::-1], axis=-1) / k
+    return e
+
+def _log(u: np.ndarray) -> np.ndarray:
+    """
+    l = log(u) from l_k = (u_k - (1/k) sum_{j=1}^{k-1} j l_j u_{k-j}) / u_0.
+    """
+    l = np.empty(u.shape)
+    l[..., 0] = np.log(u[..., 0])
+    j = np.arange(u.shape[-1])
+    for k in range(1, u.shape[-1]):
+        l[..., k] = (u[..., k] - np.sum(j[1:k] * l[..., 1:k] * u[..., k - 1:0:-1], axis=-1) / k) / u[..., 0]
+    return l
+
+def _sin_cos(u: np.ndarray, hyperbolic: bool = False):
+    """
+    Joint recurrence for (sin(u), cos(u)), or (sinh(u), cosh(u)) if `hyperbolic`:
+    s_k = (1/k) sum j u_j c_{k-j} and c_k = -/+ (1/k) sum j u_j s_{k-j}.
+    """
+    s = np.empty(u.shape)
+    c = np.empty(u.shape)
+    s[..., 0] = np.sinh(u[..., 0]) if hyperbolic else np.sin(u[..., 0])
+    c[..., 0] = np.cosh(u[..., 0]) if hyperbolic else np.cos(u[..., 0])
+    sign = 1.0 if hyperbolic else -1.0
+    j = np.arange(u.shape[-1])
+    for k in range(1, u.shape[-1]):
+        ju = j[1:k + 1] * u[..., 1:k + 1]
+        s[..., k] = np.sum(ju * c[..., k - 1::-1], axis=-1) / k
+        c[..., k] = sign * np.sum(ju * s[..., k - 1::-1], axis=-1) / k
+    return s, c
+
+def _sqrt(u: np.ndarray) -> np.ndarray:
+    """
+    r = sqrt(u) from r_k = (u_k - sum_{j=1}^{k-1} r_j r_{k-j}) / (2 r_0).
+    """
+    r = np.empty(u.shape)
+    r[..., 0] = np.sqrt(u[..., 0])
+    for k in range(1, u.shape[-1]):
+        r[..., k] = (u[..., k] - np.sum(r[..., 1:k] * r[..., k - 1:0:-1], axis=-1)) / (2 * r[..., 0])
+    return r
+
+def _pow(u: np.ndarray, p: float) -> np.ndarray:
+    """
+    w = u^p for a scalar p. Non-negative integer powers use repeated squaring, which also works
+    when u_0 = 0; other powers use w_k = (1/(k u_0)) sum_{j=1}^k ((p + 1) j - k) u_j w_{k-j}.
+    """
+    if float(p).is_integer() and p >= 0:
+        result = _constant(np.ones(u.shape[:-1]), u.shape[-1] - 1)
+        base, n = u, int(p)
+        while n:
+            if n & 1:
+                result = _mul(result, base)
+            n >>= 1
+            if n:
+                base = _mul(base, base)
+        return result
+    w = np.empty(u.shape)
+    w[..., 0] = u[..., 0] ** p
+    j = np.arange(u.shape[-1])
+    for k in range(1, u.shape[-1]):
+        weights = (p + 1) * j[1:k + 1] - k
+        w[..., k] = np.sum(weights * u[..., 1:k + 1] * w[..., k - 1::-1], axis=-1) / (k * u[..., 0])
+    return w
+
+class Taylor:
+    """
+    Truncated Taylor polynomial class to compute derivatives of arbitrary order of univariate
+    functions. The coefficients c_k of x(t0 + t) = sum_k c_k t^k are propagated through every
+    operation with O(d^2) recurrences, and the k-th derivative is k! c_k.
+
+    The coefficients are stored along the last axis, so a Taylor built from an array of expansion
+    points evaluates all of them at once.
+
+    Args:
+        coefficients (np.ndarray): Taylor coefficients, with shape `points_shape + (degree + 1,)`.
+
+    Raises:
+        ValueError: If `coefficients` has no coefficient axis.
+
+    Example:
+        >>> from dual_autodiff import Taylor
+        >>> x = Taylor.variable(0.0, degree=5)
+        >>> print(np.sin(x).derivatives())
+        [ 0.  1.  0. -1.  0.  1.]
+    """
+    def __init__(self, coefficients):
+        """
+        Args:
+            coefficients (np.ndarray): Taylor coefficients, with shape `points_shape + (degree + 1,)`.
+
+        Raises:
+            ValueError: If `coefficients` has no coefficient axis.
+        """
+        coefficients = np.asarray(coefficients, dtype=float)
+        if coefficients.ndim == 0 or coefficients.shape[-1] == 0:
+            raise ValueError("Expected 'coefficients' to have at least one coefficient along the last axis.")
+        self.coefficients = coefficients
+
+    @classmethod
+    def variable(cls, value, degree: int) -> 'Taylor':
+        """
+        Creates the independent variable expanded about `value`.
+
+        Args:
+            value (Union[float, np.ndarray]): expansion point, or array of expansion points.
+            degree (int): degree of the truncated polynomial.
+
+        Raises:
+            ValueError: If `degree` is negative.
+
+        Returns:
+            Taylor: the polynomial value + t.
+        """
+        if degree < 0:
+            raise ValueError(f"Expected 'degree' to be non-negative, but got {degree}.")
+        coefficients = _constant(value, degree)
+        if degree > 0:
+            coefficients[..., 1] = 1.0
+        return cls(coefficients)
+
+    @property
+    def degree(self) -> int:
+        """
+        Returns:
+            int: degree of the truncated polynomial.
+        """
+        return self.coefficients.shape[-1] - 1
+
+    @property
+    def real(self):
+        """
+        Returns:
+            Union[float, np.ndarray]: value at the expansion point(s).
+        """
+        return self.coefficients[..., 0]
+
+    def derivatives(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: derivatives of order 0 to `degree` along the last axis, k! c_k.
+        """
+        factorials = np.array([factorial(k) for k in range(self.degree + 1)], dtype=float)
+        return self.coefficients * factorials
+
+    def __getitem__(self, index):
+        """
+        Selects expansion points of a vectorised Taylor polynomial.
+        """
+        return Taylor(self.coefficients[index])
+
+    def __repr__(self):
+        """
+        Returns a string representation of the Taylor polynomial.
+
+        Returns:
+            string: a string in the format "Taylor(coefficients=<coefficients>)".
+        """
+        return f"Taylor(coefficients={self.coefficients})"
+
+    def _operand(self, other) -> np.ndarray:
+        """
+        Returns the coefficients of `other` truncated or extended to the degree of this polynomial.
+        """
+        if isinstance(other, Taylor):
+            return other.coefficients
+        return _constant(other, self.degree)
+
+    def _truncate(self, other):
+        """
+        Returns the coefficients of both operands at the lower of their degrees.
+        """
+        a, b = self.coefficients, self._operand(other)
+        n = min(a.shape[-1], b.shape[-1])
+        return a[..., :n], b[..., :n]
+
+    def __add__(self, other):
+        """
+        Adds a Taylor polynomial, array or scalar to the current Taylor polynomial.
+
+        Returns:
+            Taylor: the result of the addition.
+        """
+        a, b = self._truncate(other)
+        return Taylor(a + b)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a Taylor polynomial, array or scalar from the current Taylor polynomial.
+
+        Returns:
+            Taylor: the result of the subtraction.
+        """
+        a, b = self._truncate(other)
+        return Taylor(a - b)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the current Taylor polynomial from an array or scalar.
+
+        Returns:
+            Taylor: the result of the subtraction.
+        """
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        """
+        Multiplies the current Taylor polynomial by a Taylor polynomial, array or scalar.
+
+        Returns:
+            Taylor: the result of the multiplication.
+        """
+        if not isinstance(other, Taylor):
+            return Taylor(self.coefficients * np.asarray(other, dtype=float)[..., None])
+        return Taylor(_mul(*self._truncate(other)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divides the current Taylor polynomial by a Taylor polynomial, array or scalar.
+
+        Raises:
+            ZeroDivisionError: if the value of the divisor is zero at any expansion point.
+
+        Returns:
+            Taylor: the result of the division.
+        """
+        a, b = self._truncate(other)
+        if np.any(b[..., 0] == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return Taylor(_div(a, b))
+
+    def __rtruediv__(self, other):
+        """
+        Divides an array or scalar by the current Taylor polynomial.
+
+        Raises:
+            ZeroDivisionError: if the value of the current polynomial is zero at any expansion point.
+
+        Returns:
+            Taylor: the result of the division.
+        """
+        if np.any(self.coefficients[..., 0] == 0):
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return Taylor(_div(self._operand(other), self.coefficients))
+
+    def __pow__(self, other):
+        """
+        Raises the current Taylor polynomial to the power of a Taylor polynomial or a scalar.
+        A Taylor exponent y is handled as exp(y * log(x)).
+
+        Raises:
+            ValueError: if the exponent is a Taylor polynomial and the base is not positive.
+
+        Returns:
+            Taylor: the result of the power calculation.
+        """
+        if isinstance(other, Taylor):
+            if np.any(self.coefficients[..., 0] <= 0):
+                raise ValueError("For Dual number exponents, base must be positive")
+            return Taylor(_exp(_mul(*Taylor(_log(self.coefficients))._truncate(other))))
+        return Taylor(_pow(self.coefficients, other))
+
+    def __rpow__(self, other):
+        """
+        Raises a scalar to the power of the current Taylor polynomial.
+
+        Raises:
+            ValueError: If `other` is non-positive.
+
+        Returns:
+            Taylor: the result of the power calculation.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        return Taylor(_exp(self.coefficients * np.log(other)))
+
+    def __neg__(self):
+        """
+        Negates the current Taylor polynomial.
+
+        Returns:
+            Taylor: the negated Taylor polynomial.
+        """
+        return Taylor(-self.coefficients)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Handles NumPy universal functions (ufuncs) for the Taylor class.
+
+        The built-in exp, log, sqrt and trigonometric and hyperbolic sine and cosine use their
+        own recurrences. The other functions stored in the tools module are applied with the chain
+        rule, evaluating their derivative on the Taylor polynomial itself.
+
+        Returns:
+            Taylor or NotImplemented:
+                - A new Taylor if the ufunc is supported and successfully applied.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        name = ufunc.__name__
+        implementation = get_implementation(ufunc)
+        if implementation is None or len(inputs) != 1:
+            return NotImplemented
+
+        f, fprime = implementation
+        u = self.coefficients
+        recurrences = {
+            'exp': lambda: _exp(u),
+            'log': lambda: _log(u),
+            'sqrt': lambda: _sqrt(u),
+            'sin': lambda: _sin_cos(u)[0],
+            'cos': lambda: _sin_cos(u)[1],
+            'sinh': lambda: _sin_cos(u, hyperbolic=True)[0],
+            'cosh': lambda: _sin_cos(u, hyperbolic=True)[1],
+        }
+        pair = _builtin_pairs.get(name)
+        if name in recurrences and pair is not None and pair[0] is f and pair[1] is fprime:
+            return Taylor(recurrences[name]())
+
+        derivative = fprime(self)
+        w = derivative.coefficients if isinstance(derivative, Taylor) else _constant(derivative, self.degree)
+        return Taylor(_integrate(u, w, f(u[..., 0])))
+
+def taylor_derivatives(f: Callable, x: Union[float, np.ndarray], degree: int) -> np.ndarray:
+    """
+    Computes the derivatives of order 0 to `degree` of a univariate function.
+
+    Args:
+        f (Callable): the function, called with a Taylor polynomial.
+        x (Union[float, np.ndarray]): expansion point, or array of expansion points.
+        degree (int): highest derivative order.
+
+    Returns:
+        np.ndarray: the derivatives, with shape `np.shape(x) + (degree + 1,)`.
+
+    Example:
+        >>> from dual_autodiff import taylor_derivatives
+        >>> print(taylor_derivatives(np.exp, [0.0, 1.0], 3))
+        [[1.         1.         1.         1.        ]
+         [2.71828183 2.71828183 2.71828183 2.71828183]]
+    """
+    result = f(Taylor.variable(x, degree))
+    if not isinstance(result, Taylor):
+        return Taylor(_constant(np.broadcast_to(result, np.shape(x)), degree)).derivatives()
+    return result.derivatives()
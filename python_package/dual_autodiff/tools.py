@@ -1,35 +1,90 @@
 import numpy as np
-from typing import Callable, Dict, Tuple
+from typing import Callable, Dict, Optional, Tuple
 
 # Type definition for clarity
 tool_format = Tuple[Callable[[float], float], Callable[[float], float]]
 tool_store = Dict[str, tool_format]
 
+# Derivatives of the built-in functions, defined at module level so the registry can be pickled
+# (by reference) and sent to worker processes
+def _d_sin(x): return np.cos(x)
+def _d_cos(x): return -np.sin(x)
+def _d_tan(x): return 1 / (np.cos(x)**2)
+def _d_sinh(x): return np.cosh(x)
+def _d_cosh(x): return np.sinh(x)
+def _d_tanh(x): return 1 / (np.cosh(x)**2)
+def _d_exp(x): return np.exp(x)
+def _d_log(x): return 1 / x
+def _d_sqrt(x): return 1 / (2 * np.sqrt(x))
+def _d_arcsin(x): return 1 / np.sqrt(1 - x**2)
+def _d_arccos(x): return -1 / np.sqrt(1 - x**2)
+def _d_arctan(x): return 1 / (1 + x**2)
+
+def _dd_sin(x): return -np.sin(x)
+def _dd_cos(x): return -np.cos(x)
+def _dd_tan(x): return 2 * np.tan(x) / (np.cos(x)**2)
+def _dd_sinh(x): return np.sinh(x)
+def _dd_cosh(x): return np.cosh(x)
+def _dd_tanh(x): return -2 * np.tanh(x) / (np.cosh(x)**2)
+def _dd_exp(x): return np.exp(x)
+def _dd_log(x): return -1 / x**2
+def _dd_sqrt(x): return -1 / (4 * x * np.sqrt(x))
+def _dd_arcsin(x): return x / (1 - x**2)**1.5
+def _dd_arccos(x): return -x / (1 - x**2)**1.5
+def _dd_arctan(x): return -2 * x / (1 + x**2)**2
+
 # Base implementation dictionary
 base_implementations: tool_store = {
     # Trigonometric functions
-    'sin': (np.sin, lambda x: np.cos(x)),
-    'cos': (np.cos, lambda x: -np.sin(x)),
-    'tan': (np.tan, lambda x: 1 / (np.cos(x)**2)),
+    'sin': (np.sin, _d_sin),
+    'cos': (np.cos, _d_cos),
+    'tan': (np.tan, _d_tan),
 
     # Hyperbolic functions
-    'sinh': (np.sinh, lambda x: np.cosh(x)),
-    'cosh': (np.cosh, lambda x: np.sinh(x)),
-    'tanh': (np.tanh, lambda x: 1 / (np.cosh(x)**2)),
+    'sinh': (np.sinh, _d_sinh),
+    'cosh': (np.cosh, _d_cosh),
+    'tanh': (np.tanh, _d_tanh),
 
     # Exponential and logarithmic functions
-    'exp': (np.exp, lambda x: np.exp(x)),
-    'log': (np.log, lambda x: 1 / x),
-    'sqrt': (np.sqrt, lambda x: 1 / (2 * np.sqrt(x))),
+    'exp': (np.exp, _d_exp),
+    'log': (np.log, _d_log),
+    'sqrt': (np.sqrt, _d_sqrt),
 
     # Inverse trigonometric functions
-    'arcsin': (np.arcsin, lambda x: 1 / np.sqrt(1 - x**2)),
-    'arccos': (np.arccos, lambda x: -1 / np.sqrt(1 - x**2)),
-    'arctan': (np.arctan, lambda x: 1 / (1 + x**2))
+    'arcsin': (np.arcsin, _d_arcsin),
+    'arccos': (np.arccos, _d_arccos),
+    'arctan': (np.arctan, _d_arctan)
 }
 
+# Second derivatives, used by second-order number types such as HyperDual
+second_derivatives: Dict[str, Callable[[float], float]] = {
+    'sin': _dd_sin,
+    'cos': _dd_cos,
+    'tan': _dd_tan,
+
+    'sinh': _dd_sinh,
+    'cosh': _dd_cosh,
+    'tanh': _dd_tanh,
+
+    'exp': _dd_exp,
+    'log': _dd_log,
+    'sqrt': _dd_sqrt,
+
+    'arcsin': _dd_arcsin,
+    'arccos': _dd_arccos,
+    'arctan': _dd_arctan
+}
+
+# Bumped by add_function and remove_function, so tables built from the registry know when to refresh
+_version = 0
+
+# Registry entries keyed by ufunc object, filled on first use and cleared when _version changes
+_dispatch: Dict[object, Optional[tool_format]] = {}
+_dispatch_version = 0
+
 def add_function(name: str, func: Callable[[float], float], 
-                derivative: Callable[[float], float]) -> None:
+                derivative: Callable[[float], float],
+                second_derivative: Optional[Callable[[float], float]] = None) -> None:
     """
     Add a new function to the implementation dictionary.
     
@@ -37,6 +92,10 @@ def add_function(name: str, func: Callable[[float], float],
         name (str): name of the function
         func (Callable[[float], float]): the function implementation
         derivative (Callable[[float], float]): the function derivative implementation
+        second_derivative (Optional[Callable[[float], float]]): the function second derivative
+        implementation, needed to use the function with HyperDual numbers. If omitted, a second
+        derivative registered under `name` is dropped, unless `func` and `derivative` are the
+        functions already registered.
 
     Example:
         >>> from dual_autodiff.tools import add_function
@@ -49,7 +108,14 @@ def add_function(name: str, func: Callable[[float], float],
         >>> print('The derivative of x cubed at x = 2 is ', x_cubed(x_dual.dual['x']))
         >>> The derivative of x cubed at x = 2 is 12.
     """
+    global _version
+    registered = base_implementations.get(name)
+    if second_derivative is not None:
+        second_derivatives[name] = second_derivative
+    elif registered is None or registered[0] is not func or registered[1] is not derivative:
+        second_derivatives.pop(name, None)
     base_implementations[name] = (func, derivative)
+    _version += 1
 
 def get_functions() -> tool_store:
     """
@@ -62,6 +128,92 @@ def get_functions() -> tool_store:
     """
     return base_implementations.copy()
 
+def get_implementation(ufunc) -> Optional[tool_format]:
+    """
+    Get the function and derivative registered for a NumPy ufunc, without copying the registry.
+    Lookups are cached by ufunc object and the cache is dropped whenever the registry version
+    changes, so this is a single dictionary lookup in the common case.
+
+    Args:
+        ufunc (numpy.ufunc): the ufunc being applied, matched to the registry by its name.
+
+    Returns:
+        Optional[tool_format]: the (function, derivative) pair, or None if the ufunc is not registered.
+
+    Example:
+        >>> f, fprime = get_implementation(np.sin)
+        >>> print(fprime(0.0))
+        >>> 1.0
+    """
+    global _dispatch_version
+    if _dispatch_version != _version:
+        _dispatch.clear()
+        _dispatch_version = _version
+    try:
+        return _dispatch[ufunc]
+    except KeyError:
+        pair = _dispatch[ufunc] = base_implementations.get(getattr(ufunc, '__name__', None))
+        return pair
+
+def registry_version() -> int:
+    """
+    Get the version of the implementation dictionary, incremented by every call to
+    `add_function` or `remove_function`.
+
+    Returns:
+        int: the current version.
+    """
+    return _version
+
+def get_registry() -> Dict[str, Tuple[Callable, Callable, Optional[Callable]]]:
+    """
+    Get a snapshot of the whole registry, to install in another process with `set_registry`.
+    The snapshot pickles as long as every registered function is defined at module level (not a
+    lambda or a nested function), as functions are pickled by reference.
+
+    Returns:
+        Dict[str, Tuple[Callable, Callable, Optional[Callable]]]: the function, derivative and
+        second derivative (or None) of every registered name.
+
+    Example:
+        >>> registry = get_registry()
+        >>> set_registry(registry) #e.g. in a worker process
+    """
+    return {name: (func, derivative, second_derivatives.get(name))
+            for name, (func, derivative) in base_implementations.items()}
+
+def set_registry(registry: Dict[str, Tuple[Callable, Callable, Optional[Callable]]]) -> None:
+    """
+    Replace the whole registry with a snapshot taken by `get_registry`.
+
+    Args:
+        registry (Dict[str, Tuple[Callable, Callable, Optional[Callable]]]): the snapshot.
+    """
+    global _version
+    base_implementations.clear()
+    second_derivatives.clear()
+    for name, (func, derivative, second_derivative) in registry.items():
+        base_implementations[name] = (func, derivative)
+        if second_derivative is not None:
+            second_derivatives[name] = second_derivative
+    _version += 1
+
+def get_second_derivative(name: str) -> Optional[Callable[[float], float]]:
+    """
+    Get the second derivative of a function in the implementation dictionary.
+
+    Args:
+        name (str): name of the function
+
+    Returns:
+        Optional[Callable[[float], float]]: the second derivative, or None if it was not provided.
+
+    Example:
+        >>> print(get_second_derivative('sin')(0.0))
+        >>> -0.0
+    """
+    return second_derivatives.get(name)
+
 def remove_function(name: str) -> None:
     """
     Remove a function from the implementation dictionary.
@@ -74,5 +226,8 @@ def remove_function(name: str) -> None:
         >>> print('Check if sigmoid in tools store before removal: ', 'x_cubed' in list(get_functions().keys()))
         >>> Check if sigmoid in tools store after removal: False
     """
+    global _version
     if name in base_implementations:
-        del base_implementations[name]
\ No newline at end of file
+        del base_implementations[name]
+    second_derivatives.pop(name, None)
+    _version += 1
\ No newline at end of file
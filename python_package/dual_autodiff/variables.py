@@ -0,0 +1,340 @@
+import numpy as np
+from typing import Dict, Iterator, Sequence, Union
+from dual_autodiff.tools import get_implementation
+
+class VariableSpace:
+    """
+    Registry that interns variable names to integer slots.
+    Every variable is given a slot once, so dual numbers created from the same space can store
+    their dual components as dense float64 vectors indexed by slot instead of dictionaries.
+
+    Args:
+        names (Sequence[str]): variable names to register up front, in slot order.
+
+    Example:
+        >>> from dual_autodiff import VariableSpace
+        >>> space = VariableSpace(['x', 'y'])
+        >>> x = space.variable('x', 1.0)
+        >>> y = space.variable('y', 2.0)
+        >>> result = x * y
+        >>> print(result.dual)
+        {'x': 2.0, 'y': 1.0}
+    """
+    def __init__(self, names: Sequence[str] = ()):
+        """
+        Args:
+            names (Sequence[str]): variable names to register up front, in slot order.
+        """
+        self._slots: Dict[str, int] = {}
+        self.names = []
+        for name in names:
+            self.slot(name)
+
+    def slot(self, name: str) -> int:
+        """
+        Gets the slot of a variable, registering it if it has not been seen before.
+
+        Args:
+            name (str): name of the variable.
+
+        Raises:
+            TypeError: If `name` is not a string.
+
+        Returns:
+            int: the slot of the variable.
+        """
+        slot = self._slots.get(name)
+        if slot is None:
+            if not isinstance(name, str):
+                raise TypeError(f"Expected variable name to be a str, but got {type(name).__name__}.")
+            slot = len(self.names)
+            self._slots[name] = slot
+            self.names.append(name)
+        return slot
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __repr__(self):
+        return f"VariableSpace({self.names})"
+
+    def variable(self, name: str, value: Union[float, int]) -> 'DenseDual':
+        """
+        Creates a dual number seeded with respect to one variable.
+
+        Args:
+            name (str): name of the variable.
+            value (Union[float, int]): real component of the variable.
+
+        Returns:
+            DenseDual: a dual number whose dual component is 1 in the slot of `name`.
+        """
+        slot = self.slot(name)
+        tangent = np.zeros(len(self))
+        tangent[slot] = 1.0
+        return DenseDual(value, tangent, self)
+
+    def dual(self, real_component: Union[float, int], dual_component: Dict[str, float]) -> 'DenseDual':
+        """
+        Converts a dictionary dual component, as used by `Dual`, into a dense dual number.
+
+        Args:
+            real_component (Union[float, int]): real component of the dual number.
+            dual_component (Dict[str, float]): dual components keyed by variable name.
+
+        Returns:
+            DenseDual: the equivalent dense dual number.
+        """
+        slots = [self.slot(name) for name in dual_component]
+        tangent = np.zeros(len(self))
+        tangent[slots] = list(dual_component.values())
+        return DenseDual(real_component, tangent, self)
+
+class DenseDual:
+    """
+    Dual numbers class whose dual component is a contiguous float64 vector indexed by the
+    slots of a VariableSpace. Binary operations become fixed-length vector arithmetic, with
+    no hashing of variable names or set unions.
+
+    Args:
+        real_component (Union[float, int]): real component of dual number.
+        tangent (np.ndarray): dual components, one entry per slot of `space`.
+        space (VariableSpace): the variable space that `tangent` is indexed by.
+
+    Raises:
+        TypeError: If `real_component` is not a number or `space` is not a VariableSpace.
+        ValueError: If `tangent` is not 1-D or is longer than `space`.
+    """
+    def __init__(self, real_component: Union[float, int], tangent, space: VariableSpace):
+        """
+        Args:
+            real_component (Union[float, int]): real component of dual number.
+            tangent (np.ndarray): dual components, one entry per slot of `space`.
+            space (VariableSpace): the variable space that `tangent` is indexed by.
+
+        Raises:
+            TypeError: If `real_component` is not a number or `space` is not a VariableSpace.
+            ValueError: If `tangent` is not 1-D or is longer than `space`.
+        """
+        if not isinstance(real_component, (float, int)):
+            raise TypeError(
+                f"Expected 'real_component' to be a float or int, but got {type(real_component).__name__}."
+            )
+        if not isinstance(space, VariableSpace):
+            raise TypeError(
+                f"Expected 'space' to be a VariableSpace, but got {type(space).__name__}."
+            )
+        tangent = np.ascontiguousarray(tangent, dtype=np.float64)
+        if tangent.ndim != 1 or len(tangent) > len(space):
+            raise ValueError(
+                f"Expected 'tangent' to be 1-D with at most {len(space)} entries, but got shape {tangent.shape}."
+            )
+        self.real = real_component
+        self.tangent = tangent
+        self.space = space
+
+    @property
+    def dual(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: the dual components keyed by variable name, as used by `Dual`.
+        """
+        return dict(zip(self.space.names, self.tangent.tolist()))
+
+    def __repr__(self):
+        """
+        Returns a string representation of the dense dual number.
+
+        Returns:
+            string: a string in the format "DenseDual(real=<real>, dual=<dual>)".
+        """
+        return f"DenseDual(real={self.real}, dual={self.dual})"
+
+    def _tangents(self, other: 'DenseDual'):
+        """
+        Returns the tangents of both operands padded to the same length. Tangents created before
+        new variables were registered in the space are shorter and implicitly zero in the new slots.
+
+        Raises:
+            ValueError: If the operands belong to different variable spaces.
+        """
+        if other.space is not self.space:
+            raise ValueError("Cannot combine dual numbers from different VariableSpaces.")
+        a, b = self.tangent, other.tangent
+        if len(a) != len(b):
+            width = max(len(a), len(b))
+            a = np.pad(a, (0, width - len(a)))
+            b = np.pad(b, (0, width - len(b)))
+        return a, b
+
+    def __add__(self, other):
+        """
+        Adds a dense dual number or a scalar to the current dense dual number.
+
+        Returns:
+            DenseDual: the result of the addition.
+        """
+        if isinstance(other, DenseDual):
+            a, b = self._tangents(other)
+            return DenseDual(self.real + other.real, a + b, self.space)
+        return DenseDual(self.real + other, self.tangent.copy(), self.space)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtracts a dense dual number or a scalar from the current dense dual number.
+
+        Returns:
+            DenseDual: the result of the subtraction.
+        """
+        if isinstance(other, DenseDual):
+            a, b = self._tangents(other)
+            return DenseDual(self.real - other.real, a - b, self.space)
+        return DenseDual(self.real - other, self.tangent.copy(), self.space)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the current dense dual number from a scalar.
+
+        Returns:
+            DenseDual: the result of the subtraction.
+        """
+        return DenseDual(other - self.real, -self.tangent, self.space)
+
+    def __mul__(self, other):
+        """
+        Multiplies the current dense dual number by a dense dual number or a scalar.
+        For x = a + bε and y = c + dε the dual part is a * d + b * c.
+
+        Returns:
+            DenseDual: the result of the multiplication.
+        """
+        if isinstance(other, DenseDual):
+            a, b = self._tangents(other)
+            return DenseDual(self.real * other.real, self.real * b + other.real * a, self.space)
+        return DenseDual(self.real * other, self.tangent * other, self.space)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divides the current dense dual number by a dense dual number or a scalar.
+        For x = a + bε and y = c + dε the dual part is (b * c - a * d) / c^2.
+
+        Raises:
+            ZeroDivisionError: if the real component of the divisor is zero.
+
+        Returns:
+            DenseDual: the result of the division.
+        """
+        if isinstance(other, DenseDual):
+            if other.real == 0:
+                raise ZeroDivisionError("Division by zero is not allowed.")
+            a, b = self._tangents(other)
+            return DenseDual(self.real / other.real,
+                             (a * other.real - self.real * b) / (other.real * other.real), self.space)
+        if other == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return DenseDual(self.real / other, self.tangent / other, self.space)
+
+    def __rtruediv__(self, other):
+        """
+        Divides a scalar by the current dense dual number.
+
+        Raises:
+            ZeroDivisionError: if the real component of the current dense dual number is zero.
+
+        Returns:
+            DenseDual: the result of the division.
+        """
+        if self.real == 0:
+            raise ZeroDivisionError("Division by zero is not allowed.")
+        return DenseDual(other / self.real, (-other / (self.real * self.real)) * self.tangent, self.space)
+
+    def __pow__(self, other):
+        """
+        Raises the current dense dual number to the power of a dense dual number or a scalar.
+
+        Raises:
+            ValueError: if the exponent is a dense dual number and the base is not positive.
+
+        Returns:
+            DenseDual: the result of the power calculation.
+        """
+        if isinstance(other, DenseDual):
+            if self.real <= 0:
+                raise ValueError("For Dual number exponents, base must be positive")
+            a, b = self._tangents(other)
+            real_part = self.real ** other.real
+            return DenseDual(real_part,
+                             other.real * self.real ** (other.real - 1) * a + real_part * np.log(self.real) * b,
+                             self.space)
+        return DenseDual(self.real ** other, (other * self.real ** (other - 1)) * self.tangent, self.space)
+
+    def __rpow__(self, other):
+        """
+        Raises a scalar to the power of the current dense dual number.
+
+        Raises:
+            ValueError: If `other` is non-positive.
+
+        Returns:
+            DenseDual: the result of the power calculation.
+        """
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other <= 0:
+            raise ValueError("Base must be positive to raise it to a Dual exponent.")
+        real_part = other ** self.real
+        return DenseDual(real_part, (real_part * np.log(other)) * self.tangent, self.space)
+
+    def __neg__(self):
+        """
+        Negates the real and dual components of the current dense dual number.
+
+        Returns:
+            DenseDual: the negated dense dual number.
+        """
+        return DenseDual(-self.real, -self.tangent, self.space)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Handles NumPy universal functions (ufuncs) for the DenseDual class, using the
+        functions stored in the tools module.
+
+        Returns:
+            DenseDual or NotImplemented:
+                - A new DenseDual if the ufunc is supported and successfully applied.
+                - `NotImplemented` if the ufunc or method is unsupported.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        operators = {
+            np.add: ('__add__', '__radd__'),
+            np.subtract: ('__sub__', '__rsub__'),
+            np.multiply: ('__mul__', '__rmul__'),
+            np.divide: ('__truediv__', '__rtruediv__'),
+            np.power: ('__pow__', '__rpow__'),
+        }
+        if ufunc in operators:
+            forward, reflected = operators[ufunc]
+            if inputs[0] is self:
+                return getattr(self, forward)(inputs[1])
+            return getattr(self, reflected)(inputs[0])
+        if ufunc is np.negative:
+            return -self
+
+        implementation = get_implementation(ufunc)
+        if implementation is not None and len(inputs) == 1:
+            f, fprime = implementation
+            return DenseDual(float(f(self.real)), float(fprime(self.real)) * self.tangent, self.space)
+
+        return NotImplemented
@@ -0,0 +1,64 @@
+# test_batching.py
+import asyncio
+import pytest
+import numpy as np
+from concurrent.futures import Executor, Future
+from dual_autodiff import BatchEvaluator, jacobian
+
+class InlineExecutor(Executor):
+    """
+    In-process stand-in for a thread pool, running each batch as it is submitted.
+    """
+    def __init__(self):
+        self.calls = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls += 1
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+def fmv(p):
+    return [p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0], np.sin(p[0]) * p[1]]
+
+def test_batch_evaluator_coalesces_requests():
+    """
+    Test that concurrent requests are evaluated in batches and match single-point Jacobians.
+    """
+    points = np.random.default_rng(0).random((10, 2))
+    executor = InlineExecutor()
+
+    async def main():
+        async with BatchEvaluator(max_batch_size=4, max_latency=0.05, executor=executor) as evaluator:
+            results = await asyncio.gather(*[evaluator.submit(fmv, point) for point in points])
+            scalar = await evaluator.submit(np.sin, 0.5)
+        return results, scalar, evaluator.batches
+
+    results, scalar, batches = asyncio.run(main())
+    assert batches == executor.calls == 4 #4 + 4 + 2 points, then the scalar request
+    for point, (value, jac) in zip(points, results):
+        assert np.allclose(value, [point[1]**2 * np.sinh(3 * point[0] + 2) + 2 * point[1] + point[0],
+                                   np.sin(point[0]) * point[1]])
+        assert np.allclose(jac, jacobian(fmv, point))
+    assert np.isclose(scalar[0], np.sin(0.5)) and np.isclose(scalar[1], np.cos(0.5))
+
+def test_batch_evaluator_errors():
+    """
+    Test that a failing batch raises in every request and that invalid settings are rejected.
+    """
+    def failing(p):
+        raise RuntimeError("failed")
+
+    async def main():
+        evaluator = BatchEvaluator(max_batch_size=2)
+        return await asyncio.gather(evaluator.submit(failing, [1.0]), evaluator.submit(failing, [2.0]),
+                                    return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(main()))
+    with pytest.raises(ValueError):
+        BatchEvaluator(max_batch_size=0)
+    with pytest.raises(ValueError):
+        BatchEvaluator(max_latency=-1.0)
@@ -0,0 +1,101 @@
+# test_compiler.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, DualArray, compile
+from dual_autodiff.tools import add_function, remove_function
+
+def test_compile_matches_dual():
+    """
+    Test that the compiled evaluator matches Dual numbers over arrays of inputs.
+    """
+    def fmv(x, y):
+        return y**2 * np.sinh(3 * x + 2) + 2 * y + x + 2 ** x - np.log(y) / np.sqrt(x) - np.tan(-x)
+
+    compiled = compile(fmv)
+    xs, ys = np.linspace(0.1, 1, 7), np.linspace(0.5, 2, 7)
+    result = compiled(xs, ys)
+    assert isinstance(result, DualArray)
+    assert result.variables == ('x', 'y')
+    for i in range(7):
+        expected = fmv(Dual(xs[i], {'x': 1.0}), Dual(ys[i], {'y': 1.0}))
+        assert pytest.approx(result.real[i]) == expected.real
+        assert pytest.approx(result.partial('x')[i]) == expected.dual['x']
+        assert pytest.approx(result.partial('y')[i]) == expected.dual['y']
+
+    # Scalars broadcast against arrays
+    assert compiled(xs, 2.0).real.shape == (7,)
+
+def test_compile_multiple_outputs():
+    """
+    Test functions returning tuples, constants and inputs, with user-provided variable names.
+    """
+    compiled = compile(lambda *p: (p[0] * p[1], 3.0, p[1]), variables=['a', 'b'])
+    product, constant, second = compiled(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    np.testing.assert_allclose(product.partial('a'), [3.0, 4.0])
+    np.testing.assert_allclose(product.partial('b'), [1.0, 2.0])
+    np.testing.assert_allclose(constant.real, [3.0, 3.0])
+    np.testing.assert_allclose(constant.dual, 0.0)
+    np.testing.assert_allclose(second.dual, [[0.0, 1.0], [0.0, 1.0]])
+
+    with pytest.raises(TypeError):
+        compiled(1.0)
+
+def test_compile_rejects_branching():
+    """
+    Test that functions using the value of an input are rejected when compiled.
+    """
+    with pytest.raises(TypeError):
+        compile(lambda x: x if x > 0 else -x)
+    with pytest.raises(TypeError):
+        compile(lambda x: float(x) * 2)
+    with pytest.raises(TypeError):
+        compile(lambda x: {'y': x})
+    with pytest.raises(ZeroDivisionError):
+        compile(lambda x: x / 0)
+
+    # Branching on non-input values is traced normally
+    compiled = compile(lambda x, n=3: sum(x ** k for k in range(n)), variables=['x'])
+    assert compiled(2.0).partial('x') == pytest.approx(1 + 2 * 2.0)
+
+def test_compile_retraces_on_registry_change():
+    """
+    Test that a compiled function follows changes to the tools registry.
+    """
+    add_function('cbrt', np.cbrt, lambda x: 1 / (3 * np.cbrt(x)**2))
+    try:
+        compiled = compile(lambda x: np.cbrt(x))
+        assert compiled(8.0).partial('x') == pytest.approx(1 / 12)
+        add_function('cbrt', np.cbrt, lambda x: 2 * np.ones_like(x))
+        assert compiled(8.0).partial('x') == 2.0
+    finally:
+        remove_function('cbrt')
+
+def test_compile_native_backend(tmp_path, monkeypatch):
+    """
+    Test that native kernels match the NumPy evaluator and are loaded from the disk cache.
+    """
+    pytest.importorskip("Cython")
+    from dual_autodiff import native
+    monkeypatch.setenv("DUAL_AUTODIFF_CACHE", str(tmp_path))
+
+    def f(x, y):
+        return x**y * np.sin(3 * x) - np.sqrt(y) / x + 2 ** y
+
+    xs, ys = np.linspace(0.1, 1, 7), np.linspace(0.5, 2, 7)
+    expected = compile(f)(xs, ys)
+    result = compile(f, backend='native')(xs, ys)
+    np.testing.assert_allclose(result.real, expected.real)
+    np.testing.assert_allclose(result.dual, expected.dual)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # A new process finds the kernel on disk instead of compiling it again
+    monkeypatch.setattr(native, "_loaded", {})
+    monkeypatch.setattr(native, "_build", lambda *args: pytest.fail("kernel was rebuilt"))
+    np.testing.assert_allclose(compile(f, backend='native')(xs, ys).dual, expected.dual)
+
+    add_function('cbrt', np.cbrt, lambda x: 1 / (3 * np.cbrt(x)**2))
+    try:
+        with pytest.raises(ValueError):
+            compile(lambda x: np.cbrt(x), backend='native')
+    finally:
+        remove_function('cbrt')
@@ -0,0 +1,53 @@
+# test_derivatives.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, jacobian, gradient
+from dual_autodiff.derivatives import default_chunk_size
+
+def fmv(p):
+    return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+
+def test_default_chunk_size():
+    """
+    Test that the default chunk size splits the inputs into even passes.
+    """
+    assert default_chunk_size(1) == 1
+    assert default_chunk_size(16) == 16
+    assert default_chunk_size(20) == 10
+    assert default_chunk_size(300) == 16
+
+def test_gradient():
+    """
+    Test the forward-mode gradient against Dual numbers for every chunk size.
+    """
+    expected = fmv([Dual(1.0, {'x': 1.0}), Dual(2.0, {'y': 1.0})])
+    for chunk_size in [None, 1, 2, 5]:
+        result = gradient(fmv, [1.0, 2.0], chunk_size=chunk_size)
+        assert result.shape == (2,)
+        assert pytest.approx(result[0]) == expected.dual['x']
+        assert pytest.approx(result[1]) == expected.dual['y']
+
+    assert pytest.approx(gradient(np.sin, 0.5)) == np.cos(0.5)
+
+    # Check that ValueError raised for invalid chunk sizes or vector outputs
+    with pytest.raises(ValueError):
+        gradient(fmv, [1.0, 2.0], chunk_size=0)
+    with pytest.raises(ValueError):
+        gradient(lambda p: [p[0], p[1]], [1.0, 2.0])
+
+def test_jacobian():
+    """
+    Test the Jacobian of a vector-valued function with many inputs.
+    """
+    def f(p):
+        return [p[0] * p[1], np.sin(p[0]), 3.0]
+
+    result = jacobian(f, np.array([1.0, 2.0]))
+    assert np.allclose(result, [[2.0, 1.0], [np.cos(1.0), 0.0], [0.0, 0.0]])
+
+    matrix = np.arange(300 * 4, dtype=float).reshape(4, 300) / 1000
+    def linear(p):
+        return [sum(row[i] * p[i] for i in range(300)) for row in matrix]
+
+    for chunk_size in [None, 7, 300]:
+        assert np.allclose(jacobian(linear, np.ones(300), chunk_size=chunk_size), matrix)
@@ -1,6 +1,7 @@
 # test_dual.py
 import pytest
 import numpy as np
+from decimal import Decimal
 from dual_autodiff import Dual
 
 def test_dual_initialization():
@@ -20,6 +21,16 @@ def test_dual_initialization():
     with pytest.raises(TypeError):
         Dual(1.0, [1.0])  
 
+    # Dual components are stored as floats, and must be convertible to one
+    d = Dual(1.0, {'x': Decimal('0.5'), 'y': np.float32(2)})
+    assert d.dual == {'x': 0.5, 'y': 2.0}
+    d.dual['z'] = Decimal('1.5')
+    assert d.dual['z'] == 1.5
+    with pytest.raises(TypeError, match="'x'"):
+        Dual(1.0, {'x': 'one'})
+    with pytest.raises(TypeError, match="'z'"):
+        d.dual['z'] = None
+
 def test_dual_arithmetic():
     """
     Test addition, subtraction and multiplication with dual numbers and scalars.
@@ -131,6 +142,10 @@ def test_dual_power():
     assert result.real == 8.0
     assert pytest.approx(result.dual['x']) == 12.0
 
+    # Test power of a constant at zero, where the derivative scale is never needed
+    result = Dual(0, {}) ** 0.5
+    assert result.real == 0.0 and result.dual == {}
+
     # Test power with dual exponent
     d2 = Dual(2.0, {'x': 0.5})
     result = d ** d2
@@ -237,6 +252,10 @@ def test_numpy_functions():
     assert pytest.approx(result.real) == np.arctan(0.5)
     assert pytest.approx(result.dual['x']) == 1/(1 + 0.5**2)
 
+    # Errors raised while applying a ufunc reach the caller
+    with pytest.raises(ZeroDivisionError):
+        np.divide(Dual(1.0, {'x': 1.0}), Dual(0.0, {'x': 1.0}))
+
 def test_dual_negation():
     """
     Test that negating a dual number inverts the sign on the real and 
@@ -252,4 +271,71 @@ def test_dual_repr():
     Test string representatation of the Dual class.
     """
     d = Dual(2.0, {'x': 1.0})
-    assert repr(d) == "Dual(real=2.0, dual={'x': 1.0})"
\ No newline at end of file
+    assert repr(d) == "Dual(real=2.0, dual={'x': 1.0})"
+
+def test_dual_compact_storage():
+    """
+    Test that Dual numbers are slotted, share their variable names and still pickle.
+    """
+    import pickle
+    import sys
+    x = Dual(2.0, {'x': 1.0, 'y': 0.0})
+    y = Dual(3.0, {'x': 0.0, 'y': 1.0})
+    assert not hasattr(x, '__dict__')
+    assert x._keys is y._keys
+    assert (x * y)._keys is x._keys
+    assert (x * y).dual == {'x': 3.0, 'y': 2.0}
+    assert sys.getsizeof(x) + sys.getsizeof(x._values) < sys.getsizeof({'x': 1.0, 'y': 0.0}) + 64
+
+    x.dual = {'z': 5.0}
+    assert x.dual == {'z': 5.0}
+
+    restored = pickle.loads(pickle.dumps(y))
+    assert restored.real == 3.0 and restored.dual == y.dual and restored._keys is y._keys
+
+def test_dual_in_place_operators():
+    """
+    Test that the in-place operators match the binary ones and update only the left operand.
+    """
+    x = Dual(2.0, {'x': 1.0, 'y': 2.0})
+    y = Dual(3.0, {'x': 2.0, 'z': 3.0})
+    for op, iop in [(lambda a, b: a + b, '__iadd__'), (lambda a, b: a - b, '__isub__'),
+                    (lambda a, b: a * b, '__imul__'), (lambda a, b: a / b, '__itruediv__')]:
+        for other in (y, x, 4.0):
+            total = Dual(x.real, x.dual)
+            expected = op(total, total if other is x else other)
+            alias = total
+            result = getattr(total, iop)(total if other is x else other)
+            assert result is total and alias is total
+            assert result.real == pytest.approx(expected.real)
+            for var, val in expected.dual.items():
+                assert result.dual.get(var, 0.0) == pytest.approx(val)
+    assert x.dual == {'x': 1.0, 'y': 2.0} and y.dual == {'x': 2.0, 'z': 3.0}
+
+    total = Dual(0, {})
+    for term in (x, y, x):
+        total += term
+    assert total.real == 7.0 and total.dual == {'x': 4.0, 'y': 4.0, 'z': 3.0}
+    with pytest.raises(ZeroDivisionError):
+        total /= 0
+
+def test_dual_view_writes_through():
+    """
+    Test that writes through the dual property update the Dual number.
+    """
+    x = Dual(2.0, {'x': 1.0})
+    x.dual['x'] = 3.0
+    x.dual['y'] = 5.0
+    assert x.dual == {'x': 3.0, 'y': 5.0}
+    assert (x * 2).dual == {'x': 6.0, 'y': 10.0}
+    del x.dual['x']
+    assert dict(x.dual) == {'y': 5.0} and len(x.dual) == 1
+    with pytest.raises(KeyError):
+        x.dual['x']
+
+    # Copies made from the view do not write back
+    copy = Dual(x.real, x.dual)
+    snapshot = x.dual.copy()
+    copy.dual['y'] = 0.0
+    snapshot['y'] = 1.0
+    assert x.dual['y'] == 5.0
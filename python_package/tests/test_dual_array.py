@@ -0,0 +1,207 @@
+# test_dual_array.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, DualArray
+
+def fmv(x, y):
+    return y**2 * np.sinh(3 * x + 2) + 2 * y + x
+
+def test_dual_array_initialization():
+    """
+    Test basic initialisation of the DualArray class and seeding of inputs.
+    """
+    d = DualArray([1.0, 2.0], [[1.0, 0.0], [0.0, 1.0]], ('x', 'y'))
+    assert d.shape == (2,)
+    assert d.variables == ('x', 'y')
+    assert np.array_equal(d.partial('y'), [0.0, 1.0])
+    assert np.array_equal(d.partial('z'), [0.0, 0.0])
+
+    # Check that ValueError raised when the dual component has the wrong shape
+    with pytest.raises(ValueError):
+        DualArray([1.0, 2.0], [1.0, 0.0], ('x', 'y'))
+
+    x, y = DualArray.from_inputs(x=[1.0, 2.0, 3.0], y=4.0)
+    assert x.dual.shape == (3, 2)
+    assert np.array_equal(y.real, [4.0, 4.0, 4.0])
+    assert np.array_equal(y.partial('y'), [1.0, 1.0, 1.0])
+
+def test_dual_array_matches_dual():
+    """
+    Test that evaluating a function on a DualArray gives the same result as
+    evaluating it with one Dual per point.
+    """
+    x_vals = np.linspace(0.1, 0.9, 7)
+    y_vals = np.linspace(1.5, 0.5, 7)
+    x, y = DualArray.from_inputs(x=x_vals, y=y_vals)
+    result = fmv(x, y)
+
+    for i in range(len(x_vals)):
+        expected = fmv(Dual(x_vals[i], {'x': 1, 'y': 0}), Dual(y_vals[i], {'x': 0, 'y': 1}))
+        assert pytest.approx(result.real[i]) == expected.real
+        assert pytest.approx(result.partial('x')[i]) == expected.dual['x']
+        assert pytest.approx(result.partial('y')[i]) == expected.dual['y']
+
+def test_dual_array_arithmetic():
+    """
+    Test division, powers and mixing with Dual numbers and scalars.
+    """
+    x, y = DualArray.from_inputs(x=[1.0, 2.0], y=[2.0, 4.0])
+
+    result = x / y
+    assert np.allclose(result.real, [0.5, 0.5])
+    assert np.allclose(result.partial('x'), [0.5, 0.25])
+    assert np.allclose(result.partial('y'), [-0.25, -0.125])
+
+    result = 2 ** x
+    assert np.allclose(result.partial('x'), np.log(2) * 2 ** np.array([1.0, 2.0]))
+
+    result = x ** y
+    assert np.allclose(result.partial('y'), np.log([1.0, 2.0]) * np.array([1.0, 16.0]))
+
+    result = 1 - x * Dual(3.0, {'z': 1.0})
+    assert result.variables == ('x', 'y', 'z')
+    assert np.allclose(result.partial('z'), [-1.0, -2.0])
+
+    with pytest.raises(ZeroDivisionError):
+        x / DualArray.from_inputs(x=[0.0, 1.0])[0]
+
+def test_dual_array_numpy_functions():
+    """
+    Test that the tools functions are applied to every point at once.
+    """
+    x, = DualArray.from_inputs(x=[0.25, 0.5])
+    for name in ['sin', 'cos', 'tan', 'exp', 'log', 'sqrt', 'arctan']:
+        result = getattr(np, name)(x)
+        for i, point in enumerate([0.25, 0.5]):
+            expected = getattr(np, name)(Dual(point, {'x': 1.0}))
+            assert pytest.approx(result.real[i]) == expected.real
+            assert pytest.approx(result.partial('x')[i]) == expected.dual['x']
+
+def test_dual_array_indexing():
+    """
+    Test that indexing a single point returns a Dual number and packing Duals back.
+    """
+    x, y = DualArray.from_inputs(x=[1.0, 2.0], y=[3.0, 4.0])
+    point = (x * y)[1]
+    assert isinstance(point, Dual)
+    assert point.real == 8.0
+    assert point.dual == {'x': 4.0, 'y': 2.0}
+
+    packed = DualArray.from_duals([Dual(1.0, {'x': 1.0}), Dual(2.0, {'y': 3.0})])
+    assert packed.variables == ('x', 'y')
+    assert np.array_equal(packed.dual, [[1.0, 0.0], [0.0, 3.0]])
+
+def _dual_grid():
+    """
+    Builds a 3 x 4 grid of Dual numbers (with one zero) and the matching DualArray.
+    """
+    values = np.linspace(-1.5, 2.0, 12).reshape(3, 4)
+    values[1, 2] = 0.0
+    duals = np.empty(values.shape, dtype=object)
+    for i, j in np.ndindex(values.shape):
+        duals[i, j] = Dual(values[i, j], {'x': i + 1.0, 'y': j - 1.0})
+    return duals, DualArray.from_duals(duals)
+
+def _assert_matches(result, expected):
+    expected = DualArray.from_duals(expected)
+    assert np.allclose(result.real, expected.real)
+    for var in ('x', 'y'):
+        assert np.allclose(result.partial(var), expected.partial(var))
+
+def test_dual_array_reduce_accumulate():
+    """
+    Test reduce and accumulate against folding the Dual operators element by element.
+    """
+    duals, array = _dual_grid()
+    operators = {np.add: lambda a, b: a + b, np.subtract: lambda a, b: a - b, np.multiply: lambda a, b: a * b}
+    for ufunc, op in operators.items():
+        fold = np.frompyfunc(op, 2, 1)
+        for axis in (0, 1, -1):
+            _assert_matches(ufunc.reduce(array, axis=axis), fold.reduce(duals, axis=axis))
+            _assert_matches(ufunc.accumulate(array, axis=axis), fold.accumulate(duals, axis=axis))
+
+    total = np.multiply.reduce(array, axis=None, keepdims=True)
+    assert total.shape == (1, 1)
+    _assert_matches(total, np.array([[np.prod(duals.ravel())]], dtype=object))
+    _assert_matches(np.add.reduce(array, axis=None), np.sum(duals))
+
+def test_dual_array_outer():
+    """
+    Test ufunc.outer with DualArray, Dual and array operands.
+    """
+    duals, array = _dual_grid()
+    result = np.multiply.outer(array[0], array[1])
+    assert result.shape == (4, 4)
+    _assert_matches(result, np.multiply.outer(duals[0], duals[1]))
+
+    x = Dual(2.0, {'x': 1.0})
+    result = np.add.outer(x, np.arange(3.0))
+    assert np.array_equal(result.real, [2.0, 3.0, 4.0])
+    assert np.array_equal(result.partial('x'), [1.0, 1.0, 1.0])
+    assert np.multiply.outer(array, np.ones(2)).shape == (3, 4, 2)
+
+def _seeded(values, prefix):
+    """
+    Seeds every entry of `values` with its own variable, so partials are Jacobian columns.
+    """
+    values = np.asarray(values, dtype=float)
+    dual = np.eye(values.size).reshape(values.shape + (values.size,))
+    return DualArray(values, dual, [f"{prefix}{i}" for i in range(values.size)])
+
+def _assert_jacobian(f, a, b):
+    """
+    Compares the partials of f on seeded DualArrays with central finite differences.
+    """
+    result = f(_seeded(a, 'a'), _seeded(b, 'b'))
+    assert np.allclose(result.real, f(a, b))
+    h = 1e-6
+    for prefix, values in (('a', a), ('b', b)):
+        for i in range(values.size):
+            step = np.zeros(values.size)
+            step[i] = h
+            step = step.reshape(values.shape)
+            args = (a + step, b) if prefix == 'a' else (a, b + step)
+            back = (a - step, b) if prefix == 'a' else (a, b - step)
+            expected = (np.asarray(f(*args)) - np.asarray(f(*back))) / (2 * h)
+            assert np.allclose(result.partial(f"{prefix}{i}"), expected, atol=1e-6)
+
+def test_dual_array_array_functions():
+    """
+    Test np.dot, np.einsum, np.sum, np.mean, np.prod and np.linalg.norm against finite differences.
+    """
+    rng = np.random.default_rng(0)
+    matrix, vector = rng.normal(size=(3, 4)), rng.normal(size=4)
+    _assert_jacobian(lambda a, b: np.dot(a, b), matrix, vector)
+    _assert_jacobian(lambda a, b: np.dot(b, b) * np.dot(np.ones(3), a), matrix, vector)
+    _assert_jacobian(lambda a, b: np.dot(a, b), rng.normal(size=(2, 3, 4)), rng.normal(size=(5, 4, 2)))
+    _assert_jacobian(lambda a, b: np.einsum('ij,j->i', a, b), matrix, vector)
+    _assert_jacobian(lambda a, b: np.einsum('ij,ij', a, a) + np.einsum('...j,j', a, b)[0], matrix, vector)
+    _assert_jacobian(lambda a, b: np.sum(a, axis=1) * np.mean(b) + np.prod(a, axis=0)[:3], matrix, vector)
+    _assert_jacobian(lambda a, b: np.linalg.norm(a) + np.linalg.norm(a, axis=0)[:3] + np.linalg.norm(b), matrix, vector)
+
+def test_dual_array_functions_on_duals():
+    """
+    Test that NumPy functions called with Dual numbers pack them into a DualArray.
+    """
+    x = Dual(2.0, {'x': 1.0})
+    duals = np.array([Dual(1.0, {'x': 1.0}), Dual(3.0, {'y': 1.0})], dtype=object)
+    result = np.dot(x, duals)
+    assert isinstance(result, DualArray)
+    assert np.array_equal(result.real, [2.0, 6.0])
+    assert np.array_equal(result.partial('x'), [3.0, 3.0])
+    assert np.array_equal(result.partial('y'), [0.0, 2.0])
+    assert np.shape(DualArray.from_duals(duals)) == (2,)
+
+    # Scalar results stay Dual numbers
+    total = np.sum(x)
+    assert isinstance(total, Dual) and total.real == 2.0 and total.dual == {'x': 1.0}
+    product = np.dot(x, Dual(3.0, {'y': 1.0}))
+    assert isinstance(product, Dual) and product.dual == {'x': 3.0, 'y': 2.0}
+    assert isinstance(np.sum(duals), Dual) and np.sum(duals).real == 4.0
+
+    # Shape queries are supported, other NumPy functions are not
+    assert np.shape(x) == () and np.ndim(x) == 0 and np.size(DualArray.from_duals(duals)) == 2
+    with pytest.raises(TypeError):
+        np.cumsum(DualArray.from_duals(duals))
+    with pytest.raises(TypeError):
+        np.concatenate([x, x])
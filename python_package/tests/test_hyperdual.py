@@ -0,0 +1,77 @@
+# test_hyperdual.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, VariableSpace, HyperDual, hessian
+from dual_autodiff.tools import add_function, remove_function, get_second_derivative
+
+def test_hyperdual_initialization():
+    """
+    Test construction of HyperDual numbers.
+    """
+    space = VariableSpace()
+    x = HyperDual.variable('x', 2.0, space)
+    assert x.real == 2.0
+    assert x.dual == {'x': 1.0}
+    assert np.array_equal(x.hessian, [[0.0]])
+
+    with pytest.raises(ValueError):
+        HyperDual(1.0, [1.0], np.zeros((2, 2)), space)
+    with pytest.raises(TypeError):
+        HyperDual(1.0, [1.0], [[0.0]], None)
+
+def test_hyperdual_arithmetic():
+    """
+    Test the Hessians of products, quotients and powers.
+    """
+    space = VariableSpace()
+    x = HyperDual.variable('x', 2.0, space)
+    y = HyperDual.variable('y', 3.0, space)
+
+    result = x**2 * y
+    assert result.real == 12.0
+    assert np.allclose(result.gradient, [12.0, 4.0])
+    assert np.allclose(result.hessian, [[6.0, 4.0], [4.0, 0.0]])
+
+    result = x / y
+    assert np.allclose(result.hessian, [[0.0, -1 / 9], [-1 / 9, 2 * 2 / 27]])
+
+    result = x ** y
+    log_x = np.log(2.0)
+    assert np.allclose(result.hessian, [[3 * 2 * 2.0, 4 * (1 + 3 * log_x)],
+                                        [4 * (1 + 3 * log_x), 8 * log_x**2]])
+
+    with pytest.raises(ZeroDivisionError):
+        x / HyperDual.variable('z', 0.0, space)
+
+def test_hessian_matches_gradient():
+    """
+    Test the Hessian of a function using every tools function against second derivatives and
+    the Dual gradient.
+    """
+    def fmv(p):
+        return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+
+    result = hessian(fmv, [0.5, 1.5])
+    x, y = 0.5, 1.5
+    assert np.allclose(result, [[9 * y**2 * np.sinh(3 * x + 2), 6 * y * np.cosh(3 * x + 2)],
+                                [6 * y * np.cosh(3 * x + 2), 2 * np.sinh(3 * x + 2)]])
+
+    functions = ['sin', 'cos', 'tan', 'sinh', 'cosh', 'tanh', 'exp', 'log', 'sqrt', 'arcsin', 'arccos', 'arctan']
+    h = 1e-6
+    for name in functions:
+        f = getattr(np, name)
+        numerical = (f(Dual(0.5 + h, {'x': 1.0})).dual['x'] - f(Dual(0.5 - h, {'x': 1.0})).dual['x']) / (2 * h)
+        assert pytest.approx(hessian(f, 0.5), rel=1e-5) == numerical
+
+def test_custom_second_derivative():
+    """
+    Test that add_function accepts an optional second derivative.
+    """
+    add_function('cube', lambda x: x**3, lambda x: 3 * x**2, lambda x: 6 * x)
+    assert get_second_derivative('cube')(2.0) == 12.0
+
+    add_function('cube', lambda x: x**3, lambda x: 3 * x**2)
+    assert get_second_derivative('cube') is None
+
+    remove_function('cube')
+    assert get_second_derivative('cube') is None
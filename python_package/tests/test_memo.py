@@ -0,0 +1,93 @@
+# test_memo.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, DualArray, memoize
+from dual_autodiff.memo import _pack
+
+def test_memoize_hits_and_eviction():
+    """
+    Test that repeated points are served from the cache and old points are evicted.
+    """
+    calls = []
+
+    @memoize(maxsize=2)
+    def f(x, y, scale=1.0):
+        calls.append((x.real, y.real))
+        return scale * (y**2 * np.sinh(3 * x + 2) + 2 * y + x)
+
+    first = f(Dual(0.5, {'x': 1.0}), Dual(1.0, {'y': 1.0}))
+    again = f(Dual(0.5, {'x': 1.0}), Dual(1.0, {'y': 1.0}))
+    assert len(calls) == 1
+    assert again is not first and again.real == first.real and again.dual == first.dual
+
+    # Different seed directions are different points
+    f(Dual(0.5, {'x': 2.0}), Dual(1.0, {'y': 1.0}))
+    assert len(calls) == 2
+    f(Dual(0.5, {'x': 1.0}), Dual(1.0, {'y': 1.0}), scale=2.0)
+    assert len(calls) == 3
+    assert f.cache_info() == (1, 3, 2, 2)
+
+    f(Dual(0.5, {'x': 1.0}), Dual(1.0, {'y': 1.0})) #evicted by the last two points
+    assert len(calls) == 4
+
+    # In-place updates of a returned result do not reach the cache
+    result = f(Dual(0.5, {'x': 1.0}), Dual(1.0, {'y': 1.0}))
+    result += 1
+    assert f(Dual(0.5, {'x': 1.0}), Dual(1.0, {'y': 1.0})).real == first.real
+
+    f.cache_clear()
+    assert f.cache_info() == (0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        memoize(f, maxsize=0)
+
+def test_memoize_compact():
+    """
+    Test that sequences and arrays of Dual numbers are stored as one DualArray and rebuilt as the
+    same kind of container.
+    """
+    @memoize(compact=True)
+    def f(p, name):
+        results = [p[0] * p[1], np.sin(p[0])]
+        if name == 'ndarray':
+            array = np.empty(2, dtype=object)
+            array[0], array[1] = results
+            return array
+        return kinds[name](results)
+
+    kinds = {'list': list, 'tuple': tuple, 'ndarray': np.ndarray}
+
+    point = np.array([Dual(2.0, {'x': 1.0}), Dual(3.0, {'y': 1.0})], dtype=object)
+    for name, kind in kinds.items():
+        expected = f(point, name)
+        stored = _pack(expected)
+        assert stored[0] is kind and isinstance(stored[1], DualArray)
+        assert set(stored[1].variables) == {'x', 'y'}
+
+        results = f(point, name)
+        assert type(results) is kind and len(results) == 2
+        for result, value in zip(results, expected):
+            assert isinstance(result, Dual) and result.real == value.real
+            for var in ('x', 'y'):
+                assert result.dual.get(var, 0.0) == value.dual.get(var, 0.0)
+    assert f.cache_info().hits == 3
+
+    # A single Dual number is stored as its value array
+    single = memoize(lambda x: 2 * x, compact=True)
+    single(Dual(1.0, {'x': 1.0}))
+    assert single(Dual(1.0, {'x': 1.0})).dual == {'x': 2.0}
+
+def test_memoize_keys_are_typed():
+    """
+    Test that equal numbers of different types are cached separately, like lru_cache(typed=True).
+    """
+    calls = []
+
+    @memoize
+    def f(x):
+        calls.append(x)
+        return x
+
+    assert type(f(1)) is int and type(f(1.0)) is float and type(f(True)) is bool
+    assert len(calls) == 3
+    f(1.0)
+    assert len(calls) == 3
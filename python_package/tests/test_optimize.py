@@ -0,0 +1,39 @@
+# test_optimize.py
+import pytest
+import numpy as np
+from dual_autodiff import compile
+from dual_autodiff.compiler import trace
+from dual_autodiff.optimize import count_operations, optimize
+
+def test_optimize_simplifies_graph():
+    """
+    Test common subexpressions, constant folding, identities and integer powers.
+    """
+    graph, outputs, _ = trace(lambda x: np.sinh(3 * x + 2) * np.cosh(3 * x + 2) + x**2 * (2 * 3) / 1 - 0, 1)
+    simplified, outputs = optimize(graph, outputs)
+    ops = [op for op, _, _ in simplified.nodes]
+    assert ops.count('add') == 1 + 1 #3 * x + 2 once, plus the final sum
+    assert 'pow' not in ops and 'div' not in ops and 'sub' not in ops
+    assert [payload for op, _, payload in simplified.nodes if op == 'const'] == [3.0, 2.0, 6.0]
+    assert len(simplified) < len(graph)
+    assert count_operations(simplified) < count_operations(graph)
+
+    # Outputs that fold to constants carry no tangent
+    graph, outputs, _ = trace(lambda x: (x * 0 + np.exp(2 ** 3), -(-x)), 1)
+    simplified, outputs = optimize(graph, outputs)
+    assert simplified.nodes[outputs[1]] == ('input', (), 0)
+    assert ('const', (), float(np.exp(8.0))) in simplified.nodes
+
+def test_optimized_matches_unoptimized():
+    """
+    Test that optimised evaluators give the same values and derivatives with fewer operations.
+    """
+    def fmv(x, y):
+        return y**2 * np.sinh(3 * x + 2) + 2 * y + x + x**-3 + y**4 / (3 * x + 2) - np.sqrt(x) ** 1 + x**0.5
+
+    optimized, naive = compile(fmv), compile(fmv, optimized=False)
+    xs, ys = np.linspace(0.1, 1, 7), np.linspace(0.5, 2, 7)
+    result, expected = optimized(xs, ys), naive(xs, ys)
+    np.testing.assert_allclose(result.real, expected.real)
+    np.testing.assert_allclose(result.dual, expected.dual)
+    assert count_operations(optimized.graph) < count_operations(naive.graph)
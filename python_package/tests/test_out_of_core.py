@@ -0,0 +1,54 @@
+# test_out_of_core.py
+import pytest
+import numpy as np
+from dual_autodiff import jacobian_to_disk, jacobian
+
+def fmv(p):
+    return [p[0] * p[1], np.sin(p[0]) + np.exp(p[1])]
+
+def test_jacobian_to_disk_resumes(tmp_path):
+    """
+    Test that an interrupted run resumes after its last completed chunk and matches `jacobian`.
+    """
+    points = np.random.default_rng(0).random((10, 2))
+    np.save(tmp_path / "points.npy", points)
+    calls = []
+
+    def interrupted(p):
+        calls.append(len(p[0].real))
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        return fmv(p)
+
+    with pytest.raises(KeyboardInterrupt):
+        jacobian_to_disk(interrupted, str(tmp_path / "points.npy"), str(tmp_path / "out"), chunk_size=3)
+    calls.clear()
+    values, jac = jacobian_to_disk(interrupted, str(tmp_path / "points.npy"), str(tmp_path / "out"), chunk_size=3)
+    assert calls == [3, 1] #the last two chunks
+    assert values.shape == (10, 2) and jac.shape == (10, 2, 2)
+    for point, value, rows in zip(points, values, jac):
+        assert np.allclose(value, [point[0] * point[1], np.sin(point[0]) + np.exp(point[1])])
+        assert np.allclose(rows, jacobian(fmv, point))
+
+    # Finished runs are not evaluated again
+    calls.clear()
+    jacobian_to_disk(interrupted, str(tmp_path / "points.npy"), str(tmp_path / "out"), chunk_size=3)
+    assert calls == []
+    with pytest.raises(ValueError):
+        jacobian_to_disk(fmv, points, str(tmp_path / "out"), chunk_size=4)
+
+    # Different points of the same shape are not mixed into an existing run
+    np.save(tmp_path / "points.npy", points[::-1])
+    with pytest.raises(ValueError):
+        jacobian_to_disk(fmv, str(tmp_path / "points.npy"), str(tmp_path / "out"), chunk_size=3)
+    jacobian_to_disk(fmv, points, str(tmp_path / "memory"), chunk_size=3)
+    with pytest.raises(ValueError):
+        jacobian_to_disk(fmv, points + 1.0, str(tmp_path / "memory"), chunk_size=3)
+
+def test_jacobian_to_disk_scalar_points(tmp_path):
+    """
+    Test scalar points given as an in-memory array.
+    """
+    x = np.linspace(0, 1, 7)
+    values, derivatives = jacobian_to_disk(np.sin, x, str(tmp_path), chunk_size=2)
+    assert np.allclose(values, np.sin(x)) and np.allclose(derivatives, np.cos(x))
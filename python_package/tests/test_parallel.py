@@ -0,0 +1,42 @@
+# test_parallel.py
+import pickle
+import pytest
+import numpy as np
+from dual_autodiff import evaluate_many, jacobian
+from dual_autodiff.tools import get_registry, set_registry
+
+def fmv(p):
+    return [p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0], np.sin(p[0]) * np.exp(p[1])]
+
+def test_evaluate_many_matches_jacobian():
+    """
+    Test that values and Jacobians computed on a process pool match single-point evaluation.
+    """
+    points = np.random.default_rng(0).random((40, 2))
+    values, jacobians = evaluate_many(fmv, points, workers=2, chunk_size=7)
+    assert values.shape == (40, 2) and jacobians.shape == (40, 2, 2)
+    for point, value, jac in zip(points, values, jacobians):
+        expected = [np.sinh(3 * point[0] + 2) * point[1]**2 + 2 * point[1] + point[0],
+                    np.sin(point[0]) * np.exp(point[1])]
+        assert np.allclose(value, expected)
+        assert np.allclose(jac, jacobian(fmv, point))
+
+    # In-process evaluation of scalar inputs
+    values, jacobians = evaluate_many(np.sin, np.linspace(0, 1, 5), workers=1)
+    assert np.allclose(values, np.sin(np.linspace(0, 1, 5)))
+    assert np.allclose(jacobians, np.cos(np.linspace(0, 1, 5))[:, None])
+
+    with pytest.raises(TypeError):
+        evaluate_many(lambda p: p[0] * p[1], points, workers=2)
+    with pytest.raises(ValueError):
+        evaluate_many(fmv, points, workers=0)
+
+def test_registry_pickles():
+    """
+    Test that the tools registry round-trips through pickle, so it can be sent to workers.
+    """
+    registry = get_registry()
+    restored = pickle.loads(pickle.dumps(registry))
+    assert restored['sin'][0] is np.sin and restored['sin'][1](0.0) == 1.0
+    set_registry(restored)
+    assert get_registry()['cos'][1](0.0) == 0.0
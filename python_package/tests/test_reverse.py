@@ -0,0 +1,71 @@
+# test_reverse.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, Tape, Var, grad, vjp
+
+def test_tape_gradient():
+    """
+    Test that one backward sweep gives the partial derivatives with respect to every input.
+    """
+    tape = Tape()
+    x = tape.variable(2.0)
+    y = tape.variable(3.0)
+    z = x * y + np.sin(x) - y / x
+
+    assert isinstance(z, Var)
+    assert pytest.approx(z.real) == 6.0 + np.sin(2.0) - 1.5
+    gradient = tape.gradient(z, [x, y])
+    assert pytest.approx(gradient[0]) == 3.0 + np.cos(2.0) + 3.0 / 4.0
+    assert pytest.approx(gradient[1]) == 2.0 - 0.5
+
+    # Check that ZeroDivisionError raised when dividing by zero
+    with pytest.raises(ZeroDivisionError):
+        x / tape.variable(0.0)
+
+    # Check that Vars from different tapes cannot be combined
+    with pytest.raises(ValueError):
+        x + Tape().variable(1.0)
+
+def test_grad_matches_dual():
+    """
+    Test that reverse-mode gradients match forward-mode Dual derivatives for all tools functions.
+    """
+    def fmv(p):
+        x, y = p[0], p[1]
+        return y**2 * np.sinh(3 * x + 2) + 2 * y + x + 2 ** x - np.log(y) / np.sqrt(x)
+
+    point = np.array([0.3, 0.7])
+    gradient = grad(fmv)(point)
+    expected = fmv([Dual(0.3, {'x': 1.0}), Dual(0.7, {'y': 1.0})])
+
+    assert gradient.shape == (2,)
+    assert pytest.approx(gradient[0]) == expected.dual['x']
+    assert pytest.approx(gradient[1]) == expected.dual['y']
+
+    functions = ['sin', 'cos', 'tan', 'sinh', 'cosh', 'tanh', 'exp', 'log', 'sqrt', 'arcsin', 'arccos', 'arctan']
+    for name in functions:
+        derivative = grad(getattr(np, name))(0.5)
+        assert pytest.approx(derivative) == getattr(np, name)(Dual(0.5, {'x': 1.0})).dual['x']
+
+def test_grad_many_inputs():
+    """
+    Test the gradient of a loss with many inputs.
+    """
+    def loss(p):
+        total = 0
+        for i in range(len(p)):
+            total = total + (p[i] - i) ** 2
+        return total
+
+    point = np.linspace(0, 1, 200)
+    assert np.allclose(grad(loss)(point), 2 * (point - np.arange(200)))
+
+def test_vjp():
+    """
+    Test vector-Jacobian products with a vector-valued function.
+    """
+    value, pullback = vjp(lambda p: [p[0] * p[1], np.sin(p[0]), 3.0], np.array([1.0, 2.0]))
+    assert np.allclose(value, [2.0, np.sin(1.0), 3.0])
+    assert np.allclose(pullback([1.0, 0.0, 0.0]), [2.0, 1.0])
+    assert np.allclose(pullback([0.0, 1.0, 5.0]), [np.cos(1.0), 0.0])
+    assert np.allclose(pullback([1.0, 1.0, 1.0]), [2.0 + np.cos(1.0), 1.0])
@@ -0,0 +1,46 @@
+# test_serialization.py
+import pickle
+import pytest
+import numpy as np
+from dual_autodiff import Dual, DualArray, to_bytes, from_bytes
+
+def test_round_trips():
+    """
+    Test that Dual numbers, sequences of them and DualArrays survive serialization.
+    """
+    x = Dual(2.0, {'x': 1.0, 'y': -0.5})
+    restored = from_bytes(to_bytes(x))
+    assert restored.real == x.real and restored.dual == x.dual
+
+    duals = [Dual(float(i), {'x': 1.0, 'y': 2.0 * i}) for i in range(5)] + [Dual(9.0, {'x': 3.0})]
+    restored = from_bytes(to_bytes(duals))
+    assert [d.real for d in restored] == [d.real for d in duals]
+    assert restored[2].dual == {'x': 1.0, 'y': 4.0} and restored[5].dual == {'x': 3.0, 'y': 0.0}
+    assert from_bytes(to_bytes([])) == []
+
+    a, b = DualArray.from_inputs(a=np.linspace(0, 1, 6).reshape(2, 3), b=np.ones((2, 3)))
+    product = a * b
+    data = to_bytes(product)
+    restored = from_bytes(memoryview(data))
+    assert restored.variables == ('a', 'b')
+    np.testing.assert_array_equal(restored.real, product.real)
+    np.testing.assert_array_equal(restored.dual, product.dual)
+    assert not restored.dual.flags.writeable #a view of the bytes
+
+    with pytest.raises(TypeError):
+        to_bytes({'x': 1.0})
+    with pytest.raises(ValueError):
+        from_bytes(b"DUAX" + data[4:])
+
+def test_dual_array_pickles_out_of_band():
+    """
+    Test that pickle protocol 5 passes the components of a DualArray as out-of-band buffers.
+    """
+    x, y = DualArray.from_inputs(x=np.linspace(0, 1, 1000), y=np.ones(1000))
+    result = np.sin(x) * y
+    buffers = []
+    data = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2 and len(data) < 1000
+    restored = pickle.loads(data, buffers=buffers)
+    np.testing.assert_array_equal(restored.dual, result.dual)
+    assert restored.variables == result.variables
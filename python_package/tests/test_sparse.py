@@ -0,0 +1,62 @@
+# test_sparse.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, VariableSpace, SparseDual
+
+def test_sparse_dual_initialization():
+    """
+    Test construction of sparse dual numbers and dropping of explicit zeros.
+    """
+    space = VariableSpace()
+    x = SparseDual.from_dict(1.0, {'y': 0, 'x': 1}, space)
+    assert x.nnz == 1
+    assert x.dual == {'x': 1.0}
+    assert np.array_equal(x.to_dense().tangent, [0.0, 1.0])
+
+    with pytest.raises(ValueError):
+        SparseDual(2.0, [3, 1], [1.0, 2.0], VariableSpace(['a', 'b', 'c', 'd']))
+    with pytest.raises(ValueError):
+        SparseDual(2.0, [0, 1], [1.0], space)
+    with pytest.raises(TypeError):
+        SparseDual(2.0, [0], [1.0], {'x': 0})
+
+def test_sparse_dual_merge():
+    """
+    Test that addition and multiplication merge the sparse dual components.
+    """
+    space = VariableSpace(['a', 'b', 'c', 'd'])
+    x = SparseDual(2.0, [0, 2], [1.0, 2.0], space)
+    y = SparseDual(3.0, [1, 2], [4.0, -2.0], space)
+
+    result = x + y
+    assert np.array_equal(result.indices, [0, 1])
+    assert result.dual == {'a': 1.0, 'b': 4.0}
+
+    result = x * y
+    assert result.real == 6.0
+    assert result.dual == {'a': 3.0, 'b': 8.0, 'c': 2.0}
+
+    # Multiplying by a constant zero leaves no stored dual components
+    assert (x * 0).nnz == 0
+
+    # Powers of a constant at zero never need the derivative scale
+    result = SparseDual(0.0, [], [], space) ** 0.5
+    assert result.real == 0.0 and result.nnz == 0
+
+def test_sparse_dual_matches_dual():
+    """
+    Test that sparse dual numbers give the same derivatives as dictionary-based Dual numbers.
+    """
+    def fmv(x, y):
+        return y**2 * np.sinh(3 * x + 2) + 2 * y + x / y - 2 ** x
+
+    space = VariableSpace()
+    sparse = fmv(SparseDual.from_dict(0.5, {'x': 1}, space), SparseDual.from_dict(1.5, {'y': 1}, space))
+    expected = fmv(Dual(0.5, {'x': 1.0}), Dual(1.5, {'y': 1.0}))
+
+    assert pytest.approx(sparse.real) == expected.real
+    assert pytest.approx(sparse.dual['x']) == expected.dual['x']
+    assert pytest.approx(sparse.dual['y']) == expected.dual['y']
+
+    with pytest.raises(ZeroDivisionError):
+        sparse / SparseDual.from_dict(0.0, {'x': 1}, space)
@@ -0,0 +1,42 @@
+# test_streaming.py
+import itertools
+import pytest
+import numpy as np
+from dual_autodiff import stream_derivatives, jacobian
+
+def test_stream_derivatives_chunks():
+    """
+    Test that streamed chunks match single-point Jacobians and that the last chunk is shorter.
+    """
+    def f(p):
+        return p[1]**2 * np.sinh(3 * p[0] + 2) + 2 * p[1] + p[0]
+
+    points = [(x, 1.0 + x) for x in np.linspace(0, 1, 10)]
+    chunks = list(stream_derivatives(f, iter(points), chunk_size=4))
+    assert [len(values) for values, _ in chunks] == [4, 4, 2]
+    values = np.concatenate([values for values, _ in chunks])
+    gradients = np.concatenate([jac for _, jac in chunks])
+    for point, value, gradient in zip(points, values, gradients):
+        assert np.isclose(value, f(point))
+        assert np.allclose(gradient, jacobian(f, np.array(point)))
+
+def test_stream_derivatives_is_lazy():
+    """
+    Test that an infinite generator of scalar points is consumed one chunk at a time.
+    """
+    pulled = []
+
+    def points():
+        for x in itertools.count():
+            pulled.append(x)
+            yield 0.01 * x
+
+    stream = stream_derivatives(np.sin, points(), chunk_size=3)
+    values, derivatives = next(stream)
+    assert len(pulled) == 3
+    assert np.allclose(values, np.sin([0.0, 0.01, 0.02])) and np.allclose(derivatives, np.cos([0.0, 0.01, 0.02]))
+
+    with pytest.raises(ValueError):
+        next(stream_derivatives(np.sin, [1.0], chunk_size=0))
+    with pytest.raises(ValueError):
+        next(stream_derivatives(np.sin, [1.0, [1.0, 2.0]]))
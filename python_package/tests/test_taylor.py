@@ -0,0 +1,84 @@
+# test_taylor.py
+import pytest
+import numpy as np
+from math import factorial
+from dual_autodiff import Dual, Taylor, taylor_derivatives
+from dual_autodiff.tools import add_function, remove_function
+
+def test_taylor_initialization():
+    """
+    Test construction of Taylor polynomials.
+    """
+    x = Taylor.variable(2.0, degree=3)
+    assert x.degree == 3
+    assert x.real == 2.0
+    assert np.array_equal(x.coefficients, [2.0, 1.0, 0.0, 0.0])
+
+    with pytest.raises(ValueError):
+        Taylor.variable(1.0, degree=-1)
+    with pytest.raises(ValueError):
+        Taylor([])
+
+def test_taylor_known_series():
+    """
+    Test derivatives of functions with known closed forms.
+    """
+    assert np.allclose(taylor_derivatives(np.sin, 0.0, 5), [0.0, 1.0, 0.0, -1.0, 0.0, 1.0])
+    assert np.allclose(taylor_derivatives(np.exp, 1.0, 4), np.e)
+    # d^k/dx^k log(x) = (-1)^(k-1) (k-1)! / x^k
+    expected = [np.log(2.0)] + [(-1)**(k - 1) * factorial(k - 1) / 2.0**k for k in range(1, 6)]
+    assert np.allclose(taylor_derivatives(np.log, 2.0, 5), expected)
+    # d^k/dx^k 1 / (1 - x) = k! / (1 - x)^(k+1)
+    expected = [factorial(k) / 0.5**(k + 1) for k in range(6)]
+    assert np.allclose(taylor_derivatives(lambda x: 1 / (1 - x), 0.5, 5), expected)
+    assert np.allclose(taylor_derivatives(lambda x: x**3, 0.0, 4), [0.0, 0.0, 0.0, 6.0, 0.0])
+
+def test_taylor_matches_finite_differences():
+    """
+    Test every tools function against finite differences of the next lower derivative.
+    """
+    def f(x):
+        return (np.sin(x) * np.cos(x) + np.tan(x) + np.sinh(x) / np.cosh(x) - np.tanh(x) + np.sqrt(x)
+                + np.arcsin(x) * np.arccos(x) + np.arctan(x) ** 2.5 + 2**x + x**x - np.log(x) * np.exp(x))
+
+    h = 1e-5
+    d = taylor_derivatives(f, np.array([0.4 - h, 0.4, 0.4 + h]), 5)
+    assert d.shape == (3, 6)
+    assert np.allclose(d[1, 1:], (d[2, :-1] - d[0, :-1]) / (2 * h), rtol=1e-6)
+
+    x = Dual(0.4, {'x': 1.0})
+    assert np.isclose(d[1, 1], f(x).dual['x'])
+
+def test_taylor_vectorised():
+    """
+    Test that an array of expansion points matches evaluating each point separately.
+    """
+    points = np.linspace(0.1, 0.9, 6).reshape(2, 3)
+    d = taylor_derivatives(lambda x: np.exp(np.sin(x)) / (1 + x**2), points, 4)
+    assert d.shape == (2, 3, 5)
+    for index in np.ndindex(points.shape):
+        single = taylor_derivatives(lambda x: np.exp(np.sin(x)) / (1 + x**2), points[index], 4)
+        assert np.allclose(d[index], single)
+
+def test_taylor_custom_function():
+    """
+    Test the chain rule for functions added to the tools module.
+    """
+    add_function('cbrt', np.cbrt, lambda x: x**(-2 / 3) / 3)
+    try:
+        d = taylor_derivatives(np.cbrt, 8.0, 2)
+        assert np.allclose(d, [2.0, 1 / 12, -2 / 9 / 8**(5 / 3)])
+    finally:
+        remove_function('cbrt')
+
+def test_taylor_errors():
+    """
+    Test division by zero and invalid powers.
+    """
+    x = Taylor.variable(0.0, degree=2)
+    with pytest.raises(ZeroDivisionError):
+        1 / x
+    with pytest.raises(ValueError):
+        x ** Taylor.variable(1.0, degree=2)
+    with pytest.raises(ValueError):
+        (-2) ** x
@@ -1,7 +1,8 @@
 # test_tools.py
 import pytest
 import numpy as np
-from dual_autodiff.tools import add_function, get_functions, remove_function
+from dual_autodiff.tools import add_function, get_functions, remove_function, get_implementation, registry_version, get_second_derivative
+from dual_autodiff import Dual, hessian
 
 def test_get_functions():
     """
@@ -153,3 +154,46 @@ def test_copy_independence():
     
     # Original should not be modified
     assert 'test' not in original
+
+def test_dispatch_follows_registry():
+    """
+    Test that ufunc lookups see functions added, replaced and removed after the first lookup.
+    """
+    f, fprime = get_implementation(np.sin)
+    assert f is np.sin and fprime(0.0) == 1.0
+    assert get_implementation(np.cbrt) is None
+
+    version = registry_version()
+    original = get_functions()['sin'] + (get_second_derivative('sin'),)
+    add_function('cbrt', np.cbrt, lambda x: x**(-2 / 3) / 3)
+    add_function('sin', np.sin, lambda x: 2.0)
+    try:
+        assert registry_version() > version
+        assert get_implementation(np.cbrt) is not None
+        assert np.cbrt(Dual(8.0, {'x': 1.0})).dual['x'] == pytest.approx(1 / 12)
+        assert np.sin(Dual(0.0, {'x': 1.0})).dual['x'] == 2.0
+    finally:
+        add_function('sin', *original)
+        remove_function('cbrt')
+    assert get_implementation(np.cbrt) is None
+    assert np.sin(Dual(0.0, {'x': 1.0})).dual['x'] == 1.0
+
+def test_reregistering_drops_stale_second_derivative():
+    """
+    Test that re-registering a function without a second derivative drops the stored one, unless
+    the same function and derivative are registered again.
+    """
+    add_function('cbrt', lambda x: x**3, lambda x: 3 * x**2, lambda x: 6 * x)
+    try:
+        assert hessian(lambda p: np.cbrt(p[0]), np.array([2.0]))[0, 0] == pytest.approx(12.0)
+        add_function('cbrt', lambda x: x**4, lambda x: 4 * x**3)
+        assert get_second_derivative('cbrt') is None
+        with pytest.raises(ValueError):
+            hessian(lambda p: np.cbrt(p[0]), np.array([2.0]))
+    finally:
+        remove_function('cbrt')
+
+    func, derivative = get_functions()['sin']
+    second = get_second_derivative('sin')
+    add_function('sin', func, derivative)
+    assert get_second_derivative('sin') is second
@@ -0,0 +1,70 @@
+# test_variables.py
+import pytest
+import numpy as np
+from dual_autodiff import Dual, VariableSpace, DenseDual
+
+def test_variable_space():
+    """
+    Test that variable names are interned to stable slots.
+    """
+    space = VariableSpace(['x', 'y'])
+    assert space.slot('x') == 0
+    assert space.slot('y') == 1
+    assert space.slot('z') == 2
+    assert space.slot('x') == 0
+    assert len(space) == 3
+    assert 'z' in space
+    assert list(space) == ['x', 'y', 'z']
+
+    with pytest.raises(TypeError):
+        space.slot(1)
+
+def test_dense_dual_initialization():
+    """
+    Test construction of dense dual numbers from a variable space.
+    """
+    space = VariableSpace()
+    x = space.variable('x', 2.0)
+    assert x.real == 2.0
+    assert x.dual == {'x': 1.0}
+
+    d = space.dual(3.0, {'y': 2.0, 'x': 1.0})
+    assert np.array_equal(d.tangent, [1.0, 2.0])
+
+    with pytest.raises(TypeError):
+        DenseDual(1.0, [1.0], {'x': 0})
+    with pytest.raises(ValueError):
+        DenseDual(1.0, [1.0, 2.0, 3.0], space)
+
+def test_dense_dual_matches_dual():
+    """
+    Test that dense dual numbers give the same derivatives as dictionary-based Dual numbers.
+    """
+    def fmv(x, y):
+        return y**2 * np.sinh(3 * x + 2) + 2 * y + x / y - 2 ** x
+
+    space = VariableSpace(['x', 'y'])
+    dense = fmv(space.variable('x', 0.5), space.variable('y', 1.5))
+    expected = fmv(Dual(0.5, {'x': 1.0, 'y': 0.0}), Dual(1.5, {'x': 0.0, 'y': 1.0}))
+
+    assert pytest.approx(dense.real) == expected.real
+    assert pytest.approx(dense.dual['x']) == expected.dual['x']
+    assert pytest.approx(dense.dual['y']) == expected.dual['y']
+
+    with pytest.raises(ZeroDivisionError):
+        dense / space.dual(0.0, {'x': 1.0})
+    with pytest.raises(ValueError):
+        space.dual(-1.0, {}) ** dense
+
+def test_dense_dual_growing_space():
+    """
+    Test that dual numbers created before new variables were registered still combine.
+    """
+    space = VariableSpace()
+    x = space.variable('x', 2.0)
+    y = space.variable('y', 3.0)
+    result = x * y
+    assert result.dual == {'x': 3.0, 'y': 2.0}
+
+    with pytest.raises(ValueError):
+        x + VariableSpace().variable('x', 1.0)